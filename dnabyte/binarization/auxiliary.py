@@ -0,0 +1,118 @@
+"""
+Vectorized conversion between bytes, bit arrays and '0'/'1' bitstrings.
+
+All binarizers, codecs and data classes convert through these helpers instead of
+per-byte ``format(byte, '08b')`` / ``int(bits, 2)`` loops. Bits are ordered most
+significant bit first, i.e. b'\\xb2' corresponds to '10110010'.
+"""
+import numpy as np
+
+_ZERO = ord('0')
+
+
+def bytes_to_bits(data, count=None):
+    """
+    Unpack bytes into one np.uint8 entry (0 or 1) per bit.
+
+    :param data: Bytes-like object or np.uint8 array.
+    :param count: Optional number of bits to return (defaults to 8 * len(data)).
+    :return: np.ndarray of 0/1 values.
+    """
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=count)
+
+
+def bits_to_bytes(bits):
+    """
+    Pack an array of 0/1 values into bytes. A trailing partial byte is padded with zeros.
+
+    :param bits: Array-like of 0/1 values.
+    :return: bytes object of length ceil(len(bits) / 8).
+    """
+    return np.packbits(np.asarray(bits, dtype=np.uint8)).tobytes()
+
+
+def bits_to_bitstring(bits):
+    """
+    Convert an array of 0/1 values to a '0'/'1' string.
+
+    :param bits: np.uint8 array of 0/1 values.
+    :return: Bitstring.
+    """
+    return (np.asarray(bits, dtype=np.uint8) | _ZERO).tobytes().decode('ascii')
+
+
+def bitstring_to_bits(bitstring):
+    """
+    Convert a '0'/'1' string to an array of 0/1 values.
+
+    :param bitstring: String of '0' and '1' characters.
+    :return: np.uint8 array of 0/1 values.
+    :raises ValueError: If the string contains other characters.
+    """
+    try:
+        chars = np.frombuffer(bitstring.encode('ascii'), dtype=np.uint8)
+    except UnicodeEncodeError:
+        chars = None
+
+    if chars is None:
+        invalid_chars = set(bitstring) - {'0', '1'}
+    else:
+        bits = chars - _ZERO
+        invalid = bits > 1
+        invalid_chars = set(chars[invalid].tobytes().decode('ascii')) if invalid.any() else set()
+    if invalid_chars:
+        raise ValueError(
+            f"Bitstream contains invalid characters: {invalid_chars}. "
+            f"Only '0' and '1' are allowed."
+        )
+    return bits
+
+
+def bytes_to_bitstring(data):
+    """
+    Convert bytes to a '0'/'1' string, eight characters per byte.
+
+    :param data: Bytes-like object or np.uint8 array.
+    :return: Bitstring of length 8 * len(data).
+    """
+    return bits_to_bitstring(bytes_to_bits(data))
+
+
+def bitstring_to_bytes(bitstring):
+    """
+    Convert a '0'/'1' string to bytes. A trailing partial byte is padded with zeros.
+
+    :param bitstring: String of '0' and '1' characters.
+    :return: bytes object of length ceil(len(bitstring) / 8).
+    :raises ValueError: If the string contains other characters.
+    """
+    return np.packbits(bitstring_to_bits(bitstring)).tobytes()
+
+
+def bitstrings_to_rows(bitstrings):
+    """
+    Pack '0'/'1' strings into the rows of a bit matrix, shorter strings are padded with zeros.
+
+    :param bitstrings: List of bitstrings.
+    :return: Tuple of (np.uint8 array of shape (len(bitstrings), ceil(longest length / 8)),
+        np.int64 array with the length of every bitstring).
+    :raises ValueError: If a string contains other characters than '0' and '1'.
+    """
+    lengths = np.array([len(bitstring) for bitstring in bitstrings], dtype=np.int64)
+    width = int(lengths.max()) if len(lengths) else 0
+    bits = bitstring_to_bits(''.join(bitstring.ljust(width, '0') for bitstring in bitstrings))
+    return np.packbits(bits.reshape(len(bitstrings), width), axis=1), lengths
+
+
+def rows_to_bitstrings(rows, lengths):
+    """
+    Unpack the rows of a bit matrix into '0'/'1' strings (see bitstrings_to_rows).
+
+    :param rows: np.uint8 array of packed rows.
+    :param lengths: Number of bits to take from every row.
+    :return: List of bitstrings.
+    """
+    bits = np.unpackbits(np.asarray(rows, dtype=np.uint8), axis=1)
+    text = bits_to_bitstring(bits.ravel())
+    width = bits.shape[1]
+    return [text[i * width:i * width + length] for i, length in enumerate(np.asarray(lengths).tolist())]
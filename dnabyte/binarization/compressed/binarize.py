@@ -46,21 +46,15 @@ class ArchiveBinarize(Binarize):
         # Validate all files exist before processing
         self._validate_files_exist(data.file_paths)
         
-        archive_path = None
+        archive_name = self._archive_path(data.file_paths)
 
         try:
-            folder_path = os.path.dirname(data.file_paths[0])
-            archive_name = folder_path + '/archive.tar.gz'
-
-            with tarfile.open(archive_name, 'w:gz') as archive:
-                for file_path in data.file_paths:
-                    archive.add(file_path)
+            self._create_archive(archive_name, data.file_paths)
             
             size = os.path.getsize(archive_name)
 
             with open(archive_name, 'rb') as file:
-                binary_data = file.read()
-                binary_sequence = ''.join(format(byte, '08b') for byte in binary_data)
+                archive_bytes = file.read()
 
         except FileNotFoundError as e:
             raise FileNotFoundError(f"File not found: {e}")
@@ -71,8 +65,73 @@ class ArchiveBinarize(Binarize):
 
             
 
-        return binary_sequence, size
+        return archive_bytes, size
     
+    def iter_blocks(self, data, block_size):
+        """
+        Creates the compressed archive and reads it block by block.
+
+        The archive is written to disk first and removed once all blocks have been read,
+        so only one block is held in memory at a time.
+
+        :param data: A Data object containing file paths
+        :param block_size: Number of bytes per block
+        :return: Iterator over tuples of (block_bytes, archive_size)
+        :raises TypeError: If data is not a Data object
+        :raises ValueError: If data contains no file paths
+        :raises FileNotFoundError: If any file cannot be found
+        """
+        if not isinstance(data, Data):
+            raise TypeError(f"Expected Data object, got {type(data).__name__}")
+        
+        if not data.file_paths:
+            raise ValueError("Data object contains no file paths")
+        
+        self._validate_files_exist(data.file_paths)
+
+        return self._read_archive_blocks(data.file_paths, block_size)
+
+    def _read_archive_blocks(self, file_paths, block_size):
+        """
+        Yield consecutive blocks of a freshly created archive of the given files.
+
+        :param file_paths: Files to put into the archive
+        :param block_size: Number of bytes per block
+        :return: Iterator over tuples of (block_bytes, archive_size)
+        """
+        archive_name = self._archive_path(file_paths)
+        try:
+            self._create_archive(archive_name, file_paths)
+            size = os.path.getsize(archive_name)
+
+            with open(archive_name, 'rb') as file:
+                for block in iter(lambda: file.read(block_size), b''):
+                    yield block, size
+        finally:
+            if os.path.exists(archive_name):
+                os.remove(archive_name)
+
+    def _archive_path(self, file_paths):
+        """
+        Path of the temporary archive, placed next to the first input file.
+
+        :param file_paths: Files to put into the archive
+        :return: Path of the archive
+        """
+        folder_path = os.path.dirname(file_paths[0])
+        return folder_path + '/archive.tar.gz'
+
+    def _create_archive(self, archive_name, file_paths):
+        """
+        Write a tar.gz archive containing the given files.
+
+        :param archive_name: Path of the archive to create
+        :param file_paths: Files to put into the archive
+        """
+        with tarfile.open(archive_name, 'w:gz') as archive:
+            for file_path in file_paths:
+                archive.add(file_path)
+
     def _validate_files_exist(self, file_paths):
         """
         Validate that all files exist before processing.
@@ -101,10 +160,9 @@ class ArchiveBinarize(Binarize):
             if not isinstance(data, BinaryCode):
                 raise TypeError(f"Expected BinaryCode object, got {type(data).__name__}")
             
-            if len(data.data) % 8 != 0:
+            if len(data) % 8 != 0:
                 raise ValueError("Binary sequence length must be divisible by 8")
 
-            binary_data = data.data
             self.file_paths = data.file_paths
             job_identifier = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')  
 
@@ -116,8 +174,8 @@ class ArchiveBinarize(Binarize):
             job_folder = os.path.join(output_directory, job_identifier)
             os.makedirs(job_folder, exist_ok=True)
 
-            # Convert binary sequence back to bytes
-            byte_data = bytes(int(binary_data[i:i+8], 2) for i in range(0, len(binary_data), 8))
+            # The packed buffer already holds the archive bytes
+            byte_data = data.to_bytes()
 
             # Create a temporary tar archive file
             temp_archive_path = os.path.join(job_folder, 'temp_archive.tar.gz')
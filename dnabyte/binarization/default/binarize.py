@@ -1,3 +1,4 @@
+import mmap
 import os
 from dnabyte.data_classes.base import Data
 from dnabyte.binarize import Binarize
@@ -39,19 +40,7 @@ class DefaultBinarize(Binarize):
         :raises ValueError: If data contains more than one file or cannot be processed
         :raises FileNotFoundError: If the file cannot be found
         """
-        # Validate input
-        if not isinstance(data, Data):
-            raise TypeError(f"Expected Data object, got {type(data).__name__}")
-        
-        if not data.file_paths:
-            raise ValueError("Data object contains no file paths")
-        
-        # Check that there's exactly one file
-        if len(data.file_paths) != 1:
-            raise ValueError(f"DefaultBinarize can only handle exactly one file, got {len(data.file_paths)} files. "
-                           f"For multiple files, use CompressedBinarize instead.")
-        
-        file_path = data.file_paths[0]
+        file_path = self._validate_single_file(data)
         
         try:
             # Binarize the single file
@@ -66,12 +55,67 @@ class DefaultBinarize(Binarize):
         except Exception as e:
             raise ValueError(f"Error during binarization: {e}")
     
+    def iter_blocks(self, data, block_size):
+        """
+        Reads the single file in the Data object block by block through a memory map.
+
+        Only one block is held in memory at a time, so this works for files of any size.
+
+        :param data: A Data object containing exactly one file path
+        :param block_size: Number of bytes per block
+        :return: Iterator over tuples of (block_bytes, original_file_size)
+        :raises TypeError: If data is not a Data object
+        :raises ValueError: If data does not contain exactly one file
+        """
+        file_path = self._validate_single_file(data)
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        return self._read_blocks(file_path, block_size)
+
+    def _read_blocks(self, file_path, block_size):
+        """
+        Yield consecutive blocks of a file.
+
+        :param file_path: Path to the file
+        :param block_size: Number of bytes per block
+        :return: Iterator over tuples of (block_bytes, original_file_size)
+        """
+        size = os.path.getsize(file_path)
+        if size == 0:
+            return
+        with open(file_path, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for start in range(0, size, block_size):
+                    yield mapped[start:start + block_size], size
+
+    def _validate_single_file(self, data):
+        """
+        Validate that data is a Data object with exactly one file.
+
+        :param data: A Data object
+        :return: The path of the single file
+        :raises TypeError: If data is not a Data object
+        :raises ValueError: If data does not contain exactly one file
+        """
+        if not isinstance(data, Data):
+            raise TypeError(f"Expected Data object, got {type(data).__name__}")
+        
+        if not data.file_paths:
+            raise ValueError("Data object contains no file paths")
+        
+        # Check that there's exactly one file
+        if len(data.file_paths) != 1:
+            raise ValueError(f"DefaultBinarize can only handle exactly one file, got {len(data.file_paths)} files. "
+                           f"For multiple files, use CompressedBinarize instead.")
+        
+        return data.file_paths[0]
+
     def _binarize_single_file(self, file_path):
         """
         Binarize a single file by reading its raw bytes.
         
         :param file_path: Path to the file to binarize
-        :return: Tuple of (binary_string, original_file_size)
+        :return: Tuple of (file_bytes, original_file_size)
         :raises FileNotFoundError: If file cannot be found
         """
         if not os.path.exists(file_path):
@@ -81,14 +125,11 @@ class DefaultBinarize(Binarize):
             # Get original file size
             size = os.path.getsize(file_path)
             
-            # Read file as binary data
+            # Read file as binary data; BinaryCode keeps the bytes packed
             with open(file_path, 'rb') as file:
                 file_data = file.read()
             
-            # Convert each byte to 8-bit binary and join them
-            binary_sequence = ''.join(format(byte, '08b') for byte in file_data)
-            
-            return binary_sequence, size
+            return file_data, size
             
         except PermissionError:
             raise ValueError(f"Permission denied reading file: {file_path}")
@@ -108,7 +149,7 @@ class DefaultBinarize(Binarize):
             if not isinstance(data, BinaryCode):
                 raise TypeError(f"Expected BinaryCode object, got {type(data).__name__}")
             
-            if len(data.data) % 8 != 0:
+            if len(data) % 8 != 0:
                 raise ValueError("Binary sequence length must be divisible by 8 for file restoration")
             
             # Determine output file path
@@ -120,8 +161,8 @@ class DefaultBinarize(Binarize):
             if output_dir and not os.path.exists(output_dir):
                 os.makedirs(output_dir)
             
-            # Convert binary sequence back to bytes
-            byte_data = self._binary_to_bytes(data.data)
+            # The packed buffer already holds the original bytes
+            byte_data = data.to_bytes()
             
             # Write bytes to file
             with open(output_file_path, 'wb') as file:
@@ -138,30 +179,6 @@ class DefaultBinarize(Binarize):
             print(f"Restoration failed: {e}")
             return False
     
-    def _binary_to_bytes(self, binary_sequence):
-        """
-        Convert binary sequence back to bytes.
-        
-        :param binary_sequence: Binary string to convert
-        :return: Bytes object
-        :raises ValueError: If binary cannot be converted to valid bytes
-        """
-        try:
-            byte_array = bytearray()
-            for i in range(0, len(binary_sequence), 8):
-                byte = binary_sequence[i:i+8]
-                if len(byte) == 8:
-                    byte_array.append(int(byte, 2))
-                else:
-                    raise ValueError(f"Incomplete byte at position {i}: {byte}")
-            
-            return bytes(byte_array)
-            
-        except ValueError as e:
-            raise ValueError(f"Error converting binary to bytes: {e}")
-        except Exception as e:
-            raise ValueError(f"Unexpected error during binary conversion: {e}")
-    
     def _get_default_output_path(self, original_paths):
         """
         Generate default output file path for restoration.
@@ -2,6 +2,7 @@ import os
 from dnabyte.data_classes.base import Data
 from dnabyte.data_classes.binarycode import BinaryCode
 from dnabyte.binarize import Binarize
+from dnabyte.binarization.auxiliary import bytes_to_bitstring, bitstring_to_bytes
 
 def attributes(params):
     if 'file_paths' not in params.__dict__ or params.file_paths is None:
@@ -125,8 +126,7 @@ class TextBinarize(Binarize):
             with open(file_path, 'r', encoding=self.text_encoding) as file:
                 text_data = file.read()
                 
-            # Convert each character to 8-bit binary
-            binary_sequence = ''.join(format(ord(char), '08b') for char in text_data)
+            binary_sequence = self._text_to_binary(text_data)
 
             return binary_sequence, size
 
@@ -139,6 +139,54 @@ class TextBinarize(Binarize):
         except Exception as e:
             raise ValueError(f"Error reading file '{file_path}': {e}")
 
+    def iter_blocks(self, data, block_size):
+        """
+        Reads the single text file block by block.
+
+        :param data: A Data object containing exactly one file path
+        :param block_size: Number of characters per block
+        :return: Iterator over tuples of (binary_string, original_file_size)
+        :raises TypeError: If data is not a Data object
+        :raises ValueError: If data contains more than one file or the file is not a text file
+        """
+        if not isinstance(data, Data):
+            raise TypeError(f"Expected Data object, got {type(data).__name__}")
+        
+        if len(data.file_paths) != 1:
+            raise ValueError(f"TextBinarize can only handle exactly one file, got {len(data.file_paths)} files. If you want to binarize multiple files, use an archive format (e.g. CompressedBinarize) instead.")
+        
+        file_path = data.file_paths[0]
+        self._validate_text_file(file_path)
+
+        return self._read_text_blocks(file_path, block_size)
+
+    def _read_text_blocks(self, file_path, block_size):
+        """
+        Yield the binary representation of consecutive blocks of a text file.
+
+        :param file_path: Path to the text file
+        :param block_size: Number of characters per block
+        :return: Iterator over tuples of (binary_string, original_file_size)
+        """
+        size = os.path.getsize(file_path)
+        with open(file_path, 'r', encoding=self.text_encoding) as file:
+            for text_data in iter(lambda: file.read(block_size), ''):
+                yield self._text_to_binary(text_data), size
+
+    def _text_to_binary(self, text_data):
+        """
+        Convert text to its binary representation.
+
+        :param text_data: Text to convert
+        :return: Binary string
+        """
+        try:
+            # Characters below 256 map to exactly one byte each
+            return bytes_to_bitstring(text_data.encode('latin-1'))
+        except UnicodeEncodeError:
+            # Convert each character to its binary code point
+            return ''.join(format(ord(char), '08b') for char in text_data)
+
     def debinarize(self, binary_data, output_file_path=None):
         """
         Restores the original text file from the binary data.
@@ -191,22 +239,13 @@ class TextBinarize(Binarize):
         :return: Restored text string
         :raises ValueError: If binary cannot be converted to valid text
         """
+        if len(binary_sequence) % 8 != 0:
+            i = len(binary_sequence) - len(binary_sequence) % 8
+            raise ValueError(f"Incomplete byte at position {i}: {binary_sequence[i:]}")
+
         try:
-            chars = []
-            for i in range(0, len(binary_sequence), 8):
-                byte = binary_sequence[i:i+8]
-                if len(byte) == 8:  # Ensure complete byte
-                    char_code = int(byte, 2)
-                    chars.append(chr(char_code))
-                else:
-                    raise ValueError(f"Incomplete byte at position {i}: {byte}")
-            
-            return ''.join(chars)
-            
-        except ValueError as e:
-            if "chr()" in str(e):
-                raise ValueError(f"Invalid character code in binary data: {e}")
-            raise
+            # Every byte is one character code
+            return bitstring_to_bytes(binary_sequence).decode('latin-1')
         except Exception as e:
             raise ValueError(f"Error converting binary to text: {e}")
     
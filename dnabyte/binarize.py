@@ -10,8 +10,13 @@ class Binarize:
         binarize_plugins: A dictionary mapping binarization method names to their corresponding classes.
     Methods:
         binarize(data): Binarizes the given data using the specified method.
+        binarize_blocks(data, block_size=None): Binarizes the given data block by block with bounded memory.
         debinarize(data, output_file_path=None): Debinarizes the given binary data using the specified method.  
     """
+
+    # Default block size in bytes for binarize_blocks
+    DEFAULT_BLOCK_SIZE = Data.MAX_FILE_SIZE
+
     def __init__(self, params):
         self.params = params
         self.name = params.binarization_method
@@ -40,6 +45,49 @@ class Binarize:
             except KeyError:
                 raise ValueError(f"Binarization method '{self.name}' not recognized.")
             
+    def binarize_blocks(self, data, block_size=None):
+        """
+        Binarizes the given data in fixed-size blocks instead of all at once.
+
+        The file content is read block by block, so files far beyond Data.MAX_FILE_SIZE
+        (create the Data object with streaming=True) can be binarized with bounded memory.
+        Encoders that accept block input (e.g. max_density) consume the blocks incrementally.
+
+        :param data: A Data object.
+        :param block_size: Number of input bytes per block. Defaults to the
+            binarization_block_size parameter or DEFAULT_BLOCK_SIZE.
+        :return: Iterator over BinaryCode blocks; all but the last have block_size * 8 bits.
+        :raises TypeError: If data is not a Data object.
+        :raises ValueError: If the binarization method does not support block-wise binarization.
+        """
+        if self.name == None:
+            raise ValueError("No binarization method specified.")
+        elif isinstance(data, Data) == False:
+            raise TypeError(f"Expected Data object, got {type(data).__name__}")
+
+        if block_size is None:
+            block_size = getattr(self.params, 'binarization_block_size', None) or self.DEFAULT_BLOCK_SIZE
+        if block_size <= 0:
+            raise ValueError(f"block_size must be positive, got {block_size}")
+
+        try:
+            binarization_class = self.binarize_plugins[self.name]
+        except KeyError:
+            raise ValueError(f"Binarization method '{self.name}' not recognized.")
+        plugin = binarization_class(self.params)  # Instantiate the plugin class
+
+        if not hasattr(plugin, 'iter_blocks'):
+            raise ValueError(f"Binarization method '{self.name}' does not support block-wise binarization.")
+
+        # Validate the input before the first block is requested
+        blocks = plugin.iter_blocks(data, block_size)
+        return self._wrap_blocks(blocks, data.file_paths)
+
+    def _wrap_blocks(self, blocks, file_paths):
+        """Turn the raw blocks of a plugin into BinaryCode objects."""
+        for block, size in blocks:
+            yield BinaryCode(data=block, file_paths=file_paths, size=size)
+
     def debinarize(self, data, output_directory=None):
         if self.name == None:
             raise ValueError("No binarization method specified.")
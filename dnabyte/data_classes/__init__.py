@@ -6,10 +6,12 @@ from .base import Data
 from .binarycode import BinaryCode
 from .nucleobasecode import NucleobaseCode
 from .insilicodna import InSilicoDNA
+from .dnapool import DNAPool
 
 __all__ = [
     "Data",
     "BinaryCode",
     "NucleobaseCode", 
     "InSilicoDNA",
+    "DNAPool",
 ]
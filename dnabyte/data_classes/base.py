@@ -8,17 +8,23 @@ class Data:
      - with a list of absolute paths to files or, alternatively
      - with a path to a folder using the alternative constructor from_folder.
 
+    Files are limited to MAX_FILE_SIZE, since binarization holds the whole file in memory.
+    Larger files can be used with streaming=True; they must then be binarized block by
+    block with Binarize.binarize_blocks.
+
     :param file_paths: A list of absolute paths to files.    
+    :param streaming: If True, the file size limit is not enforced.
     """
     
     # Class constant for maximum file size (1MB in bytes)
     MAX_FILE_SIZE = 1024 * 1024  # 1MB
     
-    def __init__(self, file_paths):
+    def __init__(self, file_paths, streaming=False):
         """
         Initialize Data object with file paths.
         
         :param file_paths: List of absolute paths to files
+        :param streaming: If True, skip the file size limit (for block-wise binarization)
         :raises TypeError: If file_paths is not a list
         :raises ValueError: If file_paths is empty, contains invalid paths, or files exceed size limit
         """
@@ -39,20 +45,23 @@ class Data:
             
             # Check file size
             file_size = os.path.getsize(file_path)
-            if file_size > self.MAX_FILE_SIZE:
+            if not streaming and file_size > self.MAX_FILE_SIZE:
                 raise ValueError(f"File {file_path} exceeds maximum size limit of "
                                f"{self.MAX_FILE_SIZE / (1024*1024):.1f}MB. "
-                               f"File size: {file_size / (1024*1024):.2f}MB")
+                               f"File size: {file_size / (1024*1024):.2f}MB. "
+                               f"Use streaming=True to binarize it block by block.")
         
         self.file_paths = file_paths
+        self.streaming = streaming
         self.size = self.calculate_total_bytes()
 
     @classmethod
-    def from_folder(cls, folder_path):
+    def from_folder(cls, folder_path, streaming=False):
         """
         Create Data object from all files in a folder.
         
         :param folder_path: Path to directory containing files
+        :param streaming: If True, skip the file size limit (for block-wise binarization)
         :return: Data object with all files in the folder
         :raises TypeError: If folder_path is not a string
         :raises ValueError: If folder path doesn't exist or contains no files
@@ -71,7 +80,7 @@ class Data:
         if not file_paths:
             raise ValueError(f"No files found in directory {folder_path}")
         
-        return cls(file_paths)
+        return cls(file_paths, streaming=streaming)
 
     def calculate_total_bytes(self):
         """
@@ -1,91 +1,183 @@
 import random
+
+import numpy as np
+
 from .base import Data
+from dnabyte.binarization.auxiliary import bytes_to_bits, bits_to_bitstring, bitstring_to_bits
 
 class BinaryCode(Data):
     """
-    Represents binary data as a sequence of '0' and '1' characters.
-    
-    BinaryCode stores and manipulates binary data streams created from file 
-    binarization processes. It provides validation, indexing, and iteration 
-    capabilities for working with binary representations of original data.
-    
-    Extends the Data base class to maintain compatibility with the DNAbyte 
+    Represents binary data as a packed bit buffer.
+
+    BinaryCode stores and manipulates binary data streams created from file
+    binarization processes. The bits are held in a ``np.uint8`` buffer (eight
+    bits per byte, most significant bit first) together with the number of valid
+    bits, so a file of n bytes occupies n bytes instead of an 8n character string.
+    A '0'/'1' string view is available through ``bitstring`` (and ``data``, for
+    backward compatibility); it is built lazily on first access.
+
+    Extends the Data base class to maintain compatibility with the DNAbyte
     pipeline while providing binary-specific functionality.
 
     Can be created either:
-        - from file data using a Binarize method, or
-        - directly by providing a binary string.
+        - from file data using a Binarize method,
+        - directly by providing a binary string, or
+        - from a packed byte buffer (bytes, bytearray or np.uint8 array).
 
-    :param bitstream: A string of binary data (only '0' and '1' characters).
+    :param data: A string of binary data (only '0' and '1' characters) or a packed byte buffer.
     :param file_paths: Optional list of original file paths (for inheritance compatibility).
     :param size: Optional original file size in bytes.
-    :raises TypeError: If bitstream is not a string.
-    :raises ValueError: If bitstream is empty or contains non-binary characters.
-    
+    :param length: Optional number of valid bits in a packed buffer (defaults to all bits).
+    :raises TypeError: If data is neither a string nor a byte buffer.
+    :raises ValueError: If data is empty or contains non-binary characters.
+
     Example:
         >>> binary = BinaryCode("10110010", file_paths=["/path/to/file.txt"])
         >>> print(len(binary))  # 8
         >>> print(binary[0])    # '1'
+        >>> BinaryCode(b'\\xb2').bitstring
+        '10110010'
     """
 
-    def __init__(self, data, file_paths=None, size=None):
+    def __init__(self, data, file_paths=None, size=None, length=None):
         """
-        Creates a BinaryCode object from a bitstream.
+        Creates a BinaryCode object from a bitstream or a packed byte buffer.
 
-        :param data: A string of binary data.
+        :param data: A string of binary data or a packed byte buffer.
         :param file_paths: Optional list of original file paths.
         :param size: Optional original file size in bytes.
+        :param length: Optional number of valid bits in a packed buffer.
         """
-        
-        # Validate the bitstream before setting any attributes
-        self._validate_bitstream(data)
 
-        # Set binary-specific attributes
-        self.data = data
-        self.length = len(data)
+        # Validate the bitstream before setting any attributes
+        self.buffer, self.length = self._validate_bitstream(data, length)
+        self._bitstring = None
 
         # Handle inheritance - set attributes for parent class compatibility
         self.file_paths = file_paths or []
         self.size = size  # Keep track of original file size
 
-    def _validate_bitstream(self, data):
+    @classmethod
+    def from_bytes(cls, data, length=None, file_paths=None, size=None):
+        """
+        Creates a BinaryCode object from raw bytes without an intermediate bitstring.
+
+        :param data: Bytes-like object holding the packed bits.
+        :param length: Number of valid bits (defaults to 8 * len(data)).
+        :param file_paths: Optional list of original file paths.
+        :param size: Optional original file size in bytes.
+        :return: BinaryCode object.
         """
-        Validates that the input is a proper bitstream.
+        return cls(data, file_paths=file_paths, size=size, length=length)
 
-        :param bitstream: The data to validate
-        :raises TypeError: If bitstream is not a string
-        :raises ValueError: If bitstream is empty or contains invalid characters
+    @staticmethod
+    def _validate_bitstream(data, length=None):
         """
-        # Check if data is a string
-        if not isinstance(data, str):
+        Validates that the input is a proper bitstream and packs it.
+
+        :param data: The data to validate
+        :param length: Number of valid bits for packed input
+        :return: Tuple of (packed np.uint8 buffer, number of bits)
+        :raises TypeError: If data is neither a string nor a byte buffer
+        :raises ValueError: If data is empty or contains invalid characters
+        """
+        if isinstance(data, str):
+            # Check if data is empty
+            if len(data) == 0:
+                raise ValueError("Bitstream cannot be empty")
+
+            # Check if all characters are either '0' or '1'
+            bits = bitstring_to_bits(data)
+            return np.packbits(bits), len(data)
+
+        if isinstance(data, np.ndarray):
+            if data.dtype != np.uint8:
+                raise TypeError(f"Packed bitstream must have dtype uint8, got {data.dtype}")
+            buffer = np.ascontiguousarray(data).ravel()
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            buffer = np.frombuffer(data, dtype=np.uint8)
+        else:
             raise TypeError(
-                f"Bitstream must be a string, got {type(data).__name__}"
+                f"Bitstream must be a string or a packed byte buffer, got {type(data).__name__}"
             )
 
-        # Check if data is empty
-        if len(data) == 0:
+        if length is None:
+            length = 8 * len(buffer)
+        if length == 0:
             raise ValueError("Bitstream cannot be empty")
+        if not 0 < length <= 8 * len(buffer):
+            raise ValueError(f"Bit length {length} does not fit into a buffer of {len(buffer)} bytes")
 
-        # Check if all characters are either '0' or '1'
-        invalid_chars = set(char for char in data if char not in "01")
-        if invalid_chars:
-            raise ValueError(
-                f"Bitstream contains invalid characters: {invalid_chars}. "
-                f"Only '0' and '1' are allowed."
-            )
+        # Keep only the bytes that hold valid bits and clear the padding bits,
+        # so that byte-wise comparisons of two buffers are exact
+        buffer = buffer[:(length + 7) // 8].copy()
+        if length % 8:
+            buffer[-1] &= (0xFF << (8 - length % 8)) & 0xFF
+        return buffer, length
+
+    @property
+    def bitstring(self):
+        """
+        The data as a string of '0' and '1' characters.
+
+        The string is built on first access and cached afterwards.
+        """
+        if self._bitstring is None:
+            self._bitstring = bits_to_bitstring(self.to_bits())
+        return self._bitstring
+
+    @property
+    def data(self):
+        """Backward compatible alias of ``bitstring``."""
+        return self.bitstring
+
+    @data.setter
+    def data(self, value):
+        self.buffer, self.length = self._validate_bitstream(value)
+        self._bitstring = None
+
+    def to_bits(self):
+        """
+        Unpack the buffer to one np.uint8 entry (0 or 1) per bit.
+
+        :return: np.ndarray of length ``self.length``
+        """
+        return bytes_to_bits(self.buffer, count=self.length)
+
+    def to_bytes(self):
+        """
+        Return the packed buffer as bytes. Padding bits of a trailing partial byte are zero.
+
+        :return: bytes object of length ceil(length / 8)
+        """
+        return self.buffer.tobytes()
+
+    @staticmethod
+    def _as_packed(value):
+        """Return (packed buffer, number of bits) for a BinaryCode or a bitstring."""
+        if isinstance(value, BinaryCode):
+            return value.buffer, value.length
+        if isinstance(value, str) and len(value) == 0:
+            return np.zeros(0, dtype=np.uint8), 0
+        return BinaryCode._validate_bitstream(value)
 
     def compare_binary_strings(self, bin_str1, bin_str2):
         """
         Helper function for compare(). Compare two binary strings and return the indices of the differing bits.
+
+        Accepts bitstrings as well as BinaryCode objects. The comparison is done on the
+        packed buffers with a byte-wise XOR.
         """
-        differences = []
-        min_length = min(len(bin_str1), len(bin_str2))
-        
-        for i in range(min_length):
-            if bin_str1[i] != bin_str2[i]:
-                differences.append(i)
-        
-        return differences
+        buffer1, length1 = self._as_packed(bin_str1)
+        buffer2, length2 = self._as_packed(bin_str2)
+        min_length = min(length1, length2)
+        if min_length == 0:
+            return []
+
+        n_bytes = (min_length + 7) // 8
+        differences = np.unpackbits(buffer1[:n_bytes] ^ buffer2[:n_bytes], count=min_length)
+
+        return np.flatnonzero(differences).tolist()
 
 
     def compare(self, data_dec, data_bin, logger=None):
@@ -99,11 +191,11 @@ class BinaryCode(Data):
         Returns:
             str: A message indicating whether the data was successfully decoded or not.
         """
-        res = self.compare_binary_strings(data_dec.data, data_bin.data)
+        res = self.compare_binary_strings(data_dec, data_bin)
 
-        if res == [] and len(data_dec.data) == len(data_bin.data):
+        if res == [] and len(data_dec) == len(data_bin):
             return 'SUCCESS', res
-        elif len(data_dec.data) <= len(data_bin.data):
+        elif len(data_dec) <= len(data_bin):
             return 'ERROR_short', res
         else:
             return 'ERROR_long', res
@@ -115,15 +207,18 @@ class BinaryCode(Data):
         :param n: Length of the binary string to generate.
         :return: BinaryCode object with random binary data.
         """
-        bitstream = ''.join(random.choice('01') for _ in range(n))
-        return BinaryCode(bitstream)
+        if n <= 0:
+            raise ValueError("Bitstream cannot be empty")
+        padding = -n % 8
+        packed = (random.getrandbits(n) << padding).to_bytes((n + padding) // 8, 'big')
+        return BinaryCode(packed, length=n)
 
     def __str__(self):
         output = f"Type: {type(self).__name__}\n"
         output += f"Length: {self.length} bits\n"
         if self.size is not None:
             output += f"Size: {self.size} bytes\n"
-        output += f"Data: {self.data[0:50]}...\n"
+        output += f"Data: {self[0:50]}...\n"
         return output
 
     def __repr__(self):
@@ -133,21 +228,43 @@ class BinaryCode(Data):
         :return: Unambiguous string representation
         """
         # Truncate data if too long for readable repr
-        if len(self.data) > 20:
-            data_repr = f"{self.data[:20]}..."
+        if self.length > 20:
+            data_repr = f"{self[:20]}..."
         else:
-            data_repr = self.data
+            data_repr = self[:]
 
         return f"BinaryCode(bitstream='{data_repr}', length={self.length})"
 
     def __len__(self):
         """Return the number of bits in the bitstream."""
-        return len(self.data)
+        return self.length
 
     def __getitem__(self, index):
-        """Allow indexing to get individual bits or slices."""
-        return self.data[index]
+        """
+        Allow indexing to get individual bits or slices.
+
+        Contiguous slices are unpacked from the covering bytes of the buffer only.
+        """
+        if self._bitstring is not None:
+            return self._bitstring[index]
+
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step != 1:
+                return self.bitstring[index]
+            if stop <= start:
+                return ''
+            first_byte = start // 8
+            bits = bytes_to_bits(self.buffer[first_byte:(stop + 7) // 8])
+            offset = start - 8 * first_byte
+            return bits_to_bitstring(bits[offset:offset + stop - start])
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("BinaryCode index out of range")
+        return '1' if (self.buffer[index // 8] >> (7 - index % 8)) & 1 else '0'
 
     def __iter__(self):
         """Allow iteration over individual bits."""
-        return iter(self.data)
+        return iter(self.bitstring)
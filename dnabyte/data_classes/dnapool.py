@@ -0,0 +1,303 @@
+import numpy as np
+
+from dnabyte.nucleotides import reverse_complement_symbols
+
+# 2-bit packing scheme for DNA bases (A=00, C=01, G=10, T=11)
+NUCLEOTIDES = 'ACGT'
+INVALID_SYMBOL = 255
+
+_ENCODE_LUT = np.full(256, INVALID_SYMBOL, dtype=np.uint8)
+for _code, _base in enumerate(NUCLEOTIDES.encode('ascii')):
+    _ENCODE_LUT[_base] = _code
+_DECODE_LUT = np.frombuffer(NUCLEOTIDES.encode('ascii'), dtype=np.uint8)
+
+
+def encode_nucleotides(sequence):
+    """
+    Translate a nucleotide string (or ASCII bytes) into one 2-bit symbol per base.
+
+    Characters other than 'A', 'C', 'G' and 'T' are mapped to INVALID_SYMBOL.
+
+    :param sequence: DNA sequence as str or bytes.
+    :return: np.uint8 array of symbols (0-3, or INVALID_SYMBOL).
+    """
+    if isinstance(sequence, str):
+        try:
+            sequence = sequence.encode('ascii')
+        except UnicodeEncodeError:
+            sequence = sequence.encode('ascii', errors='replace')
+    return _ENCODE_LUT[np.frombuffer(sequence, dtype=np.uint8)]
+
+
+def decode_nucleotides(symbols):
+    """
+    Translate an array of 2-bit symbols (0-3) back into a nucleotide string.
+
+    :param symbols: Array-like of symbols.
+    :return: DNA sequence string.
+    """
+    return _DECODE_LUT[np.asarray(symbols, dtype=np.uint8)].tobytes().decode('ascii')
+
+
+def pack_symbols(symbols):
+    """
+    Pack 2-bit symbols four per byte, first symbol in the most significant bits.
+
+    :param symbols: np.uint8 array of symbols (0-3).
+    :return: np.uint8 array of length ceil(len(symbols) / 4).
+    """
+    padding = -len(symbols) % 4
+    if padding:
+        symbols = np.concatenate([symbols, np.zeros(padding, dtype=np.uint8)])
+    quads = symbols.reshape(-1, 4)
+    return (quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]
+
+
+def unpack_symbols(packed, start, stop):
+    """
+    Unpack the symbols at nucleotide positions [start, stop) of a packed buffer.
+
+    Only the bytes covering the requested range are touched.
+
+    :param packed: np.uint8 array produced by pack_symbols.
+    :param start: First nucleotide position.
+    :param stop: Position after the last nucleotide.
+    :return: np.uint8 array of symbols of length stop - start.
+    """
+    first_byte = start // 4
+    chunk = packed[first_byte:(stop + 3) // 4]
+    symbols = np.empty((len(chunk), 4), dtype=np.uint8)
+    symbols[:, 0] = chunk >> 6
+    symbols[:, 1] = (chunk >> 4) & 3
+    symbols[:, 2] = (chunk >> 2) & 3
+    symbols[:, 3] = chunk & 3
+    offset = start - 4 * first_byte
+    return symbols.ravel()[offset:offset + stop - start]
+
+
+class DNAPool:
+    """
+    Compact pool of DNA sequences stored as a contiguous 2-bit buffer.
+
+    All sequences are concatenated and packed four nucleotides per byte into a single
+    np.uint8 array (``codes``). Sequence boundaries are held in a prefix-sum array
+    (``offsets``) of nucleotide positions, so sequence i spans
+    ``[offsets[i], offsets[i+1])`` and can be decoded in O(1) without touching the
+    rest of the pool. A pool of n sequences of length L occupies about n*L/4 + 8n bytes,
+    compared to roughly n*(L + 50) bytes for a list of Python strings.
+
+    Slicing with a contiguous range (``pool[a:b]``) returns a new DNAPool that shares
+    the packed buffer and a view of the offsets, i.e. no nucleotide data is copied.
+
+    :param sequences: Iterable of DNA sequences (strings of 'A', 'C', 'G', 'T').
+    :param chunk_size: Number of sequences packed per step while building the pool.
+    :raises TypeError: If a sequence is not a string.
+    :raises ValueError: If a sequence contains invalid nucleotides.
+
+    Example:
+        >>> pool = DNAPool(["ACGT", "GGA", "TTTTC"])
+        >>> pool[2]
+        'TTTTC'
+        >>> pool[1:].as_strings()
+        ['GGA', 'TTTTC']
+    """
+
+    def __init__(self, sequences=(), chunk_size=65536):
+        """
+        Creates a DNAPool from a sequence of DNA strings.
+
+        :param sequences: Iterable of DNA sequences.
+        :param chunk_size: Number of sequences packed per step.
+        """
+        packed_chunks = []
+        lengths = []
+        carry = np.zeros(0, dtype=np.uint8)
+        batch = []
+        n_seen = 0
+
+        def flush(batch, carry):
+            symbols = self._encode_batch(batch, n_seen - len(batch))
+            symbols = np.concatenate([carry, symbols])
+            n_full = len(symbols) - len(symbols) % 4
+            packed_chunks.append(pack_symbols(symbols[:n_full]))
+            return symbols[n_full:]
+
+        for sequence in sequences:
+            if not isinstance(sequence, str):
+                raise TypeError(f"DNA sequence at index {n_seen} must be a string, "
+                                f"got {type(sequence).__name__}")
+            batch.append(sequence)
+            lengths.append(len(sequence))
+            n_seen += 1
+            if len(batch) == chunk_size:
+                carry = flush(batch, carry)
+                batch = []
+        if batch or len(carry):
+            carry = flush(batch, carry)
+        if len(carry):
+            packed_chunks.append(pack_symbols(carry))
+
+        self.codes = np.concatenate(packed_chunks) if packed_chunks else np.zeros(0, dtype=np.uint8)
+        self.offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+
+    @staticmethod
+    def _encode_batch(batch, first_index):
+        """
+        Encode and validate a batch of sequences in one vectorized pass.
+
+        :param batch: List of DNA strings.
+        :param first_index: Pool index of the first sequence in the batch (for error messages).
+        :return: np.uint8 array of symbols for the concatenated batch.
+        :raises ValueError: If any sequence contains invalid nucleotides.
+        """
+        symbols = encode_nucleotides(''.join(batch))
+        invalid = symbols == INVALID_SYMBOL
+        if invalid.any():
+            bounds = np.cumsum([len(sequence) for sequence in batch])
+            i = int(np.searchsorted(bounds, np.argmax(invalid), side='right'))
+            invalid_chars = set(batch[i]) - set(NUCLEOTIDES)
+            raise ValueError(f"DNA sequence at index {first_index + i} contains invalid nucleotides: "
+                             f"{invalid_chars}. Only {sorted(NUCLEOTIDES)} are allowed.")
+        return symbols
+
+    @classmethod
+    def from_arrays(cls, codes, offsets):
+        """
+        Creates a DNAPool directly from a packed buffer and an offsets array.
+
+        :param codes: np.uint8 packed 2-bit buffer.
+        :param offsets: Monotonic array of nucleotide positions (length = number of sequences + 1).
+        :return: DNAPool sharing the given arrays.
+        """
+        pool = cls._wrap(np.asarray(codes, dtype=np.uint8), np.asarray(offsets, dtype=np.int64))
+        if len(pool.offsets) == 0 or np.any(np.diff(pool.offsets) < 0):
+            raise ValueError("Offsets must be a non-empty, non-decreasing array")
+        if pool.offsets[-1] > 4 * len(pool.codes):
+            raise ValueError("Offsets exceed the size of the packed buffer")
+        return pool
+
+    @classmethod
+    def _wrap(cls, codes, offsets):
+        """Create a pool around existing arrays without copying or checking them."""
+        pool = cls.__new__(cls)
+        pool.codes = codes
+        pool.offsets = offsets
+        return pool
+
+    @property
+    def lengths(self):
+        """np.ndarray with the length of every sequence."""
+        return np.diff(self.offsets)
+
+    @property
+    def total_length(self):
+        """Total number of nucleotides in the pool."""
+        return int(self.offsets[-1] - self.offsets[0])
+
+    @property
+    def nbytes(self):
+        """Number of bytes held by the packed buffer and the offsets array."""
+        return self.codes.nbytes + self.offsets.nbytes
+
+    def symbols(self, index):
+        """
+        Return the 2-bit symbols (0-3) of one sequence.
+
+        :param index: Sequence index.
+        :return: np.uint8 array of symbols.
+        """
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(f"DNA sequence index {index} out of range (0-{n-1})")
+        return unpack_symbols(self.codes, int(self.offsets[index]), int(self.offsets[index + 1]))
+
+    def as_strings(self):
+        """
+        Decode the pool into a list of DNA strings.
+
+        The covered part of the buffer is decoded in one pass and then split at the offsets.
+
+        :return: List of DNA sequence strings.
+        """
+        start = int(self.offsets[0])
+        text = decode_nucleotides(unpack_symbols(self.codes, start, int(self.offsets[-1])))
+        bounds = (self.offsets - start).tolist()
+        return [text[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+    def take(self, indices):
+        """
+        Gather the sequences at the given indices into a new, compact pool.
+
+        :param indices: Array-like of sequence indices.
+        :return: DNAPool holding copies of the selected sequences.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self.offsets[indices]
+        lengths = self.offsets[indices + 1] - starts
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        # Positions of every selected nucleotide in the source buffer
+        positions = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        symbols = (self.codes[positions >> 2] >> (6 - 2 * (positions & 3)).astype(np.uint8)) & 3
+        return DNAPool._wrap(pack_symbols(symbols.astype(np.uint8)), offsets)
+
+    def reverse_complement(self):
+        """
+        Reverse complement every sequence of the pool.
+
+        The covered part of the buffer is complemented in one pass (XOR with 0b11) and every sequence is reversed
+        within its own bounds.
+
+        :return: DNAPool with the reverse complements, in the same order.
+        """
+        start = int(self.offsets[0])
+        offsets = self.offsets - start
+        symbols = unpack_symbols(self.codes, start, int(self.offsets[-1]))
+        return DNAPool._wrap(pack_symbols(reverse_complement_symbols(symbols, offsets)), offsets)
+
+    def get_nucleotide_counts(self):
+        """
+        Get counts of each nucleotide across all sequences.
+
+        :return: Dictionary with nucleotide counts
+        """
+        symbols = unpack_symbols(self.codes, int(self.offsets[0]), int(self.offsets[-1]))
+        counts = np.bincount(symbols, minlength=4)
+        return {base: int(count) for base, count in zip(NUCLEOTIDES, counts)}
+
+    def __len__(self):
+        """Return the number of DNA sequences."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        """
+        Return a sequence string for an integer index, or a pool for a slice.
+
+        Contiguous slices share the packed buffer with this pool.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                stop = max(start, stop)
+                return DNAPool._wrap(self.codes, self.offsets[start:stop + 1])
+            return self.take(np.arange(start, stop, step))
+        return decode_nucleotides(self.symbols(index))
+
+    def __iter__(self):
+        """Allow iteration over DNA sequences."""
+        for i in range(len(self)):
+            yield self[i]
+
+    def __str__(self):
+        output = f"Type: {type(self).__name__}\n"
+        output += f"Number of sequences: {len(self)}\n"
+        output += f"Total length: {self.total_length} nucleotides\n"
+        output += f"Packed size: {self.nbytes} bytes\n"
+        return output
+
+    def __repr__(self):
+        return f"DNAPool(num_sequences={len(self)}, total_length={self.total_length})"
@@ -1,5 +1,177 @@
 import random
+from itertools import chain, repeat
+
+import numpy as np
+import scipy as sp
+
 from .base import Data
+from .dnapool import DNAPool, encode_nucleotides, INVALID_SYMBOL, NUCLEOTIDES
+
+_ASCII_BASES = np.frombuffer(NUCLEOTIDES.encode('ascii'), dtype=np.uint8)
+
+
+def random_state(seed=None):
+    """
+    Random number source for the channel simulations.
+
+    :param seed: Optional seed. Without a seed, the global np.random state is used, so
+        that np.random.seed keeps controlling the simulation.
+    :return: np.random.RandomState or the np.random module.
+    """
+    return np.random if seed is None else np.random.RandomState(seed)
+
+
+def error_positions(n, rate, rng=np.random):
+    """
+    Draw the positions of independent events that occur with probability rate at each of n positions.
+
+    The gaps between consecutive events are geometrically distributed and drawn in batches,
+    so the cost is proportional to the number of events rather than to n.
+
+    :param n: Number of positions.
+    :param rate: Per-position event probability.
+    :param rng: Random number source (see random_state).
+    :return: np.int64 array of increasing positions in [0, n).
+    """
+    if n == 0 or rate <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if rate >= 1:
+        return np.arange(n, dtype=np.int64)
+
+    batches = []
+    last = -1
+    while last < n:
+        size = int(1.1 * (n - last) * rate) + 16
+        batch = last + np.cumsum(rng.geometric(rate, size=size))
+        batches.append(batch)
+        last = batch[-1]
+    positions = np.concatenate(batches)
+    return positions[:np.searchsorted(positions, n)]
+
+
+def substitute_bases(sequences, rate, rng=np.random, allow_same=True):
+    """
+    Substitute every base independently with probability rate.
+
+    All sequences are handled as one concatenated ASCII buffer: the error positions are drawn
+    with error_positions and the new bases are written with a single fancy-indexing assignment.
+
+    :param sequences: List of DNA sequences.
+    :param rate: Per-base substitution probability.
+    :param rng: Random number source (see random_state).
+    :param allow_same: If True, the new base is drawn from all four bases and may equal the
+        old one, otherwise it is drawn from the three other bases.
+    :return: Tuple of (list of sequences, number of substitutions).
+    """
+    lengths = np.fromiter(map(len, sequences), dtype=np.int64, count=len(sequences))
+    buffer = np.frombuffer(''.join(sequences).encode('ascii'), dtype=np.uint8).copy()
+    positions = error_positions(len(buffer), rate, rng)
+    if len(positions) == 0:
+        return list(sequences), 0
+
+    if allow_same:
+        new_bases = rng.randint(0, 4, size=len(positions))
+    else:
+        current = encode_nucleotides(buffer[positions].tobytes()).astype(np.int64)
+        new_bases = (current + rng.randint(1, 4, size=len(positions))) % 4
+    buffer[positions] = _ASCII_BASES[new_bases]
+
+    text = buffer.tobytes().decode('ascii')
+    bounds = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=bounds[1:])
+    bounds = bounds.tolist()
+    return [text[bounds[i]:bounds[i + 1]] for i in range(len(lengths))], len(positions)
+
+
+def sample_event_counts(length, rates, size, rng=np.random):
+    """
+    Sample per-copy event counts conditioned on at least one event per copy.
+
+    Every event type t occurs independently at each of the length positions with
+    probability rates[t], i.e. Binomial(length, rates[t]) times. The first event type with
+    a non-zero count is drawn first, its count from the binomial truncated at zero, and
+    the counts of the later types without condition.
+
+    :param length: Number of positions per copy.
+    :param rates: Per-position probability of every event type.
+    :param size: Number of copies.
+    :param rng: Random number source (see random_state).
+    :return: np.ndarray of shape (size, len(rates)) with at least one event per row.
+    """
+    rates = np.asarray(rates, dtype=np.float64)
+    no_event = (1 - rates) ** length
+    none_before = np.concatenate([[1.0], np.cumprod(no_event)[:-1]])
+    first = none_before * (1 - no_event)
+    first_type = rng.choice(len(rates), size=size, p=first / first.sum())
+
+    counts = rng.binomial(length, rates, size=(size, len(rates)))
+    counts[np.arange(len(rates)) < first_type[:, None]] = 0
+    u = rng.uniform(no_event[first_type], 1.0)
+    truncated = sp.stats.binom.ppf(u, length, rates[first_type])
+    counts[np.arange(size), first_type] = np.maximum(truncated, 1).astype(np.int64)
+    return counts
+
+
+def mutate_copies(sequences, counts, rates, mutate, rng=np.random, executor=None):
+    """
+    Apply a per-position error channel to a weighted pool without touching every copy.
+
+    For a sequence of length L with c copies, the number of copies hit by at least one event
+    is Binomial(c, 1 - prod((1 - rates) ** L)). Only these copies are passed to mutate,
+    together with their event counts (see sample_event_counts); the remaining copies keep
+    the sequence. Identical results are merged, so copies only split up once they diverge.
+
+    :param sequences: List of distinct DNA sequences.
+    :param counts: Copy number of every sequence.
+    :param rates: Per-position probability of every event type.
+    :param mutate: Callable(sequence, event_counts) returning the mutated sequence.
+    :param rng: Random number source (see random_state).
+    :param executor: Optional callable(mutate, jobs) returning the mutated sequence of every
+        (sequence, event_counts) job, e.g. to mutate the copies in worker processes. The
+        copies are then mutated after all event counts have been drawn.
+    :return: Tuple of (list of sequences, np.ndarray of copy numbers, total number of events).
+    """
+    rates = np.asarray(rates, dtype=np.float64)
+    merged = {}
+    n_events = 0
+    jobs = []
+    for sequence, count in zip(sequences, np.asarray(counts).tolist()):
+        hit = int(rng.binomial(count, 1 - np.prod((1 - rates) ** len(sequence))))
+        if hit < count:
+            merged[sequence] = merged.get(sequence, 0) + count - hit
+        if not hit:
+            continue
+        event_counts = sample_event_counts(len(sequence), rates, hit, rng)
+        n_events += int(event_counts.sum())
+        if executor is not None:
+            jobs.extend((sequence, row) for row in event_counts)
+            continue
+        for row in event_counts:
+            mutated = mutate(sequence, row)
+            merged[mutated] = merged.get(mutated, 0) + 1
+    if jobs:
+        for mutated in executor(mutate, jobs):
+            merged[mutated] = merged.get(mutated, 0) + 1
+    return list(merged), np.fromiter(merged.values(), dtype=np.int64, count=len(merged)), n_events
+
+
+def simulate_channel(plugin, data):
+    """
+    Run a storage, sequencing or error plugin on an InSilicoDNA object.
+
+    Weighted pools are passed as (sequences, counts) to plugins that set supports_counts,
+    all other plugins receive one sequence per copy.
+
+    :param plugin: Plugin instance with simulate (and optionally simulate_counts).
+    :param data: InSilicoDNA object.
+    :return: Tuple of (InSilicoDNA, info dictionary).
+    """
+    if data.is_weighted and getattr(plugin, 'supports_counts', False):
+        sequences, counts, info = plugin.simulate_counts(data.sequences, data.counts)
+        return InSilicoDNA(sequences, counts=counts), info
+    sequences, info = plugin.simulate(data.data)
+    return InSilicoDNA(sequences), info
+
 
 class InSilicoDNA(Data):
     """
@@ -12,32 +184,163 @@ class InSilicoDNA(Data):
     Inherits from Data to maintain compatibility with the DNAbyte pipeline.
 
     It can be instantiated either:
-        - by a synthesis simulator producing the synthesised DNA sequences, or
-        - directly providing the list of DNA sequences as a parameter.
+        - by a synthesis simulator producing the synthesised DNA sequences, 
+        - directly providing the list of DNA sequences as a parameter, or
+        - from a packed DNAPool, e.g. for very large pools of sequenced copies.
+
+    When created from a DNAPool, the sequences stay packed (2 bits per nucleotide) and
+    are only turned into a list of strings when ``data`` is accessed. Once ``data`` has
+    been materialized, the list is the authoritative copy and may be modified in place.
+
+    Simulated pools hold many identical copies of every sequence. With ``counts``, the
+    object stores each distinct sequence once together with its copy number (a weighted
+    pool). Channel plugins that support copy numbers work on ``sequences`` and ``counts``
+    directly; ``data`` expands the pool into one string per copy for all other consumers,
+    after which the object is an ordinary list-backed pool again.
 
-    :param data: List of DNA sequences (strings of nucleotides).
+    :param data: List of DNA sequences (strings of nucleotides) or a DNAPool.
+    :param counts: Optional copy number (>= 1) of every sequence in data.
     :raises TypeError: If data is not a list.
-    :raises ValueError: If data is empty or contains invalid DNA sequences.
+    :raises ValueError: If data is empty or contains invalid DNA sequences, or counts do not match data.
     """
     
-    def __init__(self, data):
+    def __init__(self, data, counts=None):
         """
         Creates a DNA object from DNA sequences.
 
-        :param data: List of DNA sequences (strings).
+        :param data: List of DNA sequences (strings) or a DNAPool.
+        :param counts: Optional copy number of every sequence.
         """
 
-        # Initialize directly from DNA sequences
-        self._validate_dna_data(data)
-        self.data = data
+        if isinstance(data, DNAPool):
+            if len(data) == 0:
+                raise ValueError("DNA data cannot be empty")
+            if np.any(data.lengths == 0):
+                raise ValueError(f"DNA sequence at index {int(np.argmax(data.lengths == 0))} cannot be empty")
+            self._pool = data
+            self._data = None
+        else:
+            # Initialize directly from DNA sequences
+            self._validate_dna_data(data)
+            self._pool = None
+            self._data = data
+        self._counts = None if counts is None else self._validate_counts(counts, len(data))
         self.file_paths = []
         self.size = None
         
         # Calculate metrics
-        self.num_sequences = len(self.data) if self.data else 0
-        self.total_length = sum(len(seq) for seq in self.data) if self.data else 0
+        self._update_metrics()
+
+    @property
+    def data(self):
+        """
+        The DNA sequences as a list of strings.
+
+        For pool-backed objects the list is built on first access, weighted pools are
+        expanded into one entry per copy.
+        """
+        if self._counts is not None:
+            self._data = list(chain.from_iterable(map(repeat, self.sequences, self._counts.tolist())))
+            self._counts = None
+        if self._data is None:
+            self._data = self._pool.as_strings()
+            self._pool = None
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._pool = None
+        self._counts = None
+
+    @property
+    def sequences(self):
+        """
+        The distinct DNA sequences of a weighted pool, or all sequences otherwise.
+
+        Unlike ``data``, this does not expand copy numbers.
+        """
+        if self._data is None:
+            self._data = self._pool.as_strings()
+            self._pool = None
+        return self._data
+
+    @property
+    def counts(self):
+        """Copy number of every entry of ``sequences`` as np.ndarray, or None for unweighted pools."""
+        return self._counts
+
+    @property
+    def is_weighted(self):
+        """True if the sequences are stored with copy numbers."""
+        return self._counts is not None
+
+    def collapse(self):
+        """
+        Merge identical sequences into a weighted pool.
+
+        :return: InSilicoDNA with every distinct sequence once, in order of first occurrence.
+        """
+        counts = self._counts.tolist() if self._counts is not None else repeat(1)
+        merged = {}
+        for sequence, count in zip(self.sequences, counts):
+            merged[sequence] = merged.get(sequence, 0) + count
+        collapsed = InSilicoDNA(list(merged), counts=list(merged.values()))
+        collapsed.file_paths = self.file_paths
+        return collapsed
+
+    def to_pool(self):
+        """
+        Return the sequences as a packed DNAPool.
+
+        Weighted pools are expanded into one entry per copy.
+
+        :return: DNAPool with the current sequences.
+        """
+        pool = self._pool if self._pool is not None else DNAPool(self._data)
+        if self._counts is not None:
+            return pool.take(np.repeat(np.arange(len(pool)), self._counts))
+        return pool
+
+    def _update_metrics(self):
+        """Recompute num_sequences, total_length and average_length."""
+        if self._counts is not None:
+            lengths = np.asarray(self._sequence_lengths(), dtype=np.int64)
+            self.num_sequences = int(self._counts.sum())
+            self.total_length = int(lengths @ self._counts)
+        elif self._pool is not None:
+            self.num_sequences = len(self._pool)
+            self.total_length = self._pool.total_length
+        else:
+            self.num_sequences = len(self._data) if self._data else 0
+            self.total_length = sum(len(seq) for seq in self._data) if self._data else 0
         self.average_length = self.total_length / self.num_sequences if self.num_sequences > 0 else 0
 
+    def _sequence_lengths(self):
+        """Lengths of the stored (distinct) sequences."""
+        if self._data is None:
+            return self._pool.lengths
+        return [len(seq) for seq in self._data]
+
+    @staticmethod
+    def _validate_counts(counts, num_sequences):
+        """
+        Validates copy numbers of a weighted pool.
+
+        :param counts: Array-like of copy numbers
+        :param num_sequences: Number of stored sequences
+        :return: Copy numbers as np.int64 array
+        :raises ValueError: If counts do not match the sequences or are not positive integers
+        """
+        counts = np.asarray(counts)
+        if counts.ndim != 1 or len(counts) != num_sequences:
+            raise ValueError(f"Expected {num_sequences} copy numbers, got {counts.size}")
+        if counts.dtype.kind not in 'iu':
+            raise ValueError(f"Copy numbers must be integers, got {counts.dtype}")
+        if np.any(counts < 1):
+            raise ValueError(f"Copy number at index {int(np.argmax(counts < 1))} must be at least 1")
+        return counts.astype(np.int64)
+
     def _validate_dna_data(self, data):
         """
         Validates that the input is a proper list of DNA sequences.
@@ -54,10 +357,24 @@ class InSilicoDNA(Data):
         if len(data) == 0:
             raise ValueError("DNA data cannot be empty")
         
-        # Check if all elements are valid DNA sequences
-        valid_nucleotides = {'A', 'C', 'G', 'T'}
+        # Check if all elements are valid DNA sequences. Plain string reads are
+        # checked in one vectorized pass over the concatenated pool.
+        if all(type(sequence) is str for sequence in data):
+            lengths = np.fromiter(map(len, data), dtype=np.int64, count=len(data))
+            if np.any(lengths == 0):
+                raise ValueError(f"DNA sequence at index {int(np.argmax(lengths == 0))} cannot be empty")
+            invalid = encode_nucleotides(''.join(data)) == INVALID_SYMBOL
+            if not invalid.any():
+                return
+            first_invalid = int(np.searchsorted(np.cumsum(lengths), np.argmax(invalid), side='right'))
+            data = data[first_invalid:]
+            offset = first_invalid
+        else:
+            offset = 0
+
+        valid_nucleotides = set(NUCLEOTIDES)
         
-        for i, sequence in enumerate(data):
+        for i, sequence in enumerate(data, start=offset):
             if not isinstance(sequence, str) and not (isinstance(sequence, list) and len(sequence) == 2):
                 raise ValueError(f"DNA sequence at index {i} must be a string, "
                                f"got {type(sequence).__name__}")
@@ -115,8 +432,12 @@ class InSilicoDNA(Data):
         :return: The DNA sequence at the specified index
         :raises IndexError: If index is out of range
         """
-        if not 0 <= index < len(self.data):
-            raise IndexError(f"DNA sequence index {index} out of range (0-{len(self.data)-1})")
+        if not 0 <= index < len(self):
+            raise IndexError(f"DNA sequence index {index} out of range (0-{len(self)-1})")
+        if self._counts is not None:
+            return self.sequences[int(np.searchsorted(np.cumsum(self._counts), index, side='right'))]
+        if self._data is None:
+            return self._pool[index]
         return self.data[index]
 
     def add_sequence(self, sequence):
@@ -141,9 +462,7 @@ class InSilicoDNA(Data):
         
         # Add the sequence and update metrics
         self.data.append(sequence)
-        self.num_sequences = len(self.data)
-        self.total_length = sum(len(seq) for seq in self.data)
-        self.average_length = self.total_length / self.num_sequences
+        self._update_metrics()
 
     def remove_sequence(self, index):
         """
@@ -156,9 +475,7 @@ class InSilicoDNA(Data):
             raise IndexError(f"DNA sequence index {index} out of range (0-{len(self.data)-1})")
         
         self.data.pop(index)
-        self.num_sequences = len(self.data)
-        self.total_length = sum(len(seq) for seq in self.data) if self.data else 0
-        self.average_length = self.total_length / self.num_sequences if self.num_sequences > 0 else 0
+        self._update_metrics()
 
     def get_sequence_lengths(self):
         """
@@ -166,6 +483,10 @@ class InSilicoDNA(Data):
         
         :return: List of sequence lengths
         """
+        if self._counts is not None:
+            return np.repeat(self._sequence_lengths(), self._counts).tolist()
+        if self._data is None:
+            return self._pool.lengths.tolist()
         return [len(seq) for seq in self.data]
 
     def get_nucleotide_counts(self):
@@ -174,6 +495,19 @@ class InSilicoDNA(Data):
         
         :return: Dictionary with nucleotide counts
         """
+        if self._counts is not None:
+            symbols = encode_nucleotides(''.join(self.sequences))
+            weights = np.repeat(self._counts, self._sequence_lengths())
+            valid = symbols != INVALID_SYMBOL
+            counts = np.bincount(symbols[valid], weights=weights[valid], minlength=4)
+            return {base: int(count) for base, count in zip(NUCLEOTIDES, counts)}
+        if self._data is None:
+            return self._pool.get_nucleotide_counts()
+        if all(type(sequence) is str for sequence in self.data):
+            symbols = encode_nucleotides(''.join(self.data))
+            counts = np.bincount(symbols[symbols != INVALID_SYMBOL], minlength=4)
+            return {base: int(count) for base, count in zip(NUCLEOTIDES, counts)}
+
         counts = {'A': 0, 'C': 0, 'G': 0, 'T': 0}
         for sequence in self.data:
             for nucleotide in sequence:
@@ -188,7 +522,10 @@ class InSilicoDNA(Data):
         :return: True if valid
         :raises: Various exceptions if invalid
         """
-        self._validate_dna_data(self.data)
+        if self._data is not None:
+            self._validate_dna_data(self._data)
+        if self._counts is not None:
+            self._validate_counts(self._counts, len(self.sequences))
         return True
 
 
@@ -247,11 +584,16 @@ class InSilicoDNA(Data):
                               for nt, count in counts.items())
             output += "\n"
         
-        output += f"DATA: {str(self.data)[:100]}...\n"
+        preview = self._data if self._data is not None else self._pool[:10].as_strings()
+        output += f"DATA: {str(preview)[:100]}...\n"
         return output
 
     def __len__(self):
         """Return the number of DNA sequences."""
+        if self._counts is not None:
+            return self.num_sequences
+        if self._data is None:
+            return len(self._pool)
         return len(self.data)
 
     def __getitem__(self, index):
@@ -260,4 +602,8 @@ class InSilicoDNA(Data):
 
     def __iter__(self):
         """Allow iteration over DNA sequences."""
+        if self._counts is not None:
+            return chain.from_iterable(map(repeat, self.sequences, self._counts.tolist()))
+        if self._data is None:
+            return iter(self._pool)
         return iter(self.data)
@@ -1,20 +1,11 @@
 import random
 from .base import Data
 from dnabyte.library import Library
+from dnabyte.nucleotides import reverse_complement
 
 def complementmap(string):
     """Helper function to get reverse complement of DNA string."""
-    compliment = ''
-    for i in string:
-        if i == 'A':
-            compliment += 'T'
-        elif i == 'T':
-            compliment += 'A'
-        elif i == 'C':
-            compliment += 'G'
-        elif i == 'G':
-            compliment += 'C'
-    return compliment[::-1]
+    return reverse_complement(string)
 
 class NucleobaseCode(Data):
     """
@@ -3,6 +3,8 @@ from dnabyte.data_classes.binarycode import BinaryCode
 from dnabyte.data_classes.insilicodna import InSilicoDNA
 from dnabyte.library import Library
 import importlib
+import itertools
+from collections.abc import Iterator
 
 class Encode:
     """
@@ -31,8 +33,12 @@ class Encode:
         and library structure. The encoding method and library structure determine
         which encoding function is used.
 
+        Encoding methods that set supports_block_input also accept an iterator of BinaryCode
+        blocks (see Binarize.binarize_blocks), which they consume incrementally.
+
         Parameters:
-        data (BinaryCode): The raw data to be encoded. Must be an instance of BinaryCode.
+        data (BinaryCode or iterator): The raw data to be encoded. Must be an instance of BinaryCode,
+            or an iterator of BinaryCode blocks for encoding methods that support block input.
 
         Returns:
         NucleobaseCode: A NucleobaseCode object containing the encoded data.
@@ -42,20 +48,31 @@ class Encode:
         ValueError: If the encoding method or library structure is invalid.
         """
         if isinstance(data, BinaryCode):
-            try:
-                encode_class = self.encoding_plugins[self.encoding_method]
-                plugin = encode_class(self.params, logger=self.logger)
-                print(data.data)
-                encoded_data, info = plugin.encode(data)
-                print(encoded_data)
-                obj = NucleobaseCode(encoded_data)
-                obj.file_paths = data.file_paths
-                return obj, info
-            except KeyError:
-                raise ValueError(f"Encoding method '{self.encoding_method}' not found in plugins.")
+            file_paths = data.file_paths
+        elif isinstance(data, Iterator):
+            # Block input, take the metadata from the first block
+            first_block = next(data, None)
+            if not isinstance(first_block, BinaryCode):
+                raise TypeError("data must be an instance of BinaryCode or an iterator of BinaryCode blocks")
+            file_paths = first_block.file_paths
+            data = itertools.chain([first_block], data)
         else:
             raise TypeError("data must be an instance of BinaryCode")
 
+        try:
+            encode_class = self.encoding_plugins[self.encoding_method]
+        except KeyError:
+            raise ValueError(f"Encoding method '{self.encoding_method}' not found in plugins.")
+
+        if not isinstance(data, BinaryCode) and not getattr(encode_class, 'supports_block_input', False):
+            raise TypeError(f"Encoding method '{self.encoding_method}' does not support block input, "
+                            f"data must be an instance of BinaryCode")
+
+        plugin = encode_class(self.params, logger=self.logger)
+        encoded_data, info = plugin.encode(data)
+        obj = NucleobaseCode(encoded_data)
+        obj.file_paths = file_paths
+        return obj, info
 
     def decode(self, data):
 
@@ -5,6 +5,7 @@ from typing import List, Dict, Tuple
 import scipy as sp
 from pyxdameraulevenshtein import damerau_levenshtein_distance
 import random
+import numpy as np
 from typing import List, Dict, Tuple
 
 from dnabyte.data_classes.base import Data
@@ -12,7 +13,10 @@ from dnabyte.data_classes.binarycode import BinaryCode
 from dnabyte.data_classes.nucleobasecode import NucleobaseCode
 from dnabyte.data_classes.insilicodna import InSilicoDNA
 from dnabyte.library import Library
+from dnabyte.nucleotides import reverse_complement
 from dnabyte.encode import Encode
+from dnabyte.binarization.auxiliary import bytes_to_bitstring as _bytes_to_bitstring, bitstring_to_bits, bits_to_bitstring
+from dnabyte.data_classes.dnapool import INVALID_SYMBOL
 
 
 def create_counter_list(n, m, base10_input):
@@ -31,19 +35,186 @@ def create_counter_list(n, m, base10_input):
 def decimal_to_binary(n): 
     return bin(n).replace("0b", "") 
 
+def iter_bit_blocks(data, block_length):
+    """
+    Cut binary data into consecutive bitstrings of block_length bits. The last block may be shorter.
+
+    Parameters:
+    data (BinaryCode or iterable): A BinaryCode object, or an iterable of BinaryCode blocks or
+        bitstrings (e.g. from Binarize.binarize_blocks) that are consumed one at a time.
+    block_length (int): Number of bits per block.
+
+    Yields:
+    str: Bitstrings of block_length bits.
+    """
+    if isinstance(data, BinaryCode):
+        data = [data]
+
+    carry = ''
+    for chunk in data:
+        position = 0
+        if carry:
+            # complete the block left over from the previous chunk
+            position = min(block_length - len(carry), len(chunk))
+            carry += chunk[0:position]
+            if len(carry) < block_length:
+                continue
+            yield carry
+            carry = ''
+
+        end = position + (len(chunk) - position) // block_length * block_length
+        for i in range(position, end, block_length):
+            yield chunk[i:i + block_length]
+        carry = chunk[end:len(chunk)]
+
+    if carry:
+        yield carry
+
+def create_counter_matrix(n, m, indices):
+    """
+    Vectorized create_counter_list for many inputs at once.
+
+    Parameters:
+    n (int): Number of digits per row.
+    m (int): Base of the digits.
+    indices (array-like): Non-negative integers to convert.
+
+    Returns:
+    np.ndarray: Array of shape (len(indices), n) holding the base-m digits of each index,
+        most significant digit first. Like create_counter_list, digits beyond n are dropped.
+    """
+    remainder = np.array(indices, dtype=np.int64).reshape(-1)
+    digits = np.zeros((len(remainder), n), dtype=np.int64)
+
+    # Fill the columns from the least significant digit until all remainders are zero
+    for column in range(n - 1, -1, -1):
+        if not remainder.any():
+            break
+        digits[:, column] = remainder % m
+        remainder //= m
+
+    return digits
+
+class DNATranscoder:
+    """
+    Batch translation between bitstrings, 2-bit symbols and DNA for a fixed mapping.
+
+    Symbol s (the two bits s >> 1, s & 1) is translated to alphabet[s], e.g. for the
+    alphabet 'AGCT': '00' -> 'A', '01' -> 'G', '10' -> 'C' and '11' -> 'T'. Whole
+    lists of codewords are converted at once through NumPy lookup tables.
+
+    Example:
+        >>> transcoder = DNATranscoder('AGCT')
+        >>> transcoder.bits_to_dna(['0001', '1011'])
+        ['AG', 'CT']
+    """
+
+    def __init__(self, alphabet):
+        if len(alphabet) != 4 or len(set(alphabet)) != 4:
+            raise ValueError(f"The alphabet must consist of four distinct bases, got '{alphabet}'")
+        self.alphabet = alphabet
+        self._symbol_to_base = np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)
+        table = np.full(256, INVALID_SYMBOL, dtype=np.uint8)
+        table[self._symbol_to_base] = np.arange(4, dtype=np.uint8)
+        self._base_to_symbol = table.tobytes()
+
+    def dna_to_symbols(self, sequences):
+        """
+        Translate DNA sequences into one 2-bit symbol per base.
+
+        Parameters:
+        sequences (list): DNA strings.
+
+        Returns:
+        tuple: (np.uint8 array of the symbols of all sequences concatenated, list of sequence lengths)
+
+        Raises:
+        ValueError: If a sequence contains a base that is not in the alphabet.
+        """
+        joined = ''.join(sequences).encode('ascii', errors='replace')
+        symbols = np.frombuffer(joined.translate(self._base_to_symbol), dtype=np.uint8)
+        invalid = symbols == INVALID_SYMBOL
+        if invalid.any():
+            position = int(np.argmax(invalid))
+            raise ValueError(f"Invalid base '{chr(joined[position])}' at position {position}, "
+                             f"only {list(self.alphabet)} are allowed.")
+        return symbols, [len(sequence) for sequence in sequences]
+
+    def symbols_to_dna(self, symbols, lengths=None):
+        """
+        Translate 2-bit symbols into DNA sequences.
+
+        Parameters:
+        symbols (np.ndarray): 2-D array with one codeword per row, or 1-D array of concatenated codewords.
+        lengths (list): Codeword lengths for 1-D input (defaults to a single codeword).
+
+        Returns:
+        list: DNA strings.
+        """
+        symbols = np.asarray(symbols)
+        if symbols.ndim == 2:
+            lengths = [symbols.shape[1]] * symbols.shape[0]
+        elif lengths is None:
+            lengths = [len(symbols)]
+        text = self._symbol_to_base[symbols.reshape(-1)].tobytes().decode('ascii')
+        return _split_at_lengths(text, lengths)
+
+    def bits_to_dna(self, bitstrings):
+        """
+        Translate bitstrings of even length into DNA sequences, two bits per base.
+
+        Parameters:
+        bitstrings (list): Bitstrings.
+
+        Returns:
+        list: DNA strings.
+        """
+        lengths = [len(bitstring) // 2 for bitstring in bitstrings]
+        if any(2 * length != len(bitstring) for length, bitstring in zip(lengths, bitstrings)):
+            raise ValueError("Bitstrings must have an even length to be translated to DNA")
+        bits = bitstring_to_bits(''.join(bitstrings))
+        return self.symbols_to_dna((bits[0::2] << 1) | bits[1::2], lengths)
+
+    def dna_to_bits(self, sequences):
+        """
+        Translate DNA sequences into bitstrings, two bits per base.
+
+        Parameters:
+        sequences (list): DNA strings.
+
+        Returns:
+        list: Bitstrings.
+        """
+        symbols, lengths = self.dna_to_symbols(sequences)
+        bits = np.empty((len(symbols), 2), dtype=np.uint8)
+        bits[:, 0] = symbols >> 1
+        bits[:, 1] = symbols & 1
+        return _split_at_lengths(bits_to_bitstring(bits.reshape(-1)), [2 * length for length in lengths])
+
+    def barcodes(self, count, length):
+        """
+        Create the DNA barcodes of the indices 0 to count - 1, i.e. the base-4 counters
+        of create_counter_list translated with the alphabet.
+
+        Parameters:
+        count (int): Number of barcodes.
+        length (int): Number of bases per barcode.
+
+        Returns:
+        list: DNA strings.
+        """
+        return self.symbols_to_dna(create_counter_matrix(length, 4, np.arange(count)))
+
+def _split_at_lengths(text, lengths):
+    """Split a string into consecutive pieces of the given lengths."""
+    bounds = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=bounds[1:])
+    bounds = bounds.tolist()
+    return [text[bounds[i]:bounds[i + 1]] for i in range(len(lengths))]
+
 def complementmap(string):
-    compliment = ''
-    for i in string:
-        if i == 'A':
-            compliment += 'T'
-        if i == 'T':
-            compliment += 'A'
-        if i == 'C':
-            compliment += 'G'
-        if i == 'G':
-            compliment += 'C'
-    compliment = compliment[::-1]
-    return compliment
+    """Reverse complement of a DNA string (see dnabyte.nucleotides.reverse_complement)."""
+    return reverse_complement(string)
 
 def data_as_indixes(data, library_lst):
     """
@@ -440,6 +611,90 @@ def sort_lists_by_first_n_entries_synth(lists, n):
 
     return listend
 
+def repair_copies(sequences, counts, repair, needs_repair):
+    """
+    Apply a random repair (e.g. padding reads to the codeword length) to every copy of the reads.
+
+    In a weighted pool, reads that need no repair keep their copy number, while every copy of the
+    other reads is repaired on its own, as if the pool was expanded. Identical results are merged
+    again with InSilicoDNA.collapse.
+
+    Parameters:
+    sequences (list): Reads as strings.
+    counts (np.ndarray): Copy number of every read, or None for unweighted pools.
+    repair (callable): Function returning the repaired copy of a read.
+    needs_repair (callable): Function returning True if repair changes (or draws for) a read.
+
+    Returns:
+    tuple: (list of the repaired reads, np.ndarray of their copy numbers or None)
+    """
+    if counts is None:
+        return [repair(sequence) for sequence in sequences], None
+
+    repaired, repaired_counts = [], []
+    for sequence, count in zip(sequences, counts.tolist()):
+        if needs_repair(sequence):
+            repaired.extend(repair(sequence) for _ in range(count))
+            repaired_counts.extend([1] * count)
+        else:
+            repaired.append(sequence)
+            repaired_counts.append(count)
+    collapsed = InSilicoDNA(repaired, counts=repaired_counts).collapse()
+    return collapsed.sequences, collapsed.counts
+
+def barcode_indices(digits, base):
+    """
+    Decode barcodes given as rows of base-m digits (most significant first) to integer indices.
+
+    Parameters:
+    digits (np.ndarray): Array of shape (number of reads, barcode length).
+    base (int): Base of the digits.
+
+    Returns:
+    np.ndarray: One int64 index per row. Barcodes too long for an int64 are replaced by their
+        rank among the distinct barcodes, which preserves their order.
+    """
+    digits = np.asarray(digits, dtype=np.int64)
+    if digits.shape[1] * np.log2(base) < 63:
+        powers = base ** np.arange(digits.shape[1] - 1, -1, -1, dtype=np.int64)
+        return digits @ powers
+    _, ranks = np.unique(digits, axis=0, return_inverse=True)
+    return ranks.reshape(-1).astype(np.int64)
+
+def demultiplex(indices, outlier_threshold=5, weights=None):
+    """
+    Group reads by their barcode index.
+
+    The reads are bucketed with a stable argsort on the indices, so every group keeps the
+    original read order and the groups are ordered by index. As in
+    sort_lists_by_first_n_entries_synth, groups whose size deviates from the median group size
+    by more than outlier_threshold median absolute deviations are dropped.
+
+    Parameters:
+    indices (array-like): Barcode index of every read.
+    outlier_threshold (float): Number of median absolute deviations a group size may deviate.
+    weights (array-like): Optional copy number of every read, used for the group sizes.
+
+    Returns:
+    tuple: (np.ndarray of the kept barcode indices, list of np.ndarray with the read positions of each group)
+    """
+    indices = np.asarray(indices)
+    if len(indices) == 0:
+        return indices, []
+
+    order = np.argsort(indices, kind='stable')
+    barcodes, starts, counts = np.unique(indices[order], return_index=True, return_counts=True)
+    if weights is not None:
+        counts = np.add.reduceat(np.asarray(weights)[order], starts)
+
+    median_of_magnitude = np.median(counts)
+    mad_of_headers = sp.stats.median_abs_deviation(counts)
+    keep = np.flatnonzero((counts >= median_of_magnitude - outlier_threshold * mad_of_headers) &
+                          (counts <= median_of_magnitude + outlier_threshold * mad_of_headers))
+
+    groups = np.split(order, starts[1:])
+    return barcodes[keep], [groups[i] for i in keep]
+
 def count_each_list_occurrences(list_of_lists: List[List]) -> Dict[Tuple, int]:
     """
     Counts how often each list appears in a list of lists.
@@ -507,7 +762,7 @@ def flatten_at_layer(nested_list, layer):
 
 
 def bytes_to_bitstring(byte_array):
-    return ''.join(format(byte, '08b') for byte in byte_array)
+    return _bytes_to_bitstring(bytes(byte_array))
 
 
 
@@ -0,0 +1,152 @@
+"""
+Position-wise consensus of clusters of DNA reads.
+
+A cluster is held as a 2-D np.uint8 matrix of ASCII codes with one read per row.
+Per-position base counts are computed for the whole matrix at once (one-hot sums
+for plain ACGT clusters, np.bincount otherwise), so a cluster at 200x coverage
+costs a few array operations instead of one Counter per column.
+"""
+from collections import Counter
+
+import numpy as np
+
+# Fill value for positions beyond the end of a shorter read
+PADDING = 0
+
+_BASES = np.frombuffer(b'ACGT', dtype=np.uint8)
+
+
+def sequences_to_matrix(sequences, length=None):
+    """
+    Stack DNA reads into a 2-D matrix of ASCII codes.
+
+    Reads longer than length are truncated, shorter reads are filled with PADDING.
+
+    :param sequences: List of DNA strings.
+    :param length: Number of columns (defaults to the length of the longest read).
+    :return: np.uint8 array of shape (len(sequences), length).
+    """
+    lengths = np.fromiter((len(sequence) for sequence in sequences), dtype=np.int64, count=len(sequences))
+    if length is None:
+        length = int(lengths.max()) if len(lengths) else 0
+    chars = np.frombuffer(''.join(sequences).encode('ascii', errors='replace'), dtype=np.uint8)
+
+    if np.all(lengths == length):
+        return chars.reshape(len(sequences), length)
+
+    # Copy the first min(len, length) characters of every read into its row
+    starts = np.zeros(len(lengths), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    kept = np.minimum(lengths, length)
+    rows = np.repeat(np.arange(len(lengths)), kept)
+    columns = np.arange(kept.sum()) - np.repeat(np.cumsum(kept) - kept, kept)
+
+    matrix = np.full((len(sequences), length), PADDING, dtype=np.uint8)
+    matrix[rows, columns] = chars[starts[rows] + columns]
+    return matrix
+
+
+def consensus(matrix, weights=None, ignore='N', alphabet=None, default='A', return_confidence=False):
+    """
+    Compute the position-wise majority of a cluster of reads.
+
+    At every position the base with the highest (weighted) count wins. Ties are broken in
+    favour of the base that occurs first in the cluster, like Counter.most_common. Positions
+    without any countable base are set to default.
+
+    :param matrix: 2-D np.uint8 matrix of ASCII codes, one read per row (see sequences_to_matrix).
+    :param weights: Optional weight per read, e.g. copy numbers or quality scores.
+    :param ignore: Characters that do not take part in the vote (padding is always ignored).
+    :param alphabet: Optional characters that take part in the vote; all others are ignored.
+    :param default: Base used at positions without any countable base.
+    :param return_confidence: Also return the share of the winning base at every position.
+    :return: Consensus string, or (consensus string, np.ndarray of confidences in [0, 1]).
+    """
+    matrix = np.asarray(matrix, dtype=np.uint8)
+    n_reads, length = matrix.shape
+
+    countable = np.ones(256, dtype=bool)
+    countable[PADDING] = False
+    if alphabet is not None:
+        countable[:] = False
+        countable[np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)] = True
+    if ignore:
+        countable[np.frombuffer(ignore.encode('ascii'), dtype=np.uint8)] = False
+
+    codes, counts = _position_counts(matrix, weights)
+    counts[:, ~countable[codes]] = 0
+
+    best = counts.max(axis=1)
+    winner = counts.argmax(axis=1)
+
+    # Break ties in favour of the tied character that occurs in the earliest read
+    tied = counts == best[:, None]
+    tied_columns = np.flatnonzero((tied.sum(axis=1) > 1) & (best > 0))
+    if len(tied_columns):
+        code_index = np.zeros(256, dtype=np.intp)
+        code_index[codes] = np.arange(len(codes))
+        tied_chars = code_index[matrix[:, tied_columns]]
+        candidates = tied[tied_columns[None, :], tied_chars] & countable[matrix[:, tied_columns]]
+        first_rows = candidates.argmax(axis=0)
+        winner[tied_columns] = tied_chars[first_rows, np.arange(len(tied_columns))]
+    winner = codes[winner]
+
+    chars = np.where(best > 0, winner, ord(default)).astype(np.uint8)
+    result = chars.tobytes().decode('ascii', errors='replace')
+
+    if not return_confidence:
+        return result
+    totals = counts.sum(axis=1)
+    confidence = np.divide(best, totals, out=np.zeros(length), where=totals > 0)
+    return result, confidence
+
+
+def _position_counts(matrix, weights=None):
+    """
+    Count the (weighted) occurrences of every character code at every position.
+
+    Clusters of plain 'A', 'C', 'G', 'T' reads are counted with one comparison per base,
+    anything else with a single np.bincount over all 256 codes.
+
+    :return: Tuple of (np.ndarray of K character codes, counts of shape (length, K)).
+    """
+    hits = [matrix == code for code in _BASES]
+    if sum(np.count_nonzero(hit) for hit in hits) == matrix.size:
+        if weights is None:
+            counts = [hit.view(np.uint8).sum(axis=0, dtype=np.int64) for hit in hits]
+        else:
+            counts = [np.asarray(weights, dtype=np.float64) @ hit for hit in hits]
+        return _BASES, np.stack(counts, axis=1)
+
+    length = matrix.shape[1]
+    keys = (np.arange(length, dtype=np.intp) * 256 + matrix).ravel()
+    if weights is None:
+        counts = np.bincount(keys, minlength=length * 256)
+    else:
+        read_weights = np.broadcast_to(np.asarray(weights, dtype=np.float64)[:, None], matrix.shape)
+        counts = np.bincount(keys, weights=read_weights.ravel(), minlength=length * 256)
+    return np.arange(256), counts.reshape(length, 256)
+
+
+def majority_vote(sequences, weights=None, ignore='N', alphabet=None, return_confidence=False):
+    """
+    Position-wise majority vote across a list of DNA reads of possibly different length.
+
+    The consensus has the most common read length; longer reads are truncated and shorter
+    reads do not vote at the missing positions. A single read is returned unchanged.
+
+    :param sequences: List of DNA strings.
+    :param weights: Optional weight per read.
+    :param ignore: Characters that do not take part in the vote.
+    :param alphabet: Optional characters that take part in the vote; all others are ignored.
+    :param return_confidence: Also return the per-position confidence (see consensus).
+    :return: Consensus string, or (consensus string, np.ndarray of confidences).
+    """
+    if len(sequences) <= 1:
+        result = sequences[0] if sequences else ""
+        return (result, np.ones(len(result))) if return_confidence else result
+
+    target_length = Counter(len(sequence) for sequence in sequences).most_common(1)[0][0]
+    matrix = sequences_to_matrix(sequences, target_length)
+    return consensus(matrix, weights=weights, ignore=ignore, alphabet=alphabet,
+                     return_confidence=return_confidence)
@@ -5,6 +5,8 @@ import traceback
 
 from io import BytesIO
 
+from dnabyte.binarization.auxiliary import bytes_to_bitstring
+
 # Ensure the NOREC4DNA package is importable
 _NOREC4DNA_DIR = os.path.join(os.path.dirname(__file__), 'DNA_Aeon', 'NOREC4DNA')
 if _NOREC4DNA_DIR not in sys.path:
@@ -156,9 +158,7 @@ def decode(data, params, logger=None):
                 output_bytes = bytes(output_bytes)
 
             # Convert bytes back to bitstring
-            bits = bin(int.from_bytes(output_bytes, byteorder='big'))[2:]
-            # Pad to full byte alignment
-            bits = bits.zfill(len(output_bytes) * 8)
+            bits = bytes_to_bitstring(output_bytes)
 
             # Truncate to original length
             if total_bits > 0:
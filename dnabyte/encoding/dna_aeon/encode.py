@@ -83,15 +83,10 @@ class DNAAeon(Encode):
             # Get the error correction encode function
             error_correction = get_error_correction_encode(error_correction_name, repair_symbols)
 
-            bitstream = data.data  # string of '0'/'1'
-            total_bits = len(bitstream)
-
-            # Convert bitstring to bytes
-            # Pad to a multiple of 8 bits
-            padded = bitstream
-            if len(padded) % 8 != 0:
-                padded = padded + '0' * (8 - len(padded) % 8)
-            raw_bytes = int(padded, 2).to_bytes(len(padded) // 8, byteorder='big')
+            total_bits = len(data)
+
+            # BinaryCode holds the bits packed into bytes, padded with zeros to a full byte
+            raw_bytes = data.to_bytes()
 
             # Write bytes to a temporary file (NOREC4DNA requires a file path)
             tmp_fd, tmp_path = tempfile.mkstemp(suffix='.bin')
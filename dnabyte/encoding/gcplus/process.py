@@ -1,5 +1,7 @@
 import os
-from collections import Counter, defaultdict
+from collections import defaultdict
+
+from dnabyte.encoding.consensus import majority_vote
 
 
 def process(data, params, logger=None):
@@ -105,21 +107,4 @@ def process(data, params, logger=None):
 
 def _majority_vote(sequences):
     """Position-wise majority vote across a list of DNA sequences."""
-    if not sequences:
-        return ""
-    if len(sequences) == 1:
-        return sequences[0]
-
-    lengths = Counter(len(s) for s in sequences)
-    target_len = lengths.most_common(1)[0][0]
-
-    consensus = []
-    for i in range(target_len):
-        bases_at_pos = [s[i] for s in sequences if i < len(s) and s[i] in 'ACGT']
-        if bases_at_pos:
-            most_common = Counter(bases_at_pos).most_common(1)[0][0]
-            consensus.append(most_common)
-        elif any(i < len(s) for s in sequences):
-            consensus.append('A')
-
-    return ''.join(consensus)
+    return majority_vote(sequences, ignore=None, alphabet='ACGT')
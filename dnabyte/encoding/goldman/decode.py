@@ -2,6 +2,7 @@ import tempfile
 import os
 import traceback
 
+from dnabyte.binarization.auxiliary import bytes_to_bitstring
 from dnabyte.encoding.wukong.StorageD.goldmanDecode import (
     decodeNt, combineHuffman, huffmanToByte, saveResult
 )
@@ -109,7 +110,7 @@ def decode(data, params, logger=None):
             file_content = f.read()
 
         # Convert output bytes to bitstream
-        binary_data = ''.join(format(b, '08b') for b in file_content)
+        binary_data = bytes_to_bitstring(file_content)
         if total_bits > 0:
             binary_data = binary_data[:total_bits]
 
@@ -36,15 +36,8 @@ class Goldman(Encode):
             # Create temporary directory for output
             output_dir = tempfile.mkdtemp()
 
-            # Pack bitstream into actual bytes for efficient encoding
-            # data.data is a string of '0' and '1' characters
-            bitstream = data.data
-            # Pad to multiple of 8 if needed
-            padded_len = len(bitstream)
-            if padded_len % 8 != 0:
-                bitstream = bitstream + '0' * (8 - padded_len % 8)
-
-            byte_data = bytes(int(bitstream[i:i+8], 2) for i in range(0, len(bitstream), 8))
+            # BinaryCode holds the bits packed into bytes, padded with zeros to a full byte
+            byte_data = data.to_bytes()
 
             temp_file = tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.bin')
             temp_file_path = temp_file.name
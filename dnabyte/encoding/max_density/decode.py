@@ -4,7 +4,10 @@ from tqdm import tqdm
 
 from dnabyte.encode import Encode
 from dnabyte.error_correction.auxiliary import undoreedsolomonsynthesis, undoltcodesynth
-from dnabyte.encoding.auxiliary import split_string
+from dnabyte.encoding.auxiliary import split_string, DNATranscoder
+
+# maxdensity mapping: '00' -> 'A', '01' -> 'G', '10' -> 'C', '11' -> 'T'
+transcoder = DNATranscoder('AGCT')
 
 def decode(data, params, logger=None):
     """
@@ -13,9 +16,7 @@ def decode(data, params, logger=None):
     try:
 
         # Convert DNA sequences to binary strings
-        binary_strings = []
-        for i in range(len(data.data)):
-            binary_strings.append(dna_to_binary(data.data[i]))
+        binary_strings = transcoder.dna_to_bits(data.data)
         decoded_binary, valid = recreate_binary_codewords(binary_strings, params)
 
         info = {
@@ -38,14 +39,7 @@ def dna_to_binary(dna_string):
     """
     Converts a DNA string to a binary string.
     """
-    binary_mapping = {
-        'A': '00',
-        'G': '01',
-        'C': '10',
-        'T': '11'
-    }
-    binary_string = ''.join(binary_mapping[base] for base in dna_string)
-    return binary_string
+    return transcoder.dna_to_bits([dna_string])[0]
 
 def recreate_binary_codewords(data, params):
 
@@ -3,8 +3,8 @@ import traceback
 
 from dnabyte.encode import Encode
 from dnabyte.error_correction.auxiliary import MakeReedSolomonCodeSynthesis, makeltcodesynth
-from dnabyte.encoding.auxiliary import create_counter_list, check_parameter, check_library
-from dnabyte.encoding.max_density.decode import decode as decode_function
+from dnabyte.encoding.auxiliary import iter_bit_blocks, check_parameter, check_library
+from dnabyte.encoding.max_density.decode import decode as decode_function, transcoder
 from dnabyte.encoding.max_density.process import process as process_function
 
 class MaxDensity(Encode):
@@ -13,7 +13,12 @@ class MaxDensity(Encode):
 
     This encoding scheme maps '00' to 'A', '01' to 'G', '10' to 'C', and '11' to 'T'. It has the theoretical maximum density 
     of 2 bits per nucleotide and is, thus, mostly used for theoretical purposes.
+
+    The encoder accepts block input, i.e. an iterator of BinaryCode blocks from Binarize.binarize_blocks.
     """
+
+    supports_block_input = True
+
     def __init__(self, params, logger=None):
         self.params = params
         self.logger = logger
@@ -39,16 +44,11 @@ class MaxDensity(Encode):
                 else:
                     self.logger.info(f"SANITY CHECK: Length of each binary codeword: {len(binary_codewords[0])}")
 
-            # add the barcodes to the binary blocks
-            dna_codewords = []
-
-            for i in range(len(binary_codewords)):
-                # create a barcode for each codeword on base 4 (equivalent to DNA bases)
-                barcodes_base4 = create_counter_list(self.params.dna_barcode_length, 4, i)
-                # create a barcode for each codeword on base 2
-                barcodes_base2 = self.base4_list_to_bitstring(barcodes_base4)
-                # translate the barcode to DNA
-                dna_codewords.append(self.binary_to_dna(barcodes_base2 + binary_codewords[i]))
+            # create a barcode for each codeword on base 4 (equivalent to DNA bases) and
+            # prepend it to the translated codeword
+            barcodes = transcoder.barcodes(len(binary_codewords), self.params.dna_barcode_length)
+            dna_codewords = [barcode + codeword for barcode, codeword in
+                             zip(barcodes, transcoder.bits_to_dna(binary_codewords))]
 
             # Sanity checks
             if self.params.debug:
@@ -65,7 +65,7 @@ class MaxDensity(Encode):
                 "min_codeword_length": min(codeword_lengths) if codeword_lengths else 0,
                 "max_codeword_length": max(codeword_lengths) if codeword_lengths else 0,
                 "barcode_length": self.params.dna_barcode_length,
-                "data_length": len(data.data)
+                "data_length": self.params.data_length
             }
 
         except Exception as e:
@@ -158,22 +158,20 @@ class MaxDensity(Encode):
     def create_binary_codewords(self, data, params):
         """
         Generates binary codewords from the provided data. It supports both Reed-Solomon and LT code error correction schemes.
-        """
-        # Step 1: cut the binary string to substrings of length bits_per_codeword 
-        binary_blocks = []
-        for i in range(0, len(data.data), params.bits_per_codeword):
-            binary_blocks.append(data.data[i:i + params.bits_per_codeword])
 
-        number_of_zero_padding = len(binary_blocks[-1])
-
-        binary_blocks[-1] = binary_blocks[-1].zfill(params.bits_per_codeword)
-        
-        # Step 2: create the binary codewords
+        The data can be a BinaryCode object or an iterable of BinaryCode blocks (see Binarize.binarize_blocks),
+        which is consumed block by block.
+        """
+        # Step 1 + 2: cut the binary data to substrings of length bits_per_codeword and create the binary codewords
         binary_codewords = []
+        header = str(self.decimal_to_binary(0)).zfill(params.zfill_bits * 2)
+        block = ''
         
-        for block in binary_blocks:
-            codeword = str(self.decimal_to_binary(0)).zfill(params.zfill_bits * 2) + block
-            binary_codewords.append(codeword)
+        for block in iter_bit_blocks(data, params.bits_per_codeword):
+            binary_codewords.append(header + block.zfill(params.bits_per_codeword))
+
+        number_of_zero_padding = len(block)
+        params.data_length = (len(binary_codewords) - 1) * params.bits_per_codeword + len(block)
 
         # fill the last binary codeword with zeros
 
@@ -206,14 +204,7 @@ class MaxDensity(Encode):
         """
         Converts a binary string to a DNA string.
         """
-        dna_mapping = {
-            '00': 'A',
-            '01': 'G',
-            '10': 'C',
-            '11': 'T'
-        }
-        dna_sequence = ''.join(dna_mapping[binary_sequence[i:i+2]] for i in range(0, len(binary_sequence), 2))
-        return dna_sequence
+        return transcoder.bits_to_dna([binary_sequence])[0]
     
 
 def attributes(inputparams):
@@ -2,7 +2,7 @@ import math as m
 import traceback
 
 from dnabyte.encode import Encode
-from dnabyte.encoding.auxiliary import create_counter_list, decimal_to_binary, check_parameter, check_library
+from dnabyte.encoding.auxiliary import create_counter_list, iter_bit_blocks, decimal_to_binary, check_parameter, check_library
 from dnabyte.error_correction.auxiliary import MakeReedSolomonCodeSynthesis, makeltcodesynth
 from dnabyte.encoding.no_homopolymer.decode import decode as decode_function
 from dnabyte.encoding.no_homopolymer.process import process as process_function
@@ -11,7 +11,12 @@ from dnabyte.encoding.no_homopolymer.process import process as process_function
 class NoHomoPoly(Encode):
     """
     This class provides an encoding scheme for DNA sequences that avoid homopolymers.
+
+    The encoder accepts block input, i.e. an iterator of BinaryCode blocks from Binarize.binarize_blocks.
     """
+
+    supports_block_input = True
+
     def __init__(self, params, logger=None):
         self.params = params
         self.logger = logger
@@ -234,19 +239,17 @@ class NoHomoPoly(Encode):
 
     def create_binary_codewords(self, data, params):
 
-        # Step 1: cut the binary string to substrings of length bits_per_codeword
-        binary_blocks = []
-        for i in range(0, len(data.data), params.bits_per_codeword):
-            binary_blocks.append(data.data[i:i + params.bits_per_codeword])
-        number_of_zero_padding = len(binary_blocks[-1])
-        binary_blocks[-1] = binary_blocks[-1].zfill(params.bits_per_codeword)
-
-        # Step 2: Create the binary codewords
+        # Step 1 + 2: cut the binary data to substrings of length bits_per_codeword and create the binary codewords.
+        # The data can be a BinaryCode object or an iterable of BinaryCode blocks.
         binary_codewords = []
+        header = str(decimal_to_binary(0)).zfill(params.zfill_bits)
+        block = ''
+
+        for block in iter_bit_blocks(data, params.bits_per_codeword):
+            binary_codewords.append(header + block.zfill(params.bits_per_codeword))
 
-        for block in binary_blocks:
-            codeword = str(decimal_to_binary(0)).zfill(params.zfill_bits) + block
-            binary_codewords.append(codeword)
+        number_of_zero_padding = len(block)
+        params.data_length = (len(binary_codewords) - 1) * params.bits_per_codeword + len(block)
 
         # Fill the last codeword                
         if number_of_zero_padding == params.bits_per_codeword:
@@ -1,83 +1,90 @@
 import random
-from collections import Counter
+from functools import partial
 from tqdm import tqdm
-from dnabyte.encoding.auxiliary import sort_lists_by_first_n_entries_synth
+from dnabyte.encoding.auxiliary import barcode_indices, demultiplex, repair_copies
+from dnabyte.encoding.consensus import consensus, sequences_to_matrix
 
 def process(data, params, logger=None):
 
-    sortedlist = []
+    # Weighted pools are processed once per distinct read, the copy numbers weigh the consensus
+    counts = data.counts
 
     # TODO: where are the spaces created?
-    sequenceddata = [seq.replace(' ', '') for seq in data.data] 
-
-    for i in tqdm(range(len(sequenceddata)), desc="Processing codewords", disable=logger is not None):
-        
-        bases = ['A', 'C', 'T', 'G']
-        
-        while len(sequenceddata[i]) < params.codeword_length:
-            for tester2 in range(len(sequenceddata[i]) - 1):
-                evenlist = ['T', 'G']
-                oddlist = ['C', 'A']
-                if sequenceddata[i][tester2] in evenlist and sequenceddata[i][tester2 + 1] in evenlist:
-                    sequenceddata[i] = sequenceddata[i][:tester2 + 1] + random.choice(oddlist) + sequenceddata[i][tester2 + 2:]
-                    break
-                elif sequenceddata[i][tester2] in oddlist and sequenceddata[i][tester2 + 1] in oddlist:
-                    sequenceddata[i] = sequenceddata[i][:tester2 + 1] + random.choice(evenlist) + sequenceddata[i][tester2 + 2:]
-                    break
-            else:
-                # Randomly choose a position to insert a base
-                insert_position = random.randint(0, len(sequenceddata[i]))
-                # Randomly choose a base to insert
-                base_to_insert = random.choice(bases)
-                # Insert the base at the chosen position
-                sequenceddata[i] = sequenceddata[i][:insert_position] + base_to_insert + sequenceddata[i][insert_position:]
-                
-        while len(sequenceddata[i]) > params.codeword_length:
-            # Randomly choose a position to delete a base
-            delete_position = random.randint(0, len(sequenceddata[i]) - 1)
-            # Delete the base at the chosen position
-            sequenceddata[i] = sequenceddata[i][:delete_position] + sequenceddata[i][delete_position + 1:]
-
-        for tester2 in range(len(sequenceddata[i])):
-            evenlist = ['T', 'G']
-            oddlist = ['C', 'A']
-            if tester2 % 2 == 0:
-                if sequenceddata[i][tester2] not in evenlist:
-                    sequenceddata[i] = sequenceddata[i][:tester2] + random.choice(evenlist) + sequenceddata[i][tester2 + 1:]
-            else:
-                if sequenceddata[i][tester2] not in oddlist:
-                    sequenceddata[i] = sequenceddata[i][:tester2] + random.choice(oddlist) + sequenceddata[i][tester2 + 1:]
-
-        indexcontainingdna = sequenceddata[i][:params.dna_barcode_length]
-        indexbinary = dna_to_binary_custom(indexcontainingdna)
-        index2list = []
-
-        for j in range(len(indexbinary)):
-            index2list.append(int(indexbinary[j]))
-        index2list.reverse()
-        sortablelist = []
-        sortablelist.append(sequenceddata[i][params.dna_barcode_length:])
-        for j in range(len(index2list)):
-            sortablelist.insert(0, index2list[j])                    
-        
-        lengthofthefirst = len(index2list)
-        sortedlist.append(sortablelist)
-    
-    listssorted = sort_lists_by_first_n_entries_synth(sortedlist, lengthofthefirst) 
-    for i in range(len(listssorted)):
-        for j in range(len(listssorted[i])):
-            for k in range(params.dna_barcode_length):
-                listssorted[i][j].pop(0)
-    
+    sequenceddata = [seq.replace(' ', '') for seq in data.sequences] 
+
+    # every copy of a read gets its own random repair
+    sequenceddata, counts = repair_copies(
+        tqdm(sequenceddata, desc="Processing codewords", disable=logger is not None), counts,
+        partial(repair_codeword, codeword_length=params.codeword_length),
+        partial(needs_repair, codeword_length=params.codeword_length))
+
+    # decode the barcodes (one bit per base, see dna_to_binary_custom) and group the reads by index;
+    # after the correction above, 'G' and 'A' are the only bases that stand for a one
+    barcodes = sequences_to_matrix([seq[:params.dna_barcode_length] for seq in sequenceddata], params.dna_barcode_length)
+    indices = barcode_indices((barcodes == ord('G')) | (barcodes == ord('A')), 2)
+    _, groups = demultiplex(indices, weights=counts)
+
+    reads = sequences_to_matrix(sequenceddata, params.codeword_length)[:, params.dna_barcode_length:]
+
     listoflikley = []
     
-    for evrycodeword in tqdm(listssorted, desc="Finding consensus", disable=logger is not None):
-        listoflikley.append(most_common_string(evrycodeword))
+    for group in tqdm(groups, desc="Finding consensus", disable=logger is not None):
+        listoflikley.append(consensus(reads[group], weights=None if counts is None else counts[group], ignore=None))
 
     info = {}
 
     return listoflikley, info
 
+def needs_repair(sequence, codeword_length):
+    """
+    Returns True if repair_codeword would change the sequence, i.e. if it has the wrong length or a base
+    of the wrong parity (T or G at even positions, C or A at odd positions).
+    """
+    if len(sequence) != codeword_length:
+        return True
+    return any(base not in ('TG' if i % 2 == 0 else 'CA') for i, base in enumerate(sequence))
+
+def repair_codeword(sequence, codeword_length):
+    """
+    Brings the sequence to the codeword length and replaces the bases of the wrong parity by random bases.
+    """
+    bases = ['A', 'C', 'T', 'G']
+    
+    while len(sequence) < codeword_length:
+        for tester2 in range(len(sequence) - 1):
+            evenlist = ['T', 'G']
+            oddlist = ['C', 'A']
+            if sequence[tester2] in evenlist and sequence[tester2 + 1] in evenlist:
+                sequence = sequence[:tester2 + 1] + random.choice(oddlist) + sequence[tester2 + 2:]
+                break
+            elif sequence[tester2] in oddlist and sequence[tester2 + 1] in oddlist:
+                sequence = sequence[:tester2 + 1] + random.choice(evenlist) + sequence[tester2 + 2:]
+                break
+        else:
+            # Randomly choose a position to insert a base
+            insert_position = random.randint(0, len(sequence))
+            # Randomly choose a base to insert
+            base_to_insert = random.choice(bases)
+            # Insert the base at the chosen position
+            sequence = sequence[:insert_position] + base_to_insert + sequence[insert_position:]
+            
+    while len(sequence) > codeword_length:
+        # Randomly choose a position to delete a base
+        delete_position = random.randint(0, len(sequence) - 1)
+        # Delete the base at the chosen position
+        sequence = sequence[:delete_position] + sequence[delete_position + 1:]
+
+    for tester2 in range(len(sequence)):
+        evenlist = ['T', 'G']
+        oddlist = ['C', 'A']
+        if tester2 % 2 == 0:
+            if sequence[tester2] not in evenlist:
+                sequence = sequence[:tester2] + random.choice(evenlist) + sequence[tester2 + 1:]
+        else:
+            if sequence[tester2] not in oddlist:
+                sequence = sequence[:tester2] + random.choice(oddlist) + sequence[tester2 + 1:]
+    return sequence
+
 def dna_to_binary_custom(dna_string):
     binary_string = []
     for i, base in enumerate(dna_string):
@@ -95,23 +102,11 @@ def dna_to_binary_custom(dna_string):
 
 # TODO: We need to implement a few sanity checks here
 def most_common_string(strings):
+    """
+    Returns the string made of the most common letter at each position of the given strings.
+    """
     if not strings:
         return ""
-    
-    # Initialize a list to store the most common letters at each position
-    most_common_letters = []
-    
-    # Iterate over each position in the strings
-    for i in range(len(strings[0])):
-        # Get the letters at the current position from all strings
-        letters_at_position = [s[i] for s in strings]
-        
-        # Find the most common letter at the current position
-        most_common_letter = Counter(letters_at_position).most_common(1)[0][0]
-        
-        # Append the most common letter to the list
-        most_common_letters.append(most_common_letter)
-    
-    # Join the list of most common letters into a single string
-    return ''.join(most_common_letters)
+
+    return consensus(sequences_to_matrix(strings, len(strings[0])), ignore=None)
 
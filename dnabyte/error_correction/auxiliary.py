@@ -1,5 +1,8 @@
+import numpy as np
 from reedsolo import RSCodec
+from dnabyte.error_correction.batch_reed_solomon import BatchReedSolomon, FAILED
 from dnabyte.error_correction.ltcodefixedsize import encode_lt, decode_lt
+from dnabyte.binarization.auxiliary import bitstring_to_bytes, bytes_to_bitstring, bitstrings_to_rows, rows_to_bitstrings
 
 def bitstring_to_bytearray(bitstring):
     """
@@ -14,9 +17,7 @@ def bitstring_to_bytearray(bitstring):
     if len(bitstring) % 8 != 0:
         raise ValueError("Bit string length must be a multiple of 8")
 
-    # Group the bit string into chunks of 8 bits and convert to bytes
-    byte_array = bytearray(int(bitstring[i:i+8], 2) for i in range(0, len(bitstring), 8))
-    return byte_array
+    return bytearray(bitstring_to_bytes(bitstring))
 
 
 def bytearray_to_bitstring(byte_array):
@@ -29,7 +30,7 @@ def bytearray_to_bitstring(byte_array):
     Returns:
         str: A string of '0's and '1's representing the bits.
     """
-    return ''.join(format(byte, '08b') for byte in byte_array)
+    return bytes_to_bitstring(bytes(byte_array))
 
 
 
@@ -47,35 +48,57 @@ def MakeReedSolomonCode(data,codewordlength,bitsinpos):
     
     return reedsolomonencodedwords
 
+def _group_by_length(bitstrings):
+    """Indices of the bitstrings of every length."""
+    groups = {}
+    for index, bitstring in enumerate(bitstrings):
+        groups.setdefault(len(bitstring), []).append(index)
+    return groups.items()
+
 def MakeReedSolomonCodeSynthesis(data, errorlength):
-    reedsolomonlength = (errorlength) // 8
-    rs = RSCodec(reedsolomonlength)
-    reedsolomonencodedwords = []
-    for codewords in data:
-        bytearr = bitstring_to_bytearray(codewords)
+    rs = BatchReedSolomon(errorlength // 8)
+    reedsolomonencodedwords = [None] * len(data)
+    for length, indices in _group_by_length(data):
+        if length % 8 != 0:
+            raise ValueError("Bit string length must be a multiple of 8")
+        rows, _ = bitstrings_to_rows([data[index] for index in indices])
+        encoded = rs.encode(rows)
+        for index, bitstring in zip(indices, rows_to_bitstrings(encoded, [8 * encoded.shape[1]] * len(indices))):
+            reedsolomonencodedwords[index] = bitstring
 
-        codewordrs = rs.encode(bytearr)
-        reedsolobitstring = bytearray_to_bitstring(codewordrs)
-        reedsolomonencodedwords.append(reedsolobitstring)
-        
     return reedsolomonencodedwords
 
+def decode_reedsolomon_synthesis(data, errorlength):
+    """
+    Reed-Solomon decoding of the codewords of a synthesis pipeline.
+
+    Args:
+        data (list): Codeword bitstrings, as created by MakeReedSolomonCodeSynthesis.
+        errorlength (int): Number of parity bits per codeword.
+
+    Returns:
+        tuple: The list of decoded bitstrings and the np.int8 status of every codeword (CLEAN,
+        CORRECTED or FAILED, see batch_reed_solomon). Failed codewords, including those whose
+        length is not a multiple of 8, are returned without their last errorlength bits.
+    """
+    rs = BatchReedSolomon(errorlength // 8)
+    reedsolomonencodedwords = [None] * len(data)
+    status = np.full(len(data), FAILED, dtype=np.int8)
+    for length, indices in _group_by_length(data):
+        if length % 8 == 0:
+            rows, _ = bitstrings_to_rows([data[index] for index in indices])
+            messages, status[indices], _ = rs.decode(rows)
+            decoded = rows_to_bitstrings(messages, [8 * messages.shape[1]] * len(indices))
+            for index, bitstring in zip(indices, decoded):
+                reedsolomonencodedwords[index] = bitstring
+    for index in np.flatnonzero(status == FAILED).tolist():
+        codewords = data[index]
+        reedsolomonencodedwords[index] = codewords[:len(codewords) - errorlength]
+    return reedsolomonencodedwords, status
+
 def undoreedsolomonsynthesis(data,errorlength):
-    reedsolomonlength = (errorlength)//8
-    rs = RSCodec(reedsolomonlength)
-    reedsolomonencodedwords = []
-    valuechack = True
-    for codewords in data:
-        try:
-            bytearr = bitstring_to_bytearray(codewords)
-            decoded_bytearr = rs.decode(bytearr)
-            decoded_bitstring = bytearray_to_bitstring(decoded_bytearr[0])
-            reedsolomonencodedwords.append(decoded_bitstring)
-        except:
-            #logger.debug(f'Error in Reed Solomon decoding: codeword={codewords}, errorlength={errorlength}')
-            valuechack = False
-            reedsolomonencodedwords.append(codewords[:len(codewords)-errorlength])
-    return reedsolomonencodedwords, valuechack
+    reedsolomonencodedwords, status = decode_reedsolomon_synthesis(data, errorlength)
+    return reedsolomonencodedwords, not np.any(status == FAILED)
 
 def undoreedsolomon(data,codewordlength,bitsinpos):
     
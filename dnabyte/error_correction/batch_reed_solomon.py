@@ -0,0 +1,158 @@
+"""
+Reed-Solomon coding of batches of codewords, compatible with reedsolo.RSCodec(nsym).
+
+The codewords of a batch are the rows of an (n_codewords x n_bytes) np.uint8 matrix, which is
+processed column by column with GF(256) log/antilog tables:
+- the parity bytes of all rows are computed by one shift register over the message columns,
+- the syndromes of all rows are evaluated by Horner's scheme over the received columns.
+
+Rows with all syndromes zero are clean and returned without further work. Only the dirty rows
+are corrected by reedsolo (Berlekamp-Massey, Chien search and Forney), so batches with few
+errors cost little more than the syndrome check. Like RSCodec, rows longer than nsize bytes
+are coded in chunks of nsize bytes (nsize - nsym message bytes).
+"""
+import numpy as np
+from reedsolo import RSCodec, ReedSolomonError
+
+# Status of every decoded codeword
+CLEAN = 0
+CORRECTED = 1
+FAILED = 2
+
+# Primitive polynomial and generator of GF(256), as the defaults of reedsolo
+PRIMITIVE_POLYNOMIAL = 0x11d
+GENERATOR = 2
+
+
+def gf_tables(prim=PRIMITIVE_POLYNOMIAL, generator=GENERATOR):
+    """
+    Log and antilog tables of GF(256).
+
+    :return: Tuple of (np.int64 log table of length 256, log[0] is unused,
+        np.uint8 antilog table of length 512, so sums of two logs need no modulo).
+    """
+    exp = np.zeros(512, dtype=np.uint8)
+    log = np.zeros(256, dtype=np.int64)
+    x = 1
+    for i in range(255):
+        exp[i] = x
+        log[x] = i
+        # multiply by the generator (carry-less) and reduce by the primitive polynomial
+        product, factor, y = 0, generator, x
+        while factor:
+            if factor & 1:
+                product ^= y
+            factor >>= 1
+            y <<= 1
+            if y & 0x100:
+                y ^= prim
+        x = product
+    exp[255:510] = exp[:255]
+    return log, exp
+
+
+GF_LOG, GF_EXP = gf_tables()
+
+
+def gf_multiply(a, b):
+    """Elementwise product of two broadcastable np.uint8 arrays in GF(256)."""
+    a, b = np.asarray(a, dtype=np.uint8), np.asarray(b, dtype=np.uint8)
+    return np.where((a != 0) & (b != 0), GF_EXP[GF_LOG[a] + GF_LOG[b]], np.uint8(0))
+
+
+def generator_polynomial(nsym):
+    """Coefficients (highest degree first) of the product of (x - 2^i) for i < nsym, as in reedsolo."""
+    g = np.ones(1, dtype=np.uint8)
+    for i in range(nsym):
+        shifted = np.append(g, np.uint8(0))
+        shifted[1:] ^= gf_multiply(g, GF_EXP[i])
+        g = shifted
+    return g
+
+
+class BatchReedSolomon:
+    """
+    Reed-Solomon codec over the rows of a byte matrix.
+
+    :param nsym: Number of parity bytes per chunk.
+    :param nsize: Largest number of bytes of a chunk (message and parity bytes).
+    """
+
+    def __init__(self, nsym, nsize=255):
+        if not 0 < nsym < nsize <= 255:
+            raise ValueError("The number of parity bytes must be positive and less than the chunk size (at most 255)")
+        self.nsym = nsym
+        self.nsize = nsize
+        self.generator = generator_polynomial(nsym)
+        self.codec = RSCodec(nsym, nsize=nsize)
+
+    def _chunks(self, width, chunk_size):
+        return [(start, min(start + chunk_size, width)) for start in range(0, width, chunk_size)]
+
+    def encode(self, messages):
+        """
+        Append the parity bytes to every row.
+
+        :param messages: np.uint8 matrix with one message per row.
+        :return: np.uint8 matrix of the codewords, the rows are those of RSCodec(nsym, nsize).encode.
+        """
+        messages = np.asarray(messages, dtype=np.uint8)
+        chunks = []
+        for start, end in self._chunks(messages.shape[1], self.nsize - self.nsym):
+            parity = np.zeros((len(messages), self.nsym), dtype=np.uint8)
+            for column in range(start, end):
+                feedback = messages[:, column] ^ parity[:, 0]
+                parity[:, :-1] = parity[:, 1:]
+                parity[:, -1] = 0
+                parity ^= gf_multiply(feedback[:, None], self.generator[None, 1:])
+            chunks.extend((messages[:, start:end], parity))
+        return np.concatenate(chunks, axis=1) if chunks else messages.copy()
+
+    def syndromes(self, codewords):
+        """
+        Syndromes of every chunk of every row.
+
+        :param codewords: np.uint8 matrix with one codeword per row.
+        :return: np.uint8 array of shape (n_codewords, n_chunks, nsym); the values of the chunks at 2^i.
+        """
+        codewords = np.asarray(codewords, dtype=np.uint8)
+        chunks = self._chunks(codewords.shape[1], self.nsize)
+        result = np.zeros((len(codewords), len(chunks), self.nsym), dtype=np.uint8)
+        powers = np.arange(self.nsym)
+        for index, (start, end) in enumerate(chunks):
+            synd = result[:, index]
+            for column in range(start, end):
+                # synd * 2^i + byte, the logs of nonzero syndromes are shifted by i
+                synd[:] = np.where(synd != 0, GF_EXP[GF_LOG[synd] + powers], np.uint8(0)) ^ codewords[:, column, None]
+        return result
+
+    def decode(self, codewords):
+        """
+        Correct the rows and strip their parity bytes.
+
+        :param codewords: np.uint8 matrix with one codeword per row.
+        :return: Tuple of (np.uint8 matrix of the messages, np.int8 status of every row (CLEAN,
+            CORRECTED or FAILED), np.int64 number of corrected bytes of every row). The messages of
+            failed rows are their received message bytes.
+        """
+        codewords = np.asarray(codewords, dtype=np.uint8)
+        chunks = self._chunks(codewords.shape[1], self.nsize)
+        message_columns = np.concatenate([np.arange(start, max(end - self.nsym, start)) for start, end in chunks]
+                                         ) if chunks else np.zeros(0, dtype=np.int64)
+        messages = codewords[:, message_columns]
+        status = np.full(len(codewords), CLEAN, dtype=np.int8)
+        corrected = np.zeros(len(codewords), dtype=np.int64)
+        if not chunks:
+            return messages, status, corrected
+
+        dirty = np.flatnonzero(self.syndromes(codewords).any(axis=(1, 2)))
+        for row in dirty.tolist():
+            try:
+                decoded, _, errata = self.codec.decode(bytearray(codewords[row].tobytes()))
+            except (ReedSolomonError, ValueError, ZeroDivisionError):
+                status[row] = FAILED
+                continue
+            messages[row] = np.frombuffer(bytes(decoded), dtype=np.uint8)
+            status[row] = CORRECTED
+            corrected[row] = len(errata)
+        return messages, status, corrected
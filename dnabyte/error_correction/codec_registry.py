@@ -0,0 +1,146 @@
+"""
+Process-wide registry of Reed-Solomon fields, generator polynomials and codecs.
+
+Setting up a codec constructs its galois field, which JIT compiles the field arithmetic, and
+multiplies n - k linear factors into g(x) and k more into h(x). Parameter sweeps build the same
+codecs over and over, so everything is built once per (p, q, n, k) and kept for the lifetime of
+the process:
+
+- galois_field(p, q): the galois field GF(p^q),
+- generator_polynomials(p, q, n, k): the coefficients of g(x) and h(x) of ReedSolomon,
+- table_generator_polynomials(n, k): g(x) and h(x) of RSCoder and RScoderKaya, which use the
+  GF(2^8) tables of reed_solomon.ff instead of galois,
+- reed_solomon_codec(p, q, n, k): a ReedSolomon instance, used by encode_many and decode_many.
+
+The coefficients of the galois generator polynomials are also written to an on-disk cache if a
+cache directory is set (set_cache_dir or the environment variable DNABYTE_CODEC_CACHE), so new
+processes skip the JIT compiled polynomial products.
+"""
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from dnabyte.error_correction.reed_solomon.ff import EXP
+from dnabyte.error_correction.reed_solomon.polynomial import poly_mul
+
+# Environment variable with the directory of the on-disk cache
+CACHE_DIR_VARIABLE = 'DNABYTE_CODEC_CACHE'
+
+_cache_dir = os.environ.get(CACHE_DIR_VARIABLE)
+_generator_polynomials = {}
+_codecs = {}
+
+
+def set_cache_dir(path):
+    """
+    Set the directory of the on-disk cache of generator polynomials.
+
+    :param path: Directory (created if needed), or None to only cache in memory.
+    """
+    global _cache_dir
+    _cache_dir = path
+
+
+def clear_cache():
+    """Forget the generator polynomials and codecs of this process (the on-disk cache is kept)."""
+    _generator_polynomials.clear()
+    _codecs.clear()
+    table_generator_polynomials.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def galois_field(p, q):
+    """The galois field GF(p^q), constructed (and compiled) once per process."""
+    import galois
+    return galois.GF(p ** q)
+
+
+def _cache_file(p, q, n, k):
+    return os.path.join(_cache_dir, f'reed_solomon_{p}_{q}_{n}_{k}.json')
+
+
+def generator_polynomials(p, q, n, k):
+    """
+    Coefficients of g(x) = (x - α^1)...(x - α^(n-k)) and h(x) = (x - α^(n-k+1))...(x - α^n)
+    over GF(p^q), α the primitive element of galois_field(p, q).
+
+    :return: Tuple of (g, h), tuples of ints in order of decreasing power.
+    """
+    key = (p, q, n, k)
+    if key in _generator_polynomials:
+        return _generator_polynomials[key]
+
+    polynomials = None
+    if _cache_dir is not None and os.path.exists(_cache_file(*key)):
+        with open(_cache_file(*key)) as f:
+            cached = json.load(f)
+        polynomials = tuple(cached['g']), tuple(cached['h'])
+
+    if polynomials is None:
+        import galois
+        GF = galois_field(p, q)
+        alpha = GF.primitive_element
+        g = galois.Poly([1], field=GF)
+        for power in range(1, n - k + 1):
+            g = g * galois.Poly([1, alpha ** power], field=GF)
+        h = galois.Poly([1], field=GF)
+        for power in range(n - k + 1, n + 1):
+            h = h * galois.Poly([1, alpha ** power], field=GF)
+        polynomials = tuple(int(c) for c in g.coeffs), tuple(int(c) for c in h.coeffs)
+
+        if _cache_dir is not None:
+            os.makedirs(_cache_dir, exist_ok=True)
+            temporary = _cache_file(*key) + f'.{os.getpid()}.tmp'
+            with open(temporary, 'w') as f:
+                json.dump({'g': polynomials[0], 'h': polynomials[1]}, f)
+            os.replace(temporary, _cache_file(*key))
+
+    _generator_polynomials[key] = polynomials
+    return polynomials
+
+
+@lru_cache(maxsize=None)
+def table_generator_polynomials(n, k):
+    """
+    g(x) and h(x) of RSCoder and RScoderKaya (α = 3 in the field of reed_solomon.ff).
+
+    :return: Tuple of read-only np.uint8 arrays (g, h) in order of decreasing power.
+    """
+    g = np.ones(1, dtype=np.uint8)
+    for power in range(1, n - k + 1):
+        g = poly_mul(g, [1, EXP[power % 255]])
+    h = np.ones(1, dtype=np.uint8)
+    for power in range(n - k + 1, n + 1):
+        h = poly_mul(h, [1, EXP[power % 255]])
+    g.setflags(write=False)
+    h.setflags(write=False)
+    return g, h
+
+
+def reed_solomon_codec(p, q, n, k):
+    """
+    The ReedSolomon codec of GF(p^q) with messages of k symbols, built once per process.
+
+    :param n: Codeword length, must be p^q - 1.
+    """
+    if n != p ** q - 1:
+        raise ValueError("The codeword length of ReedSolomon must be p**q - 1")
+    key = (p, q, n, k)
+    if key not in _codecs:
+        from dnabyte.error_correction.error_correction_reed_solomon import ReedSolomon
+        _codecs[key] = ReedSolomon(p, q, k)
+    return _codecs[key]
+
+
+def encode_many(messages, p, q, n, k):
+    """Encode a list of messages with the cached codec (see ReedSolomon.generate)."""
+    coder = reed_solomon_codec(p, q, n, k)
+    return [coder.generate(message) for message in messages]
+
+
+def decode_many(codewords, p, q, n, k):
+    """Correct a list of codewords with the cached codec (see ReedSolomon.correct)."""
+    coder = reed_solomon_codec(p, q, n, k)
+    return [coder.correct(codeword) for codeword in codewords]
@@ -1,6 +1,8 @@
 from data_model import InnerErrorCorrection
 import galois
 
+from dnabyte.error_correction.codec_registry import galois_field, generator_polynomials
+
 class ReedSolomon (InnerErrorCorrection):
     """
     ReedSolomon is a subclass of InnerErrorCorrection.
@@ -33,8 +35,9 @@ class ReedSolomon (InnerErrorCorrection):
         self.q = q
         n = self.n
         
-        GF = galois.GF(p**q)
-        alpha = GF.primitive_element
+        # The field and the generator polynomials are built once per process (see codec_registry)
+        GF = galois_field(p, q)
+        self.GF = GF
         if n < 0 or k < 0:
             raise ValueError("n and k must be positive")
         if not n < 256:
@@ -45,27 +48,11 @@ class ReedSolomon (InnerErrorCorrection):
         
         self.k = k
 
-        # Generate the generator polynomial for RS codes
-        # g(x) = (x-α^1)(x-α^2)...(x-α^(n-k))
-        # α is 3, a generator for GF(2^8)
-        g=GF(1)
-        
-        for alphacitc in range(1,n-k+1):
-            p = galois.Poly([1, alpha**alphacitc],field=GF)
-            
-            
-            g = g * p
-            
-            
-        self.g = g
-       
-        # h(x) = (x-α^(n-k+1))...(x-α^n)
-        h = GF([1])
-        for alphacitc in range(n-k+1,n+1):
-            p = galois.Poly([1, alpha**alphacitc],field=GF)
-            
-            h = h * p
-        self.h = h
+        # Generator polynomial for RS codes g(x) = (x-α^1)(x-α^2)...(x-α^(n-k))
+        # and h(x) = (x-α^(n-k+1))...(x-α^n), α is the primitive element of GF
+        g, h = generator_polynomials(p, q, n, k)
+        self.g = galois.Poly(g, field=GF)
+        self.h = galois.Poly(h, field=GF)
 
 
 
@@ -84,7 +71,7 @@ class ReedSolomon (InnerErrorCorrection):
             Raises:
                 ValueError: If the length of the message is greater than k*4.
         """
-        GF=galois.GF(self.p**self.q)
+        GF = self.GF
         n = self.n
         k = self.k
         if (len(message))>k*4:
@@ -130,7 +117,7 @@ class ReedSolomon (InnerErrorCorrection):
             bool: True if the code is valid, False otherwise.
         """
         #Maybe do it with h but haven't figured out how to quickly make a polynomial with max rank
-        GF = galois.GF(self.p**self.q)
+        GF = self.GF
         g = self.g
 
         c = galois.Poly(code,field=GF)
@@ -148,7 +135,7 @@ class ReedSolomon (InnerErrorCorrection):
         Returns:
             galois.Poly: The syndromes as a polynomial in the finite field.
         """
-        GF = galois.GF(self.p**self.q)
+        GF = self.GF
         n = self.n
         k = self.k
         alpha = GF.primitive_element
@@ -177,7 +164,7 @@ class ReedSolomon (InnerErrorCorrection):
         Returns:
             tuple: The error locator polynomial (sigma) and the error evaluator polynomial (omega).
         """
-        GF=galois.GF(self.p**self.q)
+        GF = self.GF
         n = self.n
         k = self.k
         alpha = GF.primitive_element
@@ -259,7 +246,7 @@ class ReedSolomon (InnerErrorCorrection):
         Returns:
             tuple: The error locations (X) and their corresponding indices (j).
         """
-        GF=galois.GF(self.p**self.q)
+        GF = self.GF
         X = []
         j = []
         alpha = GF.primitive_element
@@ -290,7 +277,7 @@ class ReedSolomon (InnerErrorCorrection):
         """
         # XXX Is floor division okay here? Should this be ceiling?
         
-        GF=galois.GF(self.p**self.q)
+        GF = self.GF
         s = (self.n - self.k) // 2
         alpha = GF.primitive_element
         Y = []
@@ -334,7 +321,7 @@ class ReedSolomon (InnerErrorCorrection):
         Returns:
             list: The decoded message.
         """
-        GF=galois.GF(self.p**self.q)
+        GF = self.GF
         n = self.n
         k = self.k
         alpha = GF.primitive_element
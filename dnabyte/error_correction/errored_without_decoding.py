@@ -1,4 +1,4 @@
-from dnabyte.error_correction.error_correction_reed_solomon import ReedSolomon
+from dnabyte.error_correction.codec_registry import encode_many, decode_many
 
 def bitstream_to_bitmessages(bitstream, message_length, q):
     message_list = [[bitstream[i+j:i+j+q] for i in range(0, message_length*q, q)] for j in range(0, len(bitstream), message_length*q)]
@@ -16,18 +16,10 @@ def decimalmessages_to_bitmessages(message_list):
     return [[format(decimal, '08b') for decimal in sublist] for sublist in message_list]
 
 def reed_solomon_encoding(message_list, p,q, message_length):
-    coder=ReedSolomon(p,q, message_length)
-    encoded_message_list = [coder.generate(message) for message in message_list]
-    return encoded_message_list
+    return encode_many(message_list, p, q, p**q-1, message_length)
 
 def reed_solomon_decoding(encoded_message_list, p,q, message_length):
-    coder=ReedSolomon(p,q, message_length)
-    
-    decoded_message_list=[]
-    for i in range(len(encoded_message_list)):
-        decoded_message_list.append(coder.correct(encoded_message_list[i]) )
-    
-    return decoded_message_list
+    return decode_many(encoded_message_list, p, q, p**q-1, message_length)
 
 def decimal_to_quaternary(decimal_number,q):
     if decimal_number == 0:
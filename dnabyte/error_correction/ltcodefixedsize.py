@@ -1,8 +1,16 @@
 import numpy as np
 import math as m
-import random
+from collections import Counter, deque
+
+from dnabyte.binarization.auxiliary import bits_to_bitstring, bitstrings_to_rows, rows_to_bitstrings
 #from mi_dna_disc.logging_config import logger
 
+# Largest number of sources that are inactivated and solved by Gaussian elimination when peeling stalls
+MAX_INACTIVE_SOURCES = 4096
+
+# Rounds of redrawing the neighbours of symbols with a repeated index before drawing them one by one
+MAX_NEIGHBOUR_ROUNDS = 8
+
 def translate_and_join(numbers, length):
     binary_strings = [format(num, f'0{length}b') for num in numbers]
     joined_string = ''.join(binary_strings)
@@ -66,7 +74,121 @@ def robust_soliton_distribution(N, c=0.1, delta=0.5, max_degree=None):
     
     return p
 
-def encode_lt(input_strings, num_symbols, indexcarrylength, ninputlength):
+def xor_symbols(rows, lengths, neighbours):
+    """
+    XOR the packed source rows of every encoded symbol.
+
+    :param rows: np.uint8 matrix with the packed bits of the source strings (see bitstrings_to_rows).
+    :param lengths: Bit lengths of the source strings.
+    :param neighbours: List with the (non-empty) list of source indices of every encoded symbol.
+    :return: Tuple of (np.uint8 matrix with one packed row per symbol, np.int64 array of their lengths);
+        like a character-wise XOR, a symbol is as long as its shortest source.
+    """
+    if not neighbours:
+        return np.zeros((0, rows.shape[1]), dtype=np.uint8), np.zeros(0, dtype=np.int64)
+    flat = np.fromiter((idx for indices in neighbours for idx in indices), dtype=np.int64)
+    starts = np.zeros(len(neighbours), dtype=np.int64)
+    np.cumsum([len(indices) for indices in neighbours[:-1]], out=starts[1:])
+    return np.bitwise_xor.reduceat(rows[flat], starts, axis=0), np.minimum.reduceat(lengths[flat], starts)
+
+
+def alias_table(p):
+    """
+    Alias table of a discrete distribution (Vose's method), to draw from it in O(1) per sample.
+
+    :param p: Probabilities of the outcomes 0, ..., len(p) - 1.
+    :return: Tuple of (np.float64 array with the probability to keep an outcome, np.int64 array with
+        the outcome taken otherwise).
+    """
+    k = len(p)
+    scaled = (np.asarray(p, dtype=float) * k / np.sum(p)).tolist()
+    probability = np.ones(k)
+    alias = np.arange(k)
+    small = [i for i in range(k) if scaled[i] < 1]
+    large = [i for i in range(k) if scaled[i] >= 1]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probability[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1 - scaled[less]
+        (small if scaled[more] < 1 else large).append(more)
+    # the outcomes left over are 1 up to rounding and keep probability 1
+    return probability, alias
+
+
+def sample_alias(rng, probability, alias, size):
+    """Draw size outcomes from an alias table (see alias_table) with the np.random.Generator rng."""
+    outcomes = rng.integers(len(probability), size=size)
+    return np.where(rng.random(size) < probability[outcomes], outcomes, alias[outcomes])
+
+
+def sample_neighbours(rng, degrees, ninput):
+    """
+    Distinct source indices of every encoded symbol.
+
+    The indices of all symbols are drawn at once and the symbols with a repeated index are drawn
+    again. Symbols that still repeat an index after MAX_NEIGHBOUR_ROUNDS (degrees close to ninput)
+    take the first indices of a random permutation.
+
+    :param rng: np.random.Generator.
+    :param degrees: np.int64 array with the (positive) degree of every symbol.
+    :param ninput: Number of source strings.
+    :return: np.int64 matrix with one row per symbol, the sorted indices of a symbol in its first
+        degree columns and ninput in the others.
+    """
+    width = int(degrees.max()) if len(degrees) else 0
+    padding = np.arange(width) >= degrees[:, None]
+    indices = np.empty((len(degrees), width), dtype=np.int64)
+    pending = np.arange(len(degrees))
+    for _ in range(MAX_NEIGHBOUR_ROUNDS):
+        if not len(pending):
+            break
+        draws = np.where(padding[pending], ninput, rng.integers(ninput, size=(len(pending), width)))
+        draws.sort(axis=1)
+        indices[pending] = draws
+        repeated = ((draws[:, 1:] == draws[:, :-1]) & (draws[:, 1:] < ninput)).any(axis=1)
+        pending = pending[repeated]
+    for row in pending.tolist():
+        indices[row, :degrees[row]] = np.sort(rng.permutation(ninput)[:degrees[row]])
+    return indices
+
+
+def pack_indices(indices, ninput, bits, length):
+    """
+    Index parts of the encoded symbols.
+
+    :param indices: Matrix of the neighbours of the symbols (see sample_neighbours).
+    :param ninput: Number of source strings, the padding value of indices.
+    :param bits: Number of bits of one index.
+    :param length: Number of bits of an index part, at least bits times the width of indices.
+    :return: List of bitstrings; the indices of a symbol in decreasing order, as bits wide fields
+        padded with zeros on the left to length bits (as translate_and_join).
+    """
+    # The padding columns come first and are zero fields
+    fields = np.where(indices < ninput, indices, 0)[:, ::-1]
+    shifts = np.arange(bits - 1, -1, -1)
+    width = fields.shape[1] * bits
+    header = np.zeros((len(indices), length), dtype=np.uint8)
+    header[:, length - width:] = ((fields[:, :, None] >> shifts) & 1).reshape(len(indices), width)
+    text = bits_to_bitstring(header.ravel())
+    return [text[i:i + length] for i in range(0, len(text), length)]
+
+
+def encode_lt(input_strings, num_symbols, indexcarrylength, ninputlength, seed=None):
+    """
+    LT encoding of bitstrings with the robust soliton degree distribution.
+
+    An encoded symbol is the number of inputs (ninputlength bits), the XOR of its chosen inputs and
+    their indices (indexcarrylength bits, see pack_indices).
+
+    :param input_strings: List of bitstrings.
+    :param num_symbols: Number of encoded symbols.
+    :param indexcarrylength: Number of bits of the indices of a symbol, limits its degree.
+    :param ninputlength: Number of bits of the number of inputs.
+    :param seed: Optional seed. Without a seed, the generator is seeded from the global
+        np.random state, so that np.random.seed keeps controlling the encoding.
+    :return: List of the encoded symbols as bitstrings.
+    """
     ninput = len(input_strings)
 
     
@@ -80,23 +202,200 @@ def encode_lt(input_strings, num_symbols, indexcarrylength, ninputlength):
     max_degree = m.floor(indexcarrylength / howmanybitsforoneindex)
     if max_degree == 0:
         raise ValueError("Index carry length is too small to encode any indices.")
-    p = robust_soliton_distribution(ninput, max_degree=max_degree)
-    encoded_symbols = []
-    for _ in range(num_symbols):
-        degree = np.random.choice(np.arange(1, ninput + 1), p=p)
-        chosen_indices = random.sample(range(ninput), min(degree, max_degree))
-        chosen_indices.sort(reverse=True)
-        chosen_indices_binary = translate_and_join(chosen_indices, howmanybitsforoneindex)
-        if len(chosen_indices_binary) < indexcarrylength:
-            chosen_indices_binary = '0' * (indexcarrylength - len(chosen_indices_binary)) + chosen_indices_binary
-        encoded_symbol = input_strings[chosen_indices[0]]
-    
-        for idx in chosen_indices[1:]:
-            encoded_symbol = ''.join(str(int(a) ^ int(b)) for a, b in zip(encoded_symbol, input_strings[idx]))
+    if seed is None:
+        seed = np.random.randint(0, 2**32 - 1, dtype=np.int64)
+    rng = np.random.default_rng(seed)
+
+    # All degrees at once from the alias table of the degrees 1, ..., min(max_degree, ninput)
+    p = robust_soliton_distribution(ninput, max_degree=max_degree)[:max_degree]
+    degrees = sample_alias(rng, *alias_table(p), num_symbols) + 1
+    indices = sample_neighbours(rng, degrees, ninput)
+    headers = pack_indices(indices, ninput, howmanybitsforoneindex, indexcarrylength)
+    neighbours = [row[:degree] for row, degree in zip(indices.tolist(), degrees.tolist())]
+
+    # XOR the chosen inputs of all symbols at once on the packed bits
+    rows, lengths = bitstrings_to_rows(input_strings)
+    encoded_symbols = rows_to_bitstrings(*xor_symbols(rows, lengths, neighbours))
+
+    return [ninputrember + encoded_symbol + header for encoded_symbol, header in zip(encoded_symbols, headers)]
+
+
+def masks_to_rows(masks, width):
+    """
+    Bit masks (Python ints) as rows of a bit matrix, bit c of a mask in column c.
+
+    :param masks: List of non-negative ints below 2 ** width.
+    :param width: Number of columns.
+    :return: np.uint8 matrix of shape (len(masks), width) with 0/1 entries.
+    """
+    nbytes = (width + 7) // 8
+    packed = np.frombuffer(b''.join(mask.to_bytes(nbytes, 'little') for mask in masks), dtype=np.uint8)
+    return np.unpackbits(packed.reshape(len(masks), nbytes), axis=1, bitorder='little')[:, :width]
+
+
+def solve_gf2(coefficients, rhs, rhs_lengths):
+    """
+    Gauss-Jordan elimination over GF(2).
+
+    :param coefficients: np.uint8 matrix (equations x unknowns) with 0/1 entries.
+    :param rhs: np.uint8 matrix with the packed right hand side of every equation.
+    :param rhs_lengths: Bit lengths of the right hand sides; a combination of equations is as long
+        as the shortest of them.
+    :return: Tuple of (boolean array of the determined unknowns, np.uint8 matrix of their values,
+        np.int64 array of their lengths).
+    """
+    n_unknowns = coefficients.shape[1]
+    width = (n_unknowns + 7) // 8
+    system = np.hstack([np.packbits(coefficients, axis=1), rhs])
+    rhs_lengths = np.array(rhs_lengths, dtype=np.int64)
+
+    pivots = []
+    for c in range(n_unknowns):
+        row = len(pivots)
+        if row == len(system):
+            break
+        byte, bit = c >> 3, np.uint8(0x80 >> (c & 7))
+        candidates = np.flatnonzero(system[row:, byte] & bit)
+        if not len(candidates):
+            continue
+        pivot = row + candidates[0]
+        system[[row, pivot]] = system[[pivot, row]]
+        rhs_lengths[[row, pivot]] = rhs_lengths[[pivot, row]]
+        others = np.flatnonzero(system[:, byte] & bit)
+        others = others[others != row]
+        system[others] ^= system[row]
+        rhs_lengths[others] = np.minimum(rhs_lengths[others], rhs_lengths[row])
+        pivots.append((c, row))
+
+    # An unknown is determined if its pivot row has no other unknown left
+    determined = np.zeros(n_unknowns, dtype=bool)
+    values = np.zeros((n_unknowns, rhs.shape[1]), dtype=np.uint8)
+    lengths = np.zeros(n_unknowns, dtype=np.int64)
+    for c, row in pivots:
+        if np.unpackbits(system[row, :width]).sum() == 1:
+            determined[c] = True
+            values[c] = system[row, width:]
+            lengths[c] = rhs_lengths[row]
+    return determined, values, lengths
+
+
+def peel_lt(neighbours, symbols, lengths, n_sources, max_inactive=None):
+    """
+    Peeling (belief-propagation) decoding of an LT code with inactivation.
+
+    Symbols whose sources are all known but one are kept in a queue; decoding that source lowers
+    the degree of the symbols in its adjacency list, so every symbol is touched once per source.
+    When the queue runs empty, a source of a symbol with two unknown sources is inactivated: it is
+    carried as an unknown and the sources decoded afterwards are stored as their value XOR a set
+    (bit mask) of inactive sources. Finally the inactive sources are solved from the unused symbols
+    by Gaussian elimination over GF(2) and substituted back.
+
+    :param neighbours: List with the source indices of every encoded symbol (no duplicates).
+    :param symbols: np.uint8 matrix with the packed bits of the encoded symbols.
+    :param lengths: Bit lengths of the encoded symbols.
+    :param n_sources: Number of source strings.
+    :param max_inactive: Largest number of inactive sources (defaults to MAX_INACTIVE_SOURCES).
+    :return: Tuple of (np.uint8 matrix of the decoded sources, np.int64 array of their lengths,
+        boolean array of the decoded sources).
+    """
+    if max_inactive is None:
+        max_inactive = MAX_INACTIVE_SOURCES
+    values = np.zeros((n_sources, symbols.shape[1]), dtype=np.uint8)
+    value_lengths = np.zeros(n_sources, dtype=np.int64)
+    resolved = np.zeros(n_sources, dtype=bool)
+    masks = [0] * n_sources
+    inactive = {}
+
+    adjacency = [[] for _ in range(n_sources)]
+    degrees = []
+    # XOR of the indices of the unknown sources, i.e. the last one once the degree is 1
+    unknown = []
+    for j, indices in enumerate(neighbours):
+        code = 0
+        for idx in indices:
+            adjacency[idx].append(j)
+            code ^= idx
+        degrees.append(len(indices))
+        unknown.append(code)
+    used = [False] * len(neighbours)
+    queue = deque(j for j, degree in enumerate(degrees) if degree == 1)
+    pairs = deque(j for j, degree in enumerate(degrees) if degree == 2)
+
+    def combine(j):
+        """Symbol j XOR its decoded sources: value, length and mask of the inactive sources left."""
+        value, length, mask = symbols[j], lengths[j], 0
+        decoded = [idx for idx in neighbours[j] if resolved[idx]]
+        if decoded:
+            value = value ^ np.bitwise_xor.reduce(values[decoded], axis=0)
+            length = min(length, value_lengths[decoded].min())
+            for idx in decoded:
+                mask ^= masks[idx]
+        for idx in neighbours[j]:
+            if idx in inactive:
+                mask ^= 1 << inactive[idx]
+        return value, length, mask
+
+    def eliminate(source):
+        for k in adjacency[source]:
+            degrees[k] -= 1
+            unknown[k] ^= source
+            if degrees[k] == 1:
+                queue.append(k)
+            elif degrees[k] == 2:
+                pairs.append(k)
+
+    while True:
+        while queue:
+            j = queue.popleft()
+            if degrees[j] != 1:
+                continue
+            source = unknown[j]
+            values[source], value_lengths[source], masks[source] = combine(j)
+            resolved[source] = True
+            used[j] = True
+            eliminate(source)
+
+        # Peeling stalled, inactivate the better connected source of a symbol with two unknowns
+        if len(inactive) >= max_inactive:
+            break
+        while pairs and degrees[pairs[0]] != 2:
+            pairs.popleft()
+        if pairs:
+            j = pairs.popleft()
+        else:
+            pending = [j for j, degree in enumerate(degrees) if degree > 1]
+            if not pending:
+                break
+            j = min(pending, key=degrees.__getitem__)
+        source = max((idx for idx in neighbours[j] if not resolved[idx] and idx not in inactive),
+                     key=lambda idx: len(adjacency[idx]))
+        inactive[source] = len(inactive)
+        eliminate(source)
+
+    if inactive:
+        # The unused symbols are equations in the inactive sources
+        equations = [j for j, degree in enumerate(degrees) if degree == 0 and not used[j]]
+        combined = [combine(j) for j in equations]
+        rhs = np.array([value for value, _, _ in combined], dtype=np.uint8).reshape(len(combined), symbols.shape[1])
+        determined, inactive_values, inactive_lengths = solve_gf2(
+            masks_to_rows([mask for _, _, mask in combined], len(inactive)), rhs,
+            [length for _, length, _ in combined])
+
+        sources = np.array(list(inactive), dtype=np.int64)
+        values[sources[determined]] = inactive_values[determined]
+        value_lengths[sources[determined]] = inactive_lengths[determined]
+        resolved[sources[determined]] = True
+
+        # Substitute the inactive sources into the sources decoded after them
+        dependencies = masks_to_rows(masks, len(inactive))
+        for c in np.flatnonzero(determined).tolist():
+            rows = np.flatnonzero(dependencies[:, c])
+            values[rows] ^= inactive_values[c]
+            value_lengths[rows] = np.minimum(value_lengths[rows], inactive_lengths[c])
+        resolved &= ~dependencies[:, ~determined].any(axis=1)
+
+    return values, value_lengths, resolved
 
-        encoded_symbols.append(ninputrember + encoded_symbol + chosen_indices_binary)
-        
-    return encoded_symbols
 
 def decode_lt(encoded_symbols, indexcarrylength, ninputlength):
     
@@ -120,55 +419,32 @@ def decode_lt(encoded_symbols, indexcarrylength, ninputlength):
             f"This likely indicates data corruption in the LT code header."
         )
     
-    decoded_strings = [None] * howmanyaretheredec
-    unresolved_symbols = set(range(howmanyaretheredec))
     howmanybitsforoneindex = int(m.ceil(m.log2(howmanyaretheredec)))
     if howmanybitsforoneindex == 0:
         raise ValueError("LTcode header has been corrupted and cannot determine the original amount of messages.")
     
-    encoding_struc = []
+    neighbours = []
+    main_encoded_symbols = []
     for symbols in encoded_symbols:
         howmanyaretherenotuse, main_encoded_symbol, indices_part = split_encoded_symbol(symbols, ninputlength, indexcarrylength)
         indecesinlist = split_binary_string_from_back(indices_part, howmanybitsforoneindex)
         chosen_indicesa = remove_zeros_after_last_non_zero([int(idx, 2) for idx in indecesinlist])
         if all(chosen_indicesa[idx] < howmanyaretheredec for idx in range(len(chosen_indicesa))):
-            
-            encoding_struc.append((chosen_indicesa, main_encoded_symbol))
+            # an index that occurs twice cancels out
+            neighbours.append([idx for idx, count in Counter(chosen_indicesa).items() if count % 2])
+            main_encoded_symbols.append(main_encoded_symbol)
 
     try:
-        while unresolved_symbols:
-            progress = False
-            new_encoded_symbols = []
-
-            for chosen_indices, encoded_symbol in encoding_struc:
-                if len(chosen_indices) == 1 and chosen_indices[0] in unresolved_symbols:
-                    decoded_strings[chosen_indices[0]] = encoded_symbol
-                    unresolved_symbols.remove(chosen_indices[0])
-                    progress = True
-                else:
-                    for idx in chosen_indices:
-                        if len(decoded_strings) < idx:
-                            raise ValueError("Data to currupted to decode.")
-                        if decoded_strings[idx] is not None:
-                            encoded_symbol = ''.join(str(int(a) ^ int(b)) for a, b in zip(encoded_symbol, decoded_strings[idx]))
-                    chosen_indices = [idx for idx in chosen_indices if decoded_strings[idx] is None]
-                    if chosen_indices:
-                        new_encoded_symbols.append((chosen_indices, encoded_symbol))
-
-            encoding_struc = new_encoded_symbols
-
-            if not progress:
-                break
+        symbols, lengths = bitstrings_to_rows(main_encoded_symbols)
+        values, value_lengths, resolved = peel_lt(neighbours, symbols, lengths, howmanyaretheredec)
             
     except:
         #logger.info('Decoding failed: Too many errors in header of fountaincode in every codeword.', exc_info=True)
         raise ValueError("Data likely to currupted from errorchenels to decode. Either too little redundancey try increasing it or the ratio codewordlenth to dna_barcode_length, lt_header and/or index_carry_length is to little.")
         # return [x for x in decoded_strings if x is not None], False
 
-    if None in decoded_strings:
+    if not resolved.all():
         #logger.info('Decoding failed: Either too many errors in header of fountaincode in every codeword or too many lost codewords.')
         raise ValueError("Data likely to currupted from errorchenels to decode. Either too little redundancey try increasing it or the ratio codewordlenth to dna_barcode_length, lt_header and/or index_carry_length is to little.")
 
-    return decoded_strings, True
-
-
+    return rows_to_bitstrings(values, value_lengths), True
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class GF256int(int):
     """Instances of this object are elements of the field GF(2^8)
     Instances are integers in the range 0 to 255
@@ -118,4 +121,40 @@ class GF256int(int):
             p = p << 1
             if p & 0x100: p = p ^ 0x11b
 
-        return GF256int(r)
\ No newline at end of file
+        return GF256int(r)
+
+
+# Table-driven GF(2^8) arithmetic on np.uint8 arrays, with the field and generator of GF256int.
+# Products are looked up in a 256x256 table, so a whole array of products is a single indexing
+# operation instead of one GF256int object per value.
+
+# Antilog table repeated once, so sums of two logs need no modulo
+EXP = np.array(GF256int.exptable[:255] * 2, dtype=np.uint8)
+# Logarithm table, LOG[0] is a placeholder (0 has no logarithm)
+LOG = np.array((0,) + GF256int.logtable[1:], dtype=np.int64)
+
+_nonzero = np.arange(1, 256)
+MUL = np.zeros((256, 256), dtype=np.uint8)
+MUL[1:, 1:] = EXP[LOG[_nonzero][:, None] + LOG[_nonzero][None, :]]
+# Multiplicative inverses, INV[0] is a placeholder
+INV = np.zeros(256, dtype=np.uint8)
+INV[1:] = EXP[(255 - LOG[_nonzero]) % 255]
+
+
+def gf_mul(a, b):
+    """Elementwise product of two broadcastable arrays of field elements."""
+    return MUL[np.asarray(a, dtype=np.uint8), np.asarray(b, dtype=np.uint8)]
+
+
+def gf_inverse(a):
+    """Elementwise inverse of nonzero field elements."""
+    a = np.asarray(a, dtype=np.uint8)
+    if np.any(a == 0):
+        raise ZeroDivisionError("0 has no inverse in GF(2^8)")
+    return INV[a]
+
+
+def gf_pow(a, power):
+    """Elementwise power of field elements, negative powers are powers of the inverse (0 ** power is 0)."""
+    a = np.asarray(a, dtype=np.uint8)
+    return np.where(a != 0, EXP[(LOG[a] * np.asarray(power)) % 255], np.uint8(0))
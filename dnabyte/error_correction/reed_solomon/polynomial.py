@@ -1,6 +1,10 @@
 
 from io import StringIO
 
+import numpy as np
+
+from dnabyte.error_correction.reed_solomon.ff import EXP, LOG, MUL, INV
+
 class Polynomial(object):
     """Completely general polynomial class.
     
@@ -197,4 +201,81 @@ class Polynomial(object):
         if degree > self.degree():
             return 0
         else:
-            return self.coefficients[-(degree+1)]
\ No newline at end of file
+            return self.coefficients[-(degree+1)]
+
+
+# Polynomials over GF(2^8) as np.uint8 arrays of coefficients in order of decreasing power, like
+# Polynomial.coefficients. Unlike Polynomial, leading zeros are kept, so the lengths of the
+# results only depend on the lengths of the arguments.
+
+def poly_add(p, q):
+    """Sum (and difference) of two polynomials, aligned at the constant term."""
+    p, q = np.asarray(p, dtype=np.uint8), np.asarray(q, dtype=np.uint8)
+    if len(p) < len(q):
+        p, q = q, p
+    result = p.copy()
+    result[len(p) - len(q):] ^= q
+    return result
+
+
+def poly_scale(p, x):
+    """Product of a polynomial and a field element."""
+    return MUL[np.asarray(p, dtype=np.uint8), x]
+
+
+def poly_mul(p, q):
+    """Product of two polynomials, the products of all pairs of coefficients are one table lookup."""
+    p, q = np.asarray(p, dtype=np.uint8), np.asarray(q, dtype=np.uint8)
+    result = np.zeros(max(len(p) + len(q) - 1, 0), dtype=np.uint8)
+    powers = np.arange(len(p))[:, None] + np.arange(len(q))[None, :]
+    np.bitwise_xor.at(result, powers.ravel(), MUL[p[:, None], q[None, :]].ravel())
+    return result
+
+
+def poly_divmod(dividend, divisor):
+    """
+    Quotient and remainder of a polynomial division by synthetic division.
+
+    :param dividend: Coefficients of the dividend.
+    :param divisor: Coefficients of the divisor, the leading coefficient must not be 0.
+    :return: Tuple of (quotient with len(dividend) - len(divisor) + 1 coefficients,
+        remainder with len(divisor) - 1 coefficients).
+    """
+    dividend, divisor = np.asarray(dividend, dtype=np.uint8), np.asarray(divisor, dtype=np.uint8)
+    if not len(divisor) or divisor[0] == 0:
+        raise ZeroDivisionError("The leading coefficient of the divisor must not be 0")
+    degree = len(divisor) - 1
+    if len(dividend) <= degree:
+        return np.zeros(0, dtype=np.uint8), np.concatenate((np.zeros(degree - len(dividend), dtype=np.uint8), dividend))
+    out = dividend.copy()
+    inverse = INV[divisor[0]]
+    tail = divisor[1:]
+    for i in range(len(dividend) - degree):
+        coefficient = MUL[out[i], inverse]
+        out[i] = coefficient
+        if coefficient:
+            out[i + 1:i + 1 + degree] ^= MUL[tail, coefficient]
+    return out[:len(out) - degree], out[len(out) - degree:]
+
+
+def poly_eval(p, x):
+    """
+    Value of a polynomial at every point of x.
+
+    All terms c_i x^i are computed at once from the log tables and summed (XOR) per point.
+    """
+    p = np.asarray(p, dtype=np.uint8)
+    x = np.asarray(x, dtype=np.uint8)
+    points = x.reshape(-1)
+    powers = np.arange(len(p) - 1, -1, -1)[:, None]
+    logs = (LOG[p][:, None] + LOG[points][None, :] * powers) % 255
+    nonzero = (p[:, None] != 0) & ((points[None, :] != 0) | (powers == 0))
+    terms = np.where(nonzero, EXP[logs], np.uint8(0))
+    return np.bitwise_xor.reduce(terms, axis=0).reshape(x.shape)
+
+
+def poly_strip(p):
+    """Coefficients without the leading zeros, (0,) for the zero polynomial as in Polynomial."""
+    p = np.asarray(p, dtype=np.uint8)
+    nonzero = np.flatnonzero(p)
+    return p[nonzero[0]:] if len(nonzero) else np.zeros(1, dtype=np.uint8)
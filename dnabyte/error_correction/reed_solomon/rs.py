@@ -1,5 +1,10 @@
-from ff import GF256int
-from polynomial import Polynomial
+import numpy as np
+
+from dnabyte.error_correction.codec_registry import table_generator_polynomials
+from dnabyte.error_correction.reed_solomon.ff import GF256int, EXP, LOG, MUL, gf_inverse, gf_pow
+from dnabyte.error_correction.reed_solomon.polynomial import (
+    Polynomial, poly_add, poly_divmod, poly_eval, poly_scale, poly_strip
+)
 
 """This module implements Reed-Solomon Encoding.
 It supports arbitrary configurations for n and k, the codeword length and
@@ -33,6 +38,8 @@ class RSCoder(object):
         The code will have error correcting power s where 2s = n - k
 
         The typical RSCoder is RSCoder(255, 223)
+
+        Polynomials are np.uint8 arrays of coefficients (see polynomial.poly_mul)
         """
         if n < 0 or k < 0:
             raise ValueError("n and k must be positive")
@@ -44,21 +51,10 @@ class RSCoder(object):
         self.n = n
         self.k = k
 
-        # Generate the generator polynomial for RS codes
-        # g(x) = (x-α^1)(x-α^2)...(x-α^(n-k))
-        # α is 3, a generator for GF(2^8)
-        g = Polynomial((GF256int(1),))
-        for alpha in range(1,n-k+1):
-            p = Polynomial((GF256int(1), GF256int(3)**alpha))
-            g = g * p
-        self.g = g
-
-        # h(x) = (x-α^(n-k+1))...(x-α^n)
-        h = Polynomial((GF256int(1),))
-        for alpha in range(n-k+1,n+1):
-            p = Polynomial((GF256int(1), GF256int(3)**alpha))
-            h = h * p
-        self.h = h
+        # Generator polynomial for RS codes g(x) = (x-α^1)(x-α^2)...(x-α^(n-k))
+        # and h(x) = (x-α^(n-k+1))...(x-α^n), α is 3, a generator for GF(2^8)
+        # (built once per process, see codec_registry)
+        self.g, self.h = table_generator_polynomials(n, k)
 
         # g*h is used in verification, and is always x^n-1
         # TODO: This is hardcoded for (255,223)
@@ -68,7 +64,10 @@ class RSCoder(object):
     def encode(self, message, poly=False):
         """Encode a given string with reed-solomon encoding. Returns a byte
         string with the k message bytes and n-k parity bytes at the end.
-        
+
+        The message is a sequence of base 4 digits, every 4 digits are one
+        message byte.
+
         If a message is < k bytes long, it is assumed to be padded at the front
         with null bytes.
 
@@ -79,42 +78,30 @@ class RSCoder(object):
         """
         n = self.n
         k = self.k
-        
+
         if (len(message))>k*4:
             raise ValueError("Message length is max %d. Message was %d" % (k,
                 len(message)))
 
         # Encode message as a polynomial:
-        #m = Polynomial(GF256int(ord(x)) for x in message)
-        mtemp=0
-        coefs=[]
-        
-        for i in range(0,len(message),4):
-            mtemp=0
-            for j in range(4):
-                mtemp=int(float(str(mtemp)+str(message[i+j])))
-            mtemp=int(str(int(float(mtemp))),4)    
-            coefs.append(mtemp)
-        m = Polynomial(GF256int(x) for x in coefs)
-        
-        
-        # Shift polynomial up by n-k by multiplying by x^(n-k)
-        mprime = m * Polynomial((GF256int(1),) + (GF256int(0),)*(n-k))
+        m = np.array([int(''.join(str(digit) for digit in message[i:i+4]), 4)
+                      for i in range(0, len(message), 4)], dtype=np.uint8)
 
+        # Shift polynomial up by n-k by multiplying by x^(n-k)
         # mprime = q*g + b for some q
         # so let's find b:
-        b = mprime % self.g
+        b = poly_divmod(np.concatenate((m, np.zeros(n-k, dtype=np.uint8))), self.g)[1]
 
         # Subtract out b, so now c = q*g
-        c = mprime - b
+        c = np.concatenate((m, b))
         # Since c is a multiple of g, it has (at least) n-k roots: α^1 through
         # α^(n-k)
 
         if poly:
-            return c
+            return Polynomial(GF256int(x) for x in c.tolist())
 
         # Turn the polynomial c back into a byte string
-        return "".join(chr(x) for x in c.coefficients).rjust(n, "\0")
+        return "".join(chr(x) for x in poly_strip(c).tolist()).rjust(n, "\0")
 
 
     def verify(self, code):
@@ -122,19 +109,11 @@ class RSCoder(object):
         code divides g
         returns True/False
         """
-        n = self.n
-        k = self.k
-        h = self.h
-        g = self.g
-
-        c = Polynomial(GF256int(ord(x)) for x in code)
-
-        # This works too, but takes longer. Both checks are just as valid.
-        #return (c*h)%gtimesh == Polynomial(x0=0)
+        c = np.array([ord(x) for x in code], dtype=np.uint8)
 
         # Since all codewords are multiples of g, checking that code divides g
         # suffices for validating a codeword.
-        return c % g == Polynomial(x0=0)
+        return not poly_divmod(c, self.g)[1].any()
 
 
     def decode(self, r, nostrip=False):
@@ -151,19 +130,18 @@ class RSCoder(object):
         n = self.n
         k = self.k
 
-        if self.verify(r):
+        # Turn r into a polynomial
+        received = np.array([ord(x) for x in r], dtype=np.uint8)
+
+        # Compute the syndromes, a valid codeword has none
+        sz = self._syndromes(received)
+        if not sz.any():
             # The last n-k bytes are parity
             if nostrip:
                 return r[:-(n-k)]
             else:
                 return r[:-(n-k)].lstrip("\0")
 
-        # Turn r into a polynomial
-        r = Polynomial(GF256int(ord(x)) for x in r)
-
-        # Compute the syndromes:
-        sz = self._syndromes(r)
-
         # Find the error locator polynomial and error evaluator polynomial
         # using the Berlekamp-Massey algorithm
         sigma, omega = self._berlekamp_massey(sz)
@@ -180,47 +158,35 @@ class RSCoder(object):
         Y = self._forney(omega, X)
 
         # Put the error and locations together to form the error polynomial
-        Elist = []
-        for i in range(255):
-            if i in j:
-                Elist.append(Y[j.index(i)])
-            else:
-                Elist.append(GF256int(0))
-        E = Polynomial(reversed(Elist))
+        E = np.zeros(255, dtype=np.uint8)
+        E[254 - j] = Y
 
         # And we get our real codeword!
-        c = r - E
+        c = poly_strip(poly_add(received, E))
 
         # Form it back into a string and return all but the last n-k bytes
-        ret = "".join(chr(x) for x in c.coefficients[:-(n-k)])
-        #                                            :-(
+        ret = "".join(chr(x) for x in c.tolist()[:-(n-k)])
 
         if nostrip:
-            # Polynomial objects don't store leading 0 coefficients, so we
-            # actually need to pad this to k bytes
+            # Leading 0 coefficients are stripped, so we actually need to pad
+            # this to k bytes
             return ret.rjust(k, "\0")
         else:
             return ret
 
 
     def _syndromes(self, r):
-        """Given the received codeword r in the form of a Polynomial object,
-        computes the syndromes and returns the syndrome polynomial
+        """Given the received codeword r as an array of coefficients, computes
+        the syndromes and returns the syndrome polynomial
         """
         n = self.n
         k = self.k
 
         # s[l] is the received codeword evaluated at α^l for 1 <= l <= s
         # α in this implementation is 3
-        s = [GF256int(0)] # s[0] is 0 (coefficient of z^0)
-        for l in range(1, n-k+1):
-            s.append( r.evaluate( GF256int(3)**l ) )
-
-        # Now build a polynomial out of all our s[l] values
-        # s(z) = sum(s_i * z^i, i=1..inf)
-        sz = Polynomial( reversed( s ) )
-
-        return sz
+        # s(z) = sum(s_i * z^i, i=1..inf), s[0] is 0 (coefficient of z^0)
+        s = poly_eval(r, EXP[np.arange(1, n-k+1) % 255])
+        return np.append(s[::-1], np.uint8(0))
 
 
     def _berlekamp_massey(self, s):
@@ -254,73 +220,49 @@ class RSCoder(object):
         k = self.k
 
         # Initialize:
-        sigma =  [ Polynomial((GF256int(1),)) ]
-        omega =  [ Polynomial((GF256int(1),)) ]
-        tao =    [ Polynomial((GF256int(1),)) ]
-        gamma =  [ Polynomial((GF256int(0),)) ]
-        D =      [ 0 ]
-        B =      [ 0 ]
-
-        # Polynomial constants:
-        ONE = Polynomial(z0=GF256int(1))
-        ZERO = Polynomial(z0=GF256int(0))
-        Z = Polynomial(z1=GF256int(1))
-        
+        sigma = np.ones(1, dtype=np.uint8)
+        omega = np.ones(1, dtype=np.uint8)
+        tao = np.ones(1, dtype=np.uint8)
+        gamma = np.zeros(1, dtype=np.uint8)
+        D = 0
+        B = 0
+
+        # 1 + s, the coefficients of z^0 .. z^(n-k) in increasing order
+        one_plus_s = poly_add(s, [1])[::-1]
+
         # Iteratively compute the polynomials 2s times. The last ones will be
         # correct
         for l in range(0, n-k):
             # Goal for each iteration: Compute sigma[l+1] and omega[l+1] such that
             # (1 + s)*sigma[l] == omega[l] in mod z^(l+1)
 
-            # For this particular loop iteration, we have sigma[l] and omega[l],
-            # and are computing sigma[l+1] and omega[l+1]
-            
             # First find Delta, the non-zero coefficient of z^(l+1) in
             # (1 + s) * sigma[l]
             # This delta is valid for l (this iteration) only
-            Delta = ( (ONE + s) * sigma[l] ).get_coefficient(l+1)
-            # Make it a polynomial of degree 0
-            Delta = Polynomial(x0=Delta)
+            terms = min(len(sigma), l + 2)
+            Delta = np.bitwise_xor.reduce(MUL[sigma[len(sigma) - terms:], one_plus_s[l + 2 - terms:l + 2]])
 
             # Can now compute sigma[l+1] and omega[l+1] from
             # sigma[l], omega[l], tao[l], gamma[l], and Delta
-            sigma.append( sigma[l] - Delta * Z * tao[l] )
-            omega.append( omega[l] - Delta * Z * gamma[l] )
+            next_sigma = poly_add(sigma, poly_scale(np.append(tao, np.uint8(0)), Delta))
+            next_omega = poly_add(omega, poly_scale(np.append(gamma, np.uint8(0)), Delta))
 
             # Now compute the next tao and gamma
             # There are two ways to do this
-            if Delta == ZERO or 2*D[l] > (l+1):
+            if Delta == 0 or 2*D > (l+1) or (2*D == (l+1) and B == 0):
                 # Rule A
-                D.append( D[l] )
-                B.append( B[l] )
-                tao.append( Z * tao[l] )
-                gamma.append( Z * gamma[l] )
-
-            elif Delta != ZERO and 2*D[l] < (l+1):
-                # Rule B
-                D.append( l + 1 - D[l] )
-                B.append( 1 - B[l] )
-                tao.append( sigma[l] // Delta )
-                gamma.append( omega[l] // Delta )
-            elif 2*D[l] == (l+1):
-                if B[l] == 0:
-                    # Rule A (same as above)
-                    D.append( D[l] )
-                    B.append( B[l] )
-                    tao.append( Z * tao[l] )
-                    gamma.append( Z * gamma[l] )
-
-                else:
-                    # Rule B (same as above)
-                    D.append( l + 1 - D[l] )
-                    B.append( 1 - B[l] )
-                    tao.append( sigma[l] // Delta )
-                    gamma.append( omega[l] // Delta )
+                tao = np.append(tao, np.uint8(0))
+                gamma = np.append(gamma, np.uint8(0))
             else:
-                raise Exception("Code shouldn't have gotten here")
-
+                # Rule B
+                D = l + 1 - D
+                B = 1 - B
+                inverse = gf_inverse(Delta)
+                tao = poly_scale(sigma, inverse)
+                gamma = poly_scale(omega, inverse)
+            sigma, omega = next_sigma, next_omega
 
-        return sigma[-1], omega[-1]
+        return poly_strip(sigma), poly_strip(omega)
 
 
     def _chien_search(self, sigma):
@@ -328,27 +270,18 @@ class RSCoder(object):
         function evaluates sigma at all 255 non-zero points to find the roots
         The inverse of the roots are X_i, the error locations
 
-        Returns a list X of error locations, and a corresponding list j of
+        Returns an array X of error locations, and a corresponding array j of
         error positions (the discrete log of the corresponding X value) The
-        lists are up to s elements large.
+        arrays are up to s elements large.
 
         Important technical math note: This implementation is not actually
-        Chien's search. Chien's search is a way to evaluate the polynomial
-        such that each evaluation only takes constant time. This here simply
-        does 255 evaluations straight up, which is much less efficient.
+        Chien's search. All 255 evaluations are done at once on an array of
+        points.
         """
-        X = []
-        j = []
-        p = GF256int(3)
-        for l in range(1,256):
-            # These evaluations could be more efficient, but oh well
-            if sigma.evaluate( p**l ) == 0:
-                X.append( p**(-l) )
-                # This is different than the notes, I think the notes were in error
-                # Notes said j values were just l, when it's actually 255-l
-                j.append(255 - l)
-
-        return X, j
+        l = np.flatnonzero(poly_eval(sigma, EXP[np.arange(1, 256) % 255]) == 0) + 1
+        # This is different than the notes, I think the notes were in error
+        # Notes said j values were just l, when it's actually 255-l
+        return gf_pow(3, -l), 255 - l
 
 
     def _forney(self, omega, X):
@@ -356,27 +289,21 @@ class RSCoder(object):
         # XXX Is floor division okay here? Should this be ceiling?
         s = (self.n - self.k) // 2
 
-        Y = []
+        Y = np.zeros(len(X), dtype=np.uint8)
+        inverses = gf_inverse(X)
+        omegas = poly_eval(omega, inverses)
 
-        for l, Xl in enumerate(X):
+        for l, Xl in enumerate(X.tolist()):
             # Compute the first part of Yl
-            Yl = Xl**s
-            Yl *= omega.evaluate( Xl.inverse() )
-            Yl *= Xl.inverse()
-
-            # Compute the sequence product and multiply its inverse in
-            prod = GF256int(1)
-            for ji in range(s):
-                if ji == l:
-                    continue
-                if ji < len(X):
-                    Xj = X[ji]
-                else:
-                    Xj = GF256int(0)
-                prod = prod * (Xl - Xj)
-            Yl = Yl * prod.inverse()
-
-            Y.append(Yl)
+            Yl = MUL[MUL[gf_pow(Xl, s), omegas[l]], inverses[l]]
+
+            # Compute the sequence product and multiply its inverse in,
+            # X_j is 0 beyond the found locations
+            others = np.delete(X[:s], l) if l < s else X[:s]
+            factors = np.full(s - (l < s), Xl, dtype=np.uint8)
+            factors[:len(others)] ^= others
+            prod = EXP[LOG[factors].sum() % 255] if factors.all() else 0
+            Y[l] = MUL[Yl, gf_inverse(prod)]
         return Y
 
 if __name__ == "__main__":
@@ -1,5 +1,9 @@
 import csv
 
+import numpy as np
+
+from dnabyte.nucleotides import reverse_complement
+
 class Library:
     """
     A class to represent a DNA oligo library.
@@ -66,23 +70,16 @@ class Library:
         return messages,  generic, positions
     
     def complementmap(self, string):
-        compliment = ''
-        for i in string:
-            if i == 'A':
-                compliment += 'T'
-            if i == 'T':
-                compliment += 'A'
-            if i == 'C':
-                compliment += 'G'
-            if i == 'G':
-                compliment += 'C'
-        compliment = compliment[::-1]
-        return compliment
+        """Reverse complement of a DNA string (see dnabyte.nucleotides.reverse_complement)."""
+        return reverse_complement(string)
     
     def motive_pairs(self):
         """
         Generate motive pairs from the library data.
 
+        Motifs are deduplicated with a set of the motifs and their complements, and are registered
+        in the motif index (self.index) in sorted order.
+
         :param library: The library data.
         :return: A tuple containing left motifs, right motifs, a dictionary of motives,
              translation library for left motifs, and translation library for right motifs.
@@ -92,34 +89,30 @@ class Library:
         oligolenhalf = oligolen // 2
         leftmotifs = []
         rightmotifs = []
+        left_seen = set()
+        right_seen = set()
 
         for dna in DNAs:
             left_motif = dna[:oligolenhalf]
             right_motif = dna[oligolenhalf:]
 
-            if left_motif not in leftmotifs and self.complementmap(left_motif) not in leftmotifs:
+            if left_motif not in left_seen:
                 leftmotifs.append(left_motif)
-            if right_motif not in rightmotifs and self.complementmap(right_motif) not in rightmotifs:
-                rightmotifs.append(right_motif) 
+                left_seen.update((left_motif, self.complementmap(left_motif)))
+            if right_motif not in right_seen:
+                rightmotifs.append(right_motif)
+                right_seen.update((right_motif, self.complementmap(right_motif)))
 
         leftmotifs.sort()
         rightmotifs.sort()
 
-        translationlibleft = {}
-        translationlibright = {}
-        dictmotives = {}
-
-        for i, motif in enumerate(leftmotifs):
-            translationlibleft[motif] = chr(97 + i)
-            translationlibleft[self.complementmap(motif)] = chr(97 + i) + '*'
-            dictmotives[chr(97 + i)] = chr(97 + i) + '*'
-            dictmotives[chr(97 + i) + '*'] = chr(97 + i)
-
-        for i, motif in enumerate(rightmotifs):
-            translationlibright[motif] = chr(65 + i)
-            translationlibright[self.complementmap(motif)] = chr(65 + i) + '*'
-            dictmotives[chr(65 + i)] = chr(65 + i) + '*'
-            dictmotives[chr(65 + i) + '*'] = chr(65 + i)
+        self.index = MotifIndex()
+        left_ids = [self.index.add_pair(motif_symbol(i, 'a'), motif) for i, motif in enumerate(leftmotifs)]
+        right_ids = [self.index.add_pair(motif_symbol(i, 'A'), motif) for i, motif in enumerate(rightmotifs)]
+
+        translationlibleft = self.index.translation(left_ids)
+        translationlibright = self.index.translation(right_ids)
+        dictmotives = self.index.complements()
         
         dictmotives['empty'] = 'empty*'
         dictmotives['empty*'] = 'empty'
@@ -136,11 +129,6 @@ class Library:
              translation library for left motifs, and translation library for right motifs.
         """
 
-        messagelibleft = {}
-        message_libright = {}
-        genericlib = {}
-        connectorlib = {}
-        dictmotives = {}
         messagesleft =[]
         messagesright = []
 
@@ -152,33 +140,102 @@ class Library:
         # messagesleft.sort()
         # messagesright.sort()
 
-        for i, motif in enumerate(messagesleft):
-            messagelibleft[motif] = 'ml' + str(i)
-            messagelibleft[self.complementmap(motif)] = 'ml' + str(i) + '*'
-            dictmotives['ml' + str(i)] = 'ml' + str(i) + '*'
-            dictmotives['ml' + str(i) + '*'] = 'ml' + str(i)
-
-        for i, motif in enumerate(messagesright):
-            message_libright[motif] = 'mr' + str(i)
-            message_libright[self.complementmap(motif)] = 'mr' + str(i) + '*'
-            dictmotives['mr' + str(i)] = 'mr' + str(i) + '*'
-            dictmotives['mr' + str(i) + '*'] = 'mr' + str(i)
-
-        for i, motif in enumerate(self.generic):
-            genericlib[motif] = 'g' + str(i)
-            genericlib[self.complementmap(motif)] = 'g' + str(i) + '*'
-            dictmotives['g' + str(i)] = 'g' + str(i) + '*'
-            dictmotives['g' + str(i) + '*'] = 'g' + str(i)
-
-        for i, motif in enumerate(self.position):
-            connectorlib[motif] = 'c' + str(i)
-            connectorlib[self.complementmap(motif)] = 'c' + str(i)+ '*'
-            dictmotives['c' + str(i)] = 'c' + str(i) + '*'
-            dictmotives['c' + str(i) + '*'] = 'c' + str(i)
+        self.index = MotifIndex()
+        messagelibleft = self.index.translation(
+            [self.index.add_pair('ml' + str(i), motif) for i, motif in enumerate(messagesleft)])
+        message_libright = self.index.translation(
+            [self.index.add_pair('mr' + str(i), motif) for i, motif in enumerate(messagesright)])
+        genericlib = self.index.translation(
+            [self.index.add_pair('g' + str(i), motif) for i, motif in enumerate(self.generic)])
+        connectorlib = self.index.translation(
+            [self.index.add_pair('c' + str(i), motif) for i, motif in enumerate(self.position)])
+        dictmotives = self.index.complements()
 
         dictmotives['empty'] = 'empty*'
         dictmotives['empty*'] = 'empty'
         dictmotives[None]= None
 
         return messagelibleft, message_libright, genericlib, connectorlib, dictmotives
-        
+
+
+def motif_symbol(i, first):
+    """
+    Symbol of the i-th motif of a side: the letters from first on, followed by the round
+    (e.g. 'a', ..., 'z', 'a1', ..., 'z1', 'a2') so that the symbols stay unique past 26 motifs.
+    """
+    letter = chr(ord(first) + i % 26)
+    return letter if i < 26 else letter + str(i // 26)
+
+
+class TranslationTable(dict):
+    """
+    Dictionary translating DNA motifs to their symbols, with the reverse table (inverse)
+    computed once instead of on every back translation.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.inverse = {v: k for k, v in self.items()}
+
+
+class MotifIndex:
+    """
+    Integer ids of the motifs of a library.
+
+    Every motif is registered together with its complement: the symbol s gets the id i and
+    its reverse complement the symbol s + '*' and the id i + 1. symbols and sequences map the
+    ids to symbols and DNA, complement_ids maps every id to the id of its complement.
+    """
+
+    def __init__(self):
+        self.symbols = []
+        self.sequences = []
+        self.ids = {}
+        self._complement_ids = []
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def add_pair(self, symbol, sequence):
+        """
+        Register a motif and its complement.
+
+        :param symbol: Symbol of the motif.
+        :param sequence: DNA sequence of the motif.
+        :return: Id of the motif, its complement has the next id.
+        """
+        motif_id = len(self.symbols)
+        for offset, (name, dna) in enumerate(((symbol, sequence), (symbol + '*', reverse_complement(sequence)))):
+            if name in self.ids:
+                raise ValueError(f"Motif symbol {name} is used twice.")
+            self.ids[name] = motif_id + offset
+            self.symbols.append(name)
+            self.sequences.append(dna)
+        self._complement_ids.extend((motif_id + 1, motif_id))
+        return motif_id
+
+    @property
+    def complement_ids(self):
+        """np.ndarray with the id of the complement of every motif."""
+        return np.array(self._complement_ids, dtype=np.int64)
+
+    def complement(self, symbol):
+        """Symbol of the complement of a motif."""
+        return self.symbols[self._complement_ids[self.ids[symbol]]]
+
+    def complements(self):
+        """Dictionary mapping every symbol to the symbol of its complement."""
+        return {symbol: self.symbols[complement_id] for symbol, complement_id in zip(self.symbols, self._complement_ids)}
+
+    def translation(self, motif_ids):
+        """
+        Translation table of motifs and their complements.
+
+        :param motif_ids: Ids returned by add_pair.
+        :return: TranslationTable mapping the DNA of the motifs and their complements to their symbols.
+        """
+        table = {}
+        for motif_id in motif_ids:
+            table[self.sequences[motif_id]] = self.symbols[motif_id]
+            table[self.sequences[motif_id + 1]] = self.symbols[motif_id + 1]
+        return TranslationTable(table)
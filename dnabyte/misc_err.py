@@ -4,7 +4,7 @@ import inspect
 import random
 import math
 
-from dnabyte.data_classes.insilicodna import InSilicoDNA
+from dnabyte.data_classes.insilicodna import InSilicoDNA, simulate_channel
 
 class SimulateMiscErrors:
     
@@ -23,7 +23,7 @@ class SimulateMiscErrors:
     def simulate(self, to_error_data):
         
         if self.error_methods == None:
-            stored_data = InSilicoDNA(to_error_data.data)
+            stored_data = InSilicoDNA(to_error_data.sequences, counts=to_error_data.counts)
             info = {"number_of_strand_breaks": 0}
             return stored_data, info
         
@@ -33,11 +33,9 @@ class SimulateMiscErrors:
                 if isinstance(self.error_methods, str):
                     error_class = self.error_plugins[self.error_methods.lower()]
                     plugin = error_class(self)  # Instantiate the plugin class
-                    data_sto, info = plugin.simulate(to_error_data.data)
-                    data_sto = InSilicoDNA(data_sto)
-                    return data_sto, info
+                    return simulate_channel(plugin, to_error_data)
                 elif isinstance(self.error_methods, list):
-                    combined_data = to_error_data.data
+                    combined_data = to_error_data
                     tempconditions = self.error_params_list
                     for i, condition in enumerate(self.error_methods):
                         error_class = self.error_plugins[condition.lower()]
@@ -45,8 +43,8 @@ class SimulateMiscErrors:
                         for key, value in self.error_params.items():
                             setattr(self, key, value)
                         plugin = error_class(self)  # Instantiate the plugin class
-                        combined_data, info = plugin.simulate(combined_data)
-                    return InSilicoDNA(combined_data), info
+                        combined_data, info = simulate_channel(plugin, combined_data)
+                    return combined_data, info
             except KeyError:
                 raise ValueError(f"Error condition '{self.error_methods}' is not recognized. ")
         else:
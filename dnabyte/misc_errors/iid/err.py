@@ -1,5 +1,5 @@
-import random
 from dnabyte.misc_err import SimulateMiscErrors
+from dnabyte.data_classes.insilicodna import mutate_copies, random_state, substitute_bases
 
 class Err_IID(SimulateMiscErrors):
     """
@@ -7,40 +7,66 @@ class Err_IID(SimulateMiscErrors):
     This model assumes that each base in the DNA sequence has a fixed probability of being
     substituted, inserted, or deleted, independent of the other bases and is for testing purposes only.
     """
+    supports_counts = True
+
     def __init__(self, params):
         if not hasattr(params, 'iid_error_rate') or params.iid_error_rate is None:
             self.iid_error_rate = 0.01
         else:
             self.iid_error_rate = params.iid_error_rate
+        if not hasattr(params, 'iid_seed') or params.iid_seed is None:
+            self.iid_seed = None
+        else:
+            self.iid_seed = params.iid_seed
             
     def simulate(self, data):
         """
         Simulate sequencing errors using an IID model.
+
+        Every hit base is replaced by one of the three other bases; the error positions of all
+        sequences are drawn at once, see substitute_bases.
         
         :param data: A list of DNA sequences (strings).
         :return: A list of sequenced DNA sequences.
         """
-        sequenceserror = []
-        error_counter = 0
-        for seq in data:
-            seq_list = list(seq)  # Convert string to list for mutation
-            for k in range(len(seq_list)):
-                if random.random() < self.iid_error_rate:
-                    error_counter += 1
-                    # randomly select a new base different from the current one
-                    current_base = seq_list[k]
-                    bases = ['A', 'C', 'G', 'T']
-                    bases.remove(current_base)
-                    new_base = random.choice(bases)
-                    seq_list[k] = new_base
-            sequenceserror.append(''.join(seq_list))
+        rng = random_state(self.iid_seed)
+        sequenceserror, error_counter = substitute_bases(data, self.iid_error_rate, rng, allow_same=False)
         info = {'error_counter': error_counter}
         return sequenceserror, info
+
+    def simulate_counts(self, sequences, counts):
+        """
+        Simulate sequencing errors using an IID model on a weighted pool.
+
+        Only the copies that are hit by at least one error are mutated, see mutate_copies.
+
+        :param sequences: A list of distinct DNA sequences (strings).
+        :param counts: The copy number of every sequence.
+        :return: A tuple (sequences, copy numbers, info).
+        """
+        rng = random_state(self.iid_seed)
+
+        def substitute(sequence, n_errors):
+            seq_list = list(sequence)
+            for k, shift in zip(rng.choice(len(seq_list), n_errors[0], replace=False),
+                                rng.randint(1, 4, size=n_errors[0])):
+                # select a new base different from the current one
+                seq_list[k] = 'ACGT'[('ACGT'.index(seq_list[k]) + shift) % 4]
+            return ''.join(seq_list)
+
+        sequences, counts, error_counter = mutate_copies(sequences, counts, [self.iid_error_rate], substitute, rng)
+        info = {'error_counter': error_counter}
+        return sequences, counts, info
     
 def attributes(params):
     if 'iid_error_rate' not in params.__dict__ or params.iid_error_rate is None:
         iid_error_rate = 0.01
     else:
         iid_error_rate = params.iid_error_rate
+
+    if 'iid_seed' not in params.__dict__ or params.iid_seed is None:
+        iid_seed = None
+    else:
+        iid_seed = params.iid_seed
         
-    return {"iid_error_rate": iid_error_rate}
\ No newline at end of file
+    return {"iid_error_rate": iid_error_rate, "iid_seed": iid_seed}
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Complement and reverse complement of DNA sequences.
+
+Strings are complemented with a single bytes.translate call, which also drops all characters
+other than 'A', 'C', 'G' and 'T' like the former complementmap helpers. Libraries complement
+the same motifs over and over, so the reverse complements of short sequences are cached.
+
+Arrays of 2-bit symbols (A=0, C=1, G=2, T=3, see data_classes.dnapool) are complemented by
+XOR with 0b11.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+# Sequences up to this length (motifs, primers) are cached by reverse_complement
+CACHED_LENGTH = 64
+
+_COMPLEMENT_TABLE = bytes.maketrans(b'ACGT', b'TGCA')
+_NON_NUCLEOTIDES = bytes(code for code in range(256) if code not in b'ACGT')
+
+
+def complement(sequence):
+    """
+    Complement of a DNA sequence.
+
+    :param sequence: DNA sequence string.
+    :return: Complement string, characters other than 'A', 'C', 'G' and 'T' are dropped.
+    """
+    return sequence.encode('ascii', errors='ignore').translate(_COMPLEMENT_TABLE, _NON_NUCLEOTIDES).decode('ascii')
+
+
+@lru_cache(maxsize=2 ** 16)
+def _cached_reverse_complement(sequence):
+    return complement(sequence)[::-1]
+
+
+def reverse_complement(sequence):
+    """
+    Reverse complement of a DNA sequence.
+
+    :param sequence: DNA sequence string.
+    :return: Reverse complement string, characters other than 'A', 'C', 'G' and 'T' are dropped.
+    """
+    if len(sequence) <= CACHED_LENGTH:
+        return _cached_reverse_complement(sequence)
+    return complement(sequence)[::-1]
+
+
+def reverse_complement_symbols(symbols, offsets=None):
+    """
+    Reverse complement of 2-bit symbols.
+
+    :param symbols: np.uint8 array of symbols (0-3); the rows of a 2D array are separate sequences.
+    :param offsets: Offsets of the sequences if symbols is a concatenated 1D batch (len(batch) + 1 entries,
+        starting at 0), every sequence is reversed in place.
+    :return: np.uint8 array of the same shape.
+    """
+    symbols = np.asarray(symbols, dtype=np.uint8)
+    if offsets is None:
+        return symbols[..., ::-1] ^ np.uint8(3)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    # position p of sequence i takes the symbol at offsets[i] + offsets[i + 1] - 1 - p
+    sources = np.repeat(offsets[:-1] + offsets[1:] - 1, np.diff(offsets)) - np.arange(offsets[-1])
+    return symbols[sources] ^ np.uint8(3)
@@ -1,11 +1,14 @@
-import random
 from dnabyte.oligo import Oligo, complement
 import numpy as np
+from dnabyte.synthesis.assembly.hybridisation import HybridisationEngine, species_key
 
 class OligoPool:
     """
         A class to represent a pool of oligonucleotides.
 
+        The pool is stored as a table of species: every distinct oligo is kept once (species) together with its
+        copy number (counts), both keyed by the tuple of its motifs (see hybridisation.species_key).
+
         There are two constructors for the OligoPool class:
         1. The first constructor takes a list of motifs and generates a pool of oligos with a random copy number for each motif.
         The distribution of the copy number is set to be normal, rounded to the next integer. The user can set the mean and
@@ -17,19 +20,54 @@ class OligoPool:
         """
 
     def __init__(self, oligo_list, mean=1, std_dev=0):
-        self.pool = []
+        self.species = {}
+        self.counts = {}
         for oligo in oligo_list:
-            self.pool.extend(self.pipette(oligo, mean, std_dev))
+            self.add(oligo, self.pipette(oligo, mean, std_dev))
 
-    def pipette(self, oligo, mean, std_dev):
+    def add(self, oligo, count=1):
+        """
+        Add copies of an oligo to the pool.
+
+        :return: The oligo stored for its species, shared by all copies.
+        """
+        key = species_key(oligo)
+        oligo = self.species.setdefault(key, oligo)
+        self.counts[key] = self.counts.get(key, 0) + count
+        return oligo
+
+    def copies(self):
+        """(oligo, copy number) of every species of the pool."""
+        return [(self.species[key], count) for key, count in self.counts.items()]
+
+    @property
+    def size(self):
+        """Number of oligos in the pool."""
+        return sum(self.counts.values())
+
+    @property
+    def pool(self):
+        """
+        List of all oligos of the pool, every species repeated by its copy number.
 
-        step = []
+        The list is built on every access and takes memory in proportion to the number of oligos, iterate
+        copies() to process the pool per species.
+        """
+        return [oligo for oligo, count in self.copies() for _ in range(count)]
+
+    @pool.setter
+    def pool(self, oligos):
+        self.species = {}
+        self.counts = {}
+        for oligo in oligos:
+            self.add(oligo)
+
+    def pipette(self, oligo, mean, std_dev):
+        """Random copy number of an oligo, at least 1."""
         num_oligos = int(round(np.random.normal(mean, std_dev)))
         if num_oligos <= 0:
             num_oligos = 1
-        for _ in range(num_oligos):
-            step.append(oligo)
-        return step
+        return num_oligos
 
     def join(self, pools, mean, std_dev):
 
@@ -39,46 +77,44 @@ class OligoPool:
         oligo_pools = [arg for arg in pools if isinstance(arg, OligoPool)]
         oligos = [arg for arg in pools if isinstance(arg, Oligo)]
 
-        # Extend the pool with elements from other OligoPool instances
+        # Add the species of the other OligoPool instances
         for pool in oligo_pools:
-            combined_pool.pool.extend(pool.pool)
+            for oligo, count in pool.copies():
+                combined_pool.add(oligo, count)
 
-        # Use the pipette function to append a random copy of the oligos to the pool
+        # Use the pipette function to add a random number of copies of the oligos to the pool
         for oligo in oligos:
-            combined_pool.pool.extend(self.pipette(oligo, mean, std_dev))
+            combined_pool.add(oligo, self.pipette(oligo, mean, std_dev))
         
         return combined_pool
 
 
     @classmethod
     def from_oligo_pools(cls, oligo_pools):
-        new_pool_motifs = []
+        new_pool = cls([])
         for pool in oligo_pools:
-            #new_pool_motifs.extend(pool.oligo_list)
-            new_pool_motifs.extend(pool.pool)
-        
-        new_pool = cls(new_pool_motifs)
-        new_pool.pool = [oligo for pool in oligo_pools for oligo in pool.pool]
+            for oligo, count in pool.copies():
+                new_pool.add(oligo, count)
         
         return new_pool
 
 
     def __str__(self):
-        if self.pool is not None:
+        if self.counts is not None:
             oligo_counts = {}
             
-            # count occurences of all oligos
+            # count occurences of all species, mirrored double strands are counted together
             
-            for oligo in self.pool:
+            for oligo, count in self.copies():
                 oligo_key = str(oligo)
                 oligo_key_mirrored = str(oligo.mirror())
 
                 if (oligo_key in oligo_counts):
-                    oligo_counts[oligo_key] += 1
+                    oligo_counts[oligo_key] += count
                 elif (oligo_key_mirrored in oligo_counts):
-                    oligo_counts[oligo_key_mirrored] += 1
+                    oligo_counts[oligo_key_mirrored] += count
                 else:
-                    oligo_counts[oligo_key] = 1
+                    oligo_counts[oligo_key] = count
 
             # sort oligos by count, descending
             sorted_oligos = dict(sorted(oligo_counts.items(), key=lambda item: item[1], reverse=True))
@@ -94,30 +130,26 @@ class OligoPool:
 
 
     def hybridise(self, n, library, info=False):
+        """
+        Simulate n rounds in which two random oligos of the pool hybridise if they have complementary sticky ends.
+
+        Only pairs with complementary ends are drawn, the rounds without such a pair are skipped
+        (see HybridisationEngine). The oligos are drawn in proportion to the copy numbers of their species.
 
+        :param n: Number of rounds (defaults to 10 times the size of the pool).
+        :param library: Library providing the complementary motifs (dictmotives).
+        :return: The pool itself.
+        """
         # set default value for n
         if n is None:
-            n = 10*len(self.pool)
-
-        for _ in range(n):
-            if len(self.pool) > 1:  # Ensure there are at least two oligos to hybridize
-                # Randomly pick two distinct oligos
-                oligo_A, oligo_B = random.sample(self.pool, 2)
-
-                # Pair the selected oligos
-                hybridised_oligo = self.pair(oligo_A, oligo_B,library)
-
-                # Check if the hybridisation was successful
-                if hybridised_oligo.motifs:
-                    # Remove the original oligos from the pool
-                    self.pool.remove(oligo_A)
-                    self.pool.remove(oligo_B)
-
-                    # Append the new hybridised oligo to the pool
-                    self.pool.append(hybridised_oligo)
-
-                    #if info:  # Optionally print information about the hybridisation event
-
+            n = 10*self.size
+
+        engine = HybridisationEngine(self.copies(), library.dictmotives)
+        engine.run(n, lambda oligo_A, oligo_B: self.pair(oligo_A, oligo_B, library))
+        self.species = {}
+        self.counts = {}
+        for oligo, count in engine.pool:
+            self.add(oligo, count)
 
         return self
 
@@ -1,7 +1,7 @@
 import numpy as np
 import random
 
-from dnabyte.data_classes.insilicodna import InSilicoDNA
+from dnabyte.data_classes.insilicodna import InSilicoDNA, simulate_channel, error_positions
 
 class SimulateSequencing:
     """
@@ -29,18 +29,16 @@ class SimulateSequencing:
         # Dynamically find the appropriate class based on sequencing_method
             try:
                 if self.sequencing_method == None:
-                    obj = InSilicoDNA(data=data.data)
+                    obj = InSilicoDNA(data=data.sequences, counts=data.counts)
                     if hasattr(data, 'file_paths'):
                         obj.file_paths = data.file_paths
                     return obj, {}
                 else:
                     sequencing_class = self.sequencing_plugins[self.sequencing_method]
                     plugin = sequencing_class(self.params, logger=self.logger)
-                    data, info = plugin.simulate(data.data)
-                    obj = InSilicoDNA(data=data)
-                    if hasattr(data, 'file_paths'):
-                        obj.file_paths = data.file_paths
-                    return obj, info                
+                    obj, info = simulate_channel(plugin, data)
+                    obj.file_paths = data.file_paths
+                    return obj, info
             except KeyError:
                 raise ValueError(f"Sequencing method '{self.sequencing_method}' not recognized.")
         else:
@@ -60,3 +58,138 @@ class SimulateSequencing:
             # data_seq = InSilicoDNA(data=data_seq)
             # return data_seq, info
         
+
+
+def random_generator(seed=None):
+    """
+    Random number generator for the batched sequencing simulators.
+
+    :param seed: Optional seed. Without a seed, the generator is seeded from the global
+        np.random state, so that np.random.seed keeps controlling the simulation.
+    :return: np.random.Generator.
+    """
+    if seed is None:
+        seed = np.random.randint(0, 2**32 - 1, dtype=np.int64)
+    return np.random.default_rng(seed)
+
+
+def reads_to_buffer(sequences):
+    """
+    Concatenate reads into one ASCII buffer.
+
+    :param sequences: List of DNA sequences.
+    :return: Tuple of (np.uint8 buffer, np.int64 array of read lengths).
+    """
+    lengths = np.fromiter(map(len, sequences), dtype=np.int64, count=len(sequences))
+    buffer = np.frombuffer(''.join(sequences).encode('ascii'), dtype=np.uint8).copy()
+    return buffer, lengths
+
+
+def buffer_to_reads(buffer, lengths):
+    """
+    Split an ASCII buffer into reads of the given lengths (inverse of reads_to_buffer).
+
+    :param buffer: np.uint8 buffer.
+    :param lengths: Read lengths.
+    :return: List of DNA sequences.
+    """
+    text = buffer.tobytes().decode('ascii')
+    bounds = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=bounds[1:])
+    bounds = bounds.tolist()
+    return [text[bounds[i]:bounds[i + 1]] for i in range(len(lengths))]
+
+
+def substitution_table(substitution_matrix):
+    """
+    Precompute the normalized cumulative substitution probabilities of a substitution matrix.
+
+    :param substitution_matrix: Dictionary {original base: {new base: probability}}.
+    :return: Tuple of (np.float64 array of shape (256, K) indexed by the ASCII code of the
+        original base, np.uint8 array of the K new bases as ASCII codes, boolean array marking
+        the ASCII codes that have a row).
+    """
+    new_bases = list(next(iter(substitution_matrix.values())))
+    cumulative = np.ones((256, len(new_bases)))
+    known = np.zeros(256, dtype=bool)
+    for base, row in substitution_matrix.items():
+        probabilities = np.array([row[b] for b in new_bases], dtype=np.float64)
+        cumulative[ord(base)] = np.cumsum(probabilities / probabilities.sum())
+        known[ord(base)] = True
+    return cumulative, np.frombuffer(''.join(new_bases).encode('ascii'), dtype=np.uint8), known
+
+
+def substitute_positional(buffer, lengths, table, error_rate, max_rate, rng):
+    """
+    Substitute bases in place with a position dependent probability.
+
+    Candidate positions are drawn at the constant rate max_rate (see error_positions) and
+    kept with probability error_rate(p, L) / max_rate, where p is the position in the read
+    and L the read length. The new bases are drawn from the precomputed substitution table.
+
+    :param buffer: np.uint8 buffer of concatenated reads (see reads_to_buffer).
+    :param lengths: Read lengths.
+    :param table: Result of substitution_table.
+    :param error_rate: Vectorized callable (p, L) returning the substitution probability.
+    :param max_rate: Upper bound of error_rate.
+    :param rng: np.random.Generator.
+    :return: Number of substitutions.
+    """
+    cumulative, new_bases, known = table
+    positions = error_positions(len(buffer), max_rate, rng)
+    reads, starts = _locate(positions, lengths)
+    rates = error_rate(positions - starts[reads], lengths[reads])
+    positions = positions[(rng.random(len(positions)) * max_rate < rates) & known[buffer[positions]]]
+
+    u = rng.random(len(positions))
+    choices = (u[:, None] >= cumulative[buffer[positions]]).sum(axis=1)
+    buffer[positions] = new_bases[np.minimum(choices, len(new_bases) - 1)]
+    return len(positions)
+
+
+def _locate(positions, lengths):
+    """
+    Find the read of every buffer position.
+
+    :return: Tuple of (read index of every position, start of every read in the buffer).
+    """
+    starts = np.zeros(len(lengths), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    return np.searchsorted(starts, positions, side='right') - 1, starts
+
+
+def insert_random_bases(buffer, lengths, probability, rng):
+    """
+    Insert a random base before every base with the given probability.
+
+    :param buffer: np.uint8 buffer of concatenated reads.
+    :param lengths: Read lengths.
+    :param probability: Per-base insertion probability.
+    :param rng: np.random.Generator.
+    :return: Tuple of (new buffer, new read lengths, number of insertions).
+    """
+    positions = error_positions(len(buffer), probability, rng)
+    if len(positions) == 0:
+        return buffer, lengths, 0
+    reads, _ = _locate(positions, lengths)
+    inserted = np.frombuffer(b'ATCG', dtype=np.uint8)[rng.integers(0, 4, size=len(positions))]
+    buffer = np.insert(buffer, positions, inserted)
+    return buffer, lengths + np.bincount(reads, minlength=len(lengths)), len(positions)
+
+
+def delete_bases(buffer, lengths, probability, rng):
+    """
+    Delete every base with the given probability.
+
+    :param buffer: np.uint8 buffer of concatenated reads.
+    :param lengths: Read lengths.
+    :param probability: Per-base deletion probability.
+    :param rng: np.random.Generator.
+    :return: Tuple of (new buffer, new read lengths, number of deletions).
+    """
+    positions = error_positions(len(buffer), probability, rng)
+    if len(positions) == 0:
+        return buffer, lengths, 0
+    reads, _ = _locate(positions, lengths)
+    buffer = np.delete(buffer, positions)
+    return buffer, lengths - np.bincount(reads, minlength=len(lengths)), len(positions)
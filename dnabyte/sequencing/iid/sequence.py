@@ -1,5 +1,5 @@
-import random
 from dnabyte.sequence import SimulateSequencing
+from dnabyte.data_classes.insilicodna import mutate_copies, random_state, substitute_bases
 
 class IID(SimulateSequencing):
     """
@@ -8,30 +8,49 @@ class IID(SimulateSequencing):
     substituted, inserted, or deleted, independent of the other bases and is for testing purposes only.
     """
 
+    supports_counts = True
+
     def simulate(self, data):
         """
         Simulate sequencing errors using an IID model.
+
+        The error positions of all reads are drawn at once, see substitute_bases.
         
         :param data: A list of DNA sequences.
         :return: A list of sequenced DNA sequences.
         """
-        sequenceserror = list(data)  # Create a copy of the data
-        error_counter = 0
-        for i in range(len(sequenceserror)):
-            for k in range(len(sequenceserror[i])):
-                if random.random() < self.params.iid_error_rate:
-                    error_counter += 1
-                    # randomly select a new base
-                    new_base = random.choice(['A', 'C', 'G', 'T'])
-                    # replace the base at the mutation position with the new base
-
-                    #sequenceserror[i] = (data[i][:k] + new_base + data[i][k + 1:])      
-                    sequenceserror[i] = (sequenceserror[i][:k] + new_base + sequenceserror[i][k + 1:])      
-               
+        rng = random_state(getattr(self.params, 'iid_seed', None))
+        sequenceserror, error_counter = substitute_bases(data, self.params.iid_error_rate, rng)
+
         info = {}
         info['error_counter'] = error_counter
 
         return sequenceserror, info
+
+    def simulate_counts(self, sequences, counts):
+        """
+        Simulate sequencing errors using an IID model on a weighted pool.
+
+        Only the copies that are hit by at least one error are mutated, see mutate_copies.
+
+        :param sequences: A list of distinct DNA sequences.
+        :param counts: The copy number of every sequence.
+        :return: A tuple (sequences, copy numbers, info).
+        """
+        rng = random_state(getattr(self.params, 'iid_seed', None))
+
+        def substitute(sequence, n_errors):
+            sequence = list(sequence)
+            for k, new_base in zip(rng.choice(len(sequence), n_errors[0], replace=False),
+                                   rng.randint(0, 4, size=n_errors[0])):
+                sequence[k] = 'ACGT'[new_base]
+            return ''.join(sequence)
+
+        sequences, counts, error_counter = mutate_copies(sequences, counts, [self.params.iid_error_rate],
+                                                         substitute, rng)
+        info = {'error_counter': error_counter}
+
+        return sequences, counts, info
     
 def check_parameter(parameter, default, min, max, inputparams):
     if not hasattr(inputparams, parameter) or inputparams.__dict__[parameter] is None:
@@ -49,5 +68,10 @@ def attributes(params):
                                         min=0.0,
                                         max=1.0,
                                         inputparams=params)
+    iid_seed = check_parameter(parameter="iid_seed",
+                                        default=None,
+                                        min=0,
+                                        max=2**32 - 1,
+                                        inputparams=params)
         
-    return {"iid_error_rate": iid_error_rate}
\ No newline at end of file
+    return {"iid_error_rate": iid_error_rate, "iid_seed": iid_seed}
\ No newline at end of file
@@ -1,6 +1,9 @@
 import numpy as np
 
-from dnabyte.sequence import SimulateSequencing
+from dnabyte.sequence import (
+    SimulateSequencing, random_generator, reads_to_buffer, buffer_to_reads, substitution_table,
+    substitute_positional, insert_random_bases, delete_bases
+)
 
 class Illumina(SimulateSequencing):
     """
@@ -25,23 +28,21 @@ class Illumina(SimulateSequencing):
         'G': {'A': 0.0015, 'T': 0.0005, 'C': 0.001, 'G': 0.997}
         }  
 
-        sequenced_data = []
-        error_counter = 0
+        rng = random_generator(getattr(self.params, 'illumina_seed', None))
+        reads, lengths = reads_to_buffer(data)
 
-        for sequence in data:
-            # Simulate substitutions
-            modified_sequence, counter = self.simulate_substitutions(sequence, substitution_matrix_illumina, k=0.01)
-            error_counter += counter
+        # Simulate substitutions
+        error_counter = self.simulate_substitutions(reads, lengths, substitution_table(substitution_matrix_illumina), rng, k=0.01)
 
-            # Simulate instertions
-            modified_sequence, counter = self.simulate_insertions(modified_sequence, ins_prob=1e-6)
-            error_counter += counter
+        # Simulate instertions
+        reads, lengths, counter = self.simulate_insertions(reads, lengths, rng, ins_prob=1e-6)
+        error_counter += counter
 
-            # Simulate deletions
-            modified_sequence, counter = self.simulate_deletions(modified_sequence, del_prob=1e-6)
-            error_counter += counter
+        # Simulate deletions
+        reads, lengths, counter = self.simulate_deletions(reads, lengths, rng, del_prob=1e-6)
+        error_counter += counter
 
-            sequenced_data.append(modified_sequence)
+        sequenced_data = buffer_to_reads(reads, lengths)
 
         info = {
             "average_copy_number": 1.0,
@@ -51,42 +52,32 @@ class Illumina(SimulateSequencing):
 
         return sequenced_data, info
 
-    def simulate_substitutions(self, sequence, substitution_matrix_illumina, k=0.01):
-        new_sequence = list(sequence)
-        counter = 0
-        for p in range(len(sequence)):
-            if np.random.rand() < self.positional_error_rate(p, len(sequence), k):
-                counter += 1
-                original_base = sequence[p]
-                new_sequence[p] = self.get_new_base(original_base, substitution_matrix_illumina)
-        return ''.join(new_sequence), counter
-    
-
-    def simulate_insertions(self, sequence, ins_prob=1e-6):
+    def simulate_substitutions(self, reads, lengths, table, rng, k=0.01):
         """
-        Simulate insertions in a sequence.
+        Simulate substitutions in place in a batch of reads, see substitute_positional.
+
+        :param reads: Concatenated reads as np.uint8 buffer (see reads_to_buffer).
+        :param lengths: Read lengths.
+        :param table: Cumulative substitution probabilities (see substitution_table).
+        :param rng: np.random.Generator.
+        :param k: Maximum substitution rate, reached at the end of a read.
+        :return: Number of substitutions.
         """
-        new_sequence = list(sequence)
-        counter = 0
-        for p in range(len(sequence)):
-            if np.random.rand() < ins_prob:
-                counter += 1
-                new_sequence.insert(p, np.random.choice(['A', 'T', 'C', 'G']))
-        return ''.join(new_sequence), counter
-    
-
-    def simulate_deletions(self, sequence, del_prob=1e-6):
+        error_rate = lambda p, L: self.positional_error_rate(p, L, k)
+        return substitute_positional(reads, lengths, table, error_rate, k, rng)
+
+    def simulate_insertions(self, reads, lengths, rng, ins_prob=1e-6):
+        """
+        Simulate insertions in a batch of reads.
+        """
+        return insert_random_bases(reads, lengths, ins_prob, rng)
+
+    def simulate_deletions(self, reads, lengths, rng, del_prob=1e-6):
         """
-        Simulate deletions in a sequence.
+        Simulate deletions in a batch of reads.
         """
-        new_sequence = list(sequence)
-        counter = 0
-        for p in range(len(sequence)):
-            if np.random.rand() < del_prob:
-                counter += 1
-                new_sequence.pop(p)
-        return ''.join(new_sequence), counter
-    
+        return delete_bases(reads, lengths, del_prob, rng)
+
     # Positional error rate function
     def positional_error_rate(self, p, L, k=0.01):
         """
@@ -94,15 +85,12 @@ class Illumina(SimulateSequencing):
         """    
         return k * (p / L)
 
-    # Function to get a new base based on substitution probabilities
-    def get_new_base(self, original_base, substitution_matrix_illumina):
-        bases = ['A', 'T', 'C', 'G']
-        probabilities = [substitution_matrix_illumina[original_base][b] for b in bases]
-        total_prob = sum(probabilities)
-        probabilities = [p / total_prob for p in probabilities]  # Normalize to ensure sum is 1
-        return np.random.choice(bases, p=probabilities)
-
 
 def attributes(params):
-    return {}
+    if 'illumina_seed' not in params.__dict__ or params.illumina_seed is None:
+        illumina_seed = None
+    else:
+        illumina_seed = params.illumina_seed
+
+    return {"illumina_seed": illumina_seed}
 
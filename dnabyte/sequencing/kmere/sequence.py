@@ -1,11 +1,14 @@
 
 
 
+import itertools
 import numpy as np
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Iterable
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import defaultdict, deque
+from multiprocessing import Pool
 from dnabyte.sequence import SimulateSequencing
+from dnabyte.data_classes.dnapool import encode_nucleotides, INVALID_SYMBOL
 
 class KMER(SimulateSequencing):
     """
@@ -48,16 +51,8 @@ class KMER(SimulateSequencing):
 
         channel = KMERChannel(channel_params, seed=seed)
 
-        sequenced_data = []
-        event_lists = []
-        error_counter = 0
-
-        for sequence in data:
-            seq_list = list(sequence)
-            y, events = channel.transmit(seq_list)
-            sequenced_data.append(''.join(y))
-            event_lists.append(events)
-            error_counter += sum(1 for ev in events if ev != Event.TRA)
+        sequenced_data, event_lists = channel.transmit_batch(data)
+        error_counter = sum(len(events) - events.count(Event.TRA) for events in event_lists)
 
         info = {
             "average_copy_number": 1.0,
@@ -221,6 +216,191 @@ class ChannelParameters:
                   substitution_probs=substitution_probs)
 
 
+# Order of the sampled events in the compiled tables; previous events additionally include BEG
+EVENT_ORDER = [Event.INS, Event.DEL, Event.SUB, Event.TRA]
+PREV_EVENT_ORDER = [Event.BEG] + EVENT_ORDER
+
+# Largest window (2 * (k // 2) + 1) whose contexts fit into a 64-bit hash
+MAX_COMPILED_WINDOW = 31
+
+# Number of reads that are advanced in lockstep by KMERChannel.transmit_batch
+BATCH_SIZE = 2 ** 14
+
+_EVENT_NAMES = np.array(EVENT_ORDER, dtype=object)
+
+
+def _cumulative(probs: np.ndarray) -> np.ndarray:
+    """Normalized cumulative probabilities, exactly 1 from the last non-zero entry on."""
+    cumulative = np.cumsum(probs / probs.sum())
+    cumulative[np.flatnonzero(probs)[-1]:] = 1.0
+    return cumulative
+
+
+def window_offsets(window: int) -> np.ndarray:
+    """First context hash of the windows of every size s (index s) from 1 to window."""
+    offsets = np.zeros(window + 2, dtype=np.int64)
+    offsets[2:] = np.cumsum(4 ** np.arange(1, window + 1, dtype=np.int64))
+    return offsets
+
+
+def context_hashes(X: np.ndarray, lengths: np.ndarray, k: int) -> np.ndarray:
+    """
+    Context hash of every position of a batch of strands.
+
+    The window of every position is the one of KMERChannel.get_kmer. A window of s symbols
+    with 2-bit codes c_1 ... c_s (A=0, C=1, G=2, T=3) has the hash
+    window_offsets[s] + sum(c_i * 4^(s - i)).
+
+    Args:
+        X: Symbol codes (n x L_max, padded with codes 0-3)
+        lengths: Length of every strand
+        k: Memory parameter
+
+    Returns:
+        np.ndarray (n x L_max) of hashes, -1 beyond the end of a strand
+    """
+    r = k // 2
+    w = 2 * r + 1
+    offsets = window_offsets(w)
+    n, L_max = X.shape
+    X = X.astype(np.int64)
+    hashes = np.full((n, L_max), -1, dtype=np.int64)
+    rows = np.arange(n)
+
+    # Interior positions: full windows of w symbols, hashed by rolling over the window
+    if L_max >= w:
+        codes = np.zeros((n, L_max - w + 1), dtype=np.int64)
+        for j in range(w):
+            codes = 4 * codes + X[:, j:L_max - w + 1 + j]
+        hashes[:, r:L_max - r] = offsets[w] + codes
+
+    # Right end: t = L - 1 - j >= r uses the window [L - 2j - 1, L)
+    for j in range(r):
+        t = lengths - 1 - j
+        mask = t >= r
+        code = np.zeros(n, dtype=np.int64)
+        for m in range(2 * j + 1):
+            code = 4 * code + X[rows, np.clip(lengths - 2 * j - 1 + m, 0, L_max - 1)]
+        hashes[rows[mask], t[mask]] = offsets[2 * j + 1] + code[mask]
+
+    # Left end: t < r uses the window [0, min(L, 2t + 1))
+    for t in range(min(r, L_max)):
+        size = np.minimum(lengths, 2 * t + 1)
+        code = np.zeros(n, dtype=np.int64)
+        for m in range(min(2 * t + 1, L_max)):
+            code = np.where(m < size, 4 * code + X[:, m], code)
+        mask = t < lengths
+        hashes[mask, t] = offsets[np.maximum(size, 1)][mask] + code[mask]
+
+    hashes[np.arange(X.shape[1]) >= lengths[:, None]] = -1
+    return hashes
+
+
+def kmer_from_hash(context: int) -> Tuple[str, ...]:
+    """Inverse of the context hash (see context_hashes)."""
+    size, code = 1, int(context)
+    while code >= 4 ** size:
+        code -= 4 ** size
+        size += 1
+    return tuple(SIGMA_DNA[(code >> (2 * (size - 1 - i))) & 3] for i in range(size))
+
+
+class CompiledChannelParameters:
+    """
+    Dense table form of ChannelParameters for batch transmission.
+
+    The k-mer context of a position is encoded as an integer with a rolling 2-bit hash
+    (A=0, C=1, G=2, T=3); windows shortened at the strand ends get their own range of
+    hashes, so that every window of 1 to 2 * (k // 2) + 1 symbols has a unique hash.
+    Contexts that appear in transition_probs get a row of the transition table, all other
+    contexts share a default row. Missing entries are resolved exactly like
+    KMERChannel.transmit_symbol does: via the defaultdict factory, or else via the first
+    entry with the same previous event.
+
+    Attributes:
+        transition_table: Cumulative event probabilities of shape
+            (n_contexts + 1, len(PREV_EVENT_ORDER), len(EVENT_ORDER)), in EVENT_ORDER.
+        valid: Boolean array (n_contexts + 1, len(PREV_EVENT_ORDER)) marking usable rows.
+        substitution_table: Cumulative substitution probabilities (4 x 4) in SIGMA_DNA order,
+            with zero probability for the original symbol.
+    """
+
+    def __init__(self, params: ChannelParameters):
+        self.k = params.k
+        self.radius = params.k // 2
+        self.window = 2 * self.radius + 1
+        if self.window > MAX_COMPILED_WINDOW:
+            raise ValueError(f"Cannot compile k-mer windows of more than {MAX_COMPILED_WINDOW} symbols, "
+                             f"got {self.window}")
+        # Hashes of windows of size s start at offsets[s]
+        self.offsets = window_offsets(self.window)
+
+        transition_probs = params.transition_probs
+        hashes = {self.context_hash(kmer) for kmer, _ in transition_probs}
+        contexts = sorted(hashes - {None})
+        self.contexts = np.array(contexts, dtype=np.int64)
+
+        default_factory = getattr(transition_probs, 'default_factory', None)
+        fallback = {}
+        for (_, prev_event), probs in transition_probs.items():
+            fallback.setdefault(prev_event, probs)
+        known = {}
+        for (kmer, prev_event), probs in transition_probs.items():
+            known[(self.context_hash(kmer), prev_event)] = probs
+
+        n_rows = len(self.contexts) + 1
+        self.transition_table = np.ones((n_rows, len(PREV_EVENT_ORDER), len(EVENT_ORDER)))
+        self.valid = np.zeros((n_rows, len(PREV_EVENT_ORDER)), dtype=bool)
+        for row, context in enumerate(contexts + [None]):
+            for j, prev_event in enumerate(PREV_EVENT_ORDER):
+                prob_dict = known.get((context, prev_event))
+                if prob_dict is None:
+                    prob_dict = default_factory() if default_factory is not None else fallback.get(prev_event)
+                if prob_dict is None:
+                    continue
+                probs = np.array([prob_dict.get(ev, 0.0) for ev in EVENT_ORDER])
+                if probs.sum() > 0:
+                    self.transition_table[row, j] = _cumulative(probs)
+                    self.valid[row, j] = True
+
+        self.substitution_table = np.ones((len(SIGMA_DNA), len(SIGMA_DNA)))
+        for i, orig in enumerate(SIGMA_DNA):
+            sub_probs = params.substitution_probs[orig]
+            probs = np.array([sub_probs.get(s, 0.0) if s != orig else 0.0 for s in SIGMA_DNA])
+            if probs.sum() <= 0:
+                raise ValueError(f"All substitution probabilities sum to zero for symbol {orig}")
+            self.substitution_table[i] = _cumulative(probs)
+
+    def context_hash(self, kmer: Tuple[str, ...]):
+        """
+        Hash of a k-mer window, or None if it cannot occur (wrong size or symbols).
+        """
+        if not 1 <= len(kmer) <= self.window or any(symbol not in SIGMA_DNA for symbol in kmer):
+            return None
+        code = 0
+        for symbol in kmer:
+            code = 4 * code + SIGMA_DNA.index(symbol)
+        return int(self.offsets[len(kmer)]) + code
+
+    def context_rows(self, X: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """
+        Transition table row of every position of a batch of strands.
+
+        Args:
+            X: Symbol codes (n x L_max, padded), see KMERChannel.transmit_batch
+            lengths: Length of every strand
+
+        Returns:
+            np.ndarray (n x L_max) of row indices into transition_table
+        """
+        default_row = len(self.contexts)
+        if len(self.contexts) == 0:
+            return np.full(X.shape, default_row, dtype=np.int64)
+        hashes = context_hashes(X, lengths, self.k)
+        index = np.minimum(np.searchsorted(self.contexts, hashes), len(self.contexts) - 1)
+        return np.where(self.contexts[index] == hashes, index, default_row)
+
+
 class KMERChannel:
     """
     KMER_k channel implementation based on the paper.
@@ -374,6 +554,110 @@ class KMERChannel:
         
         return y, events
 
+    def compile(self) -> CompiledChannelParameters:
+        """Compile the channel parameters (see CompiledChannelParameters)."""
+        return CompiledChannelParameters(self.params)
+
+    def transmit_batch(self, sequences: List[str],
+                       return_events: bool = True) -> Tuple[List[str], List[List[str]]]:
+        """
+        Transmit many sequences through the KMER_k channel.
+
+        Up to BATCH_SIZE reads are advanced in lockstep: every step draws the next event of
+        all unfinished reads at once from the compiled transition table. The events follow
+        the same distribution as in transmit, but the random numbers are drawn in a
+        different order. Parameters that cannot be compiled (windows of more than
+        MAX_COMPILED_WINDOW symbols) and reads with symbols other than A, C, G and T are
+        transmitted one by one with transmit.
+
+        Args:
+            sequences: Input DNA sequences (strings or lists of symbols)
+            return_events: Whether to return the event lists
+
+        Returns:
+            (Y, events): Output sequences as strings and the events of every read
+                (None if return_events is False)
+        """
+        try:
+            compiled = self.compile()
+        except ValueError:
+            compiled = None
+
+        Y = [None] * len(sequences)
+        events = [None] * len(sequences) if return_events else None
+        batch = []
+        for i, x in enumerate(sequences):
+            codes = encode_nucleotides(''.join(x))
+            if compiled is None or (codes == INVALID_SYMBOL).any():
+                y, read_events = self.transmit(list(x))
+                Y[i] = ''.join(y)
+                if return_events:
+                    events[i] = read_events
+                continue
+            batch.append((i, codes))
+            if len(batch) == BATCH_SIZE:
+                self._transmit_compiled(compiled, batch, Y, events)
+                batch = []
+        if batch:
+            self._transmit_compiled(compiled, batch, Y, events)
+        return Y, events
+
+    def _transmit_compiled(self, compiled: CompiledChannelParameters, batch, Y, events):
+        """Transmit a batch of (index, symbol codes) pairs, writing into Y and events."""
+        n = len(batch)
+        X, lengths = _symbol_matrix([codes for _, codes in batch])
+        L_max = int(lengths.max())
+        contexts = compiled.context_rows(X, lengths)
+
+        capacity = L_max + L_max // 4 + 8
+        output = np.zeros((n, capacity), dtype=np.uint8)
+        event_codes = np.zeros((n, capacity), dtype=np.uint8)
+        n_output = np.zeros(n, dtype=np.int64)
+        n_events = np.zeros(n, dtype=np.int64)
+        t = np.zeros(n, dtype=np.int64)
+        prev = np.zeros(n, dtype=np.int64)  # index into PREV_EVENT_ORDER, 0 = BEG
+
+        active = np.flatnonzero(lengths > 0)
+        while len(active):
+            if n_events[active].max() >= capacity:
+                output = np.pad(output, ((0, 0), (0, capacity)))
+                event_codes = np.pad(event_codes, ((0, 0), (0, capacity)))
+                capacity *= 2
+
+            pos = t[active]
+            rows, prev_events = contexts[active, pos], prev[active]
+            if not compiled.valid[rows, prev_events].all():
+                raise ValueError("No usable transition probabilities found for some k-mer contexts")
+            cumulative = compiled.transition_table[rows, prev_events]
+            draws = self.rng.random_sample(len(active))
+            event = (draws[:, None] >= cumulative[:, :-1]).sum(axis=1)
+
+            symbols = X[active, pos]
+            inserted = event == 0
+            symbols[inserted] = self.rng.randint(len(SIGMA_DNA), size=np.count_nonzero(inserted))
+            substituted = event == 2
+            if substituted.any():
+                draws = self.rng.random_sample(np.count_nonzero(substituted))
+                sub_cumulative = compiled.substitution_table[symbols[substituted]]
+                symbols[substituted] = (draws[:, None] >= sub_cumulative[:, :-1]).sum(axis=1)
+
+            emitted = active[event != 1]
+            output[emitted, n_output[emitted]] = symbols[event != 1]
+            n_output[emitted] += 1
+            event_codes[active, n_events[active]] = event
+            n_events[active] += 1
+
+            prev[active] = event + 1
+            t[active] += ~inserted
+            active = active[t[active] < lengths[active]]
+
+        letters = np.frombuffer(''.join(SIGMA_DNA).encode('ascii'), dtype=np.uint8)[output].tobytes()
+        for row, (i, _) in enumerate(batch):
+            start = row * capacity
+            Y[i] = letters[start:start + n_output[row]].decode('ascii')
+            if events is not None:
+                events[i] = _EVENT_NAMES[event_codes[row, :n_events[row]]].tolist()
+
 
 class SamplingKMERChannel:
     """
@@ -443,27 +727,18 @@ class SamplingKMERChannel:
         drawn_indices = self.rng.choice(self.M, size=self.N, 
                                        p=self.draw_probs)
         
-        # Step 2 & 3: Reverse-complement and transmit
-        Z = []
-        is_forward = []
-        
-        for idx in drawn_indices:
-            # Decide forward or backward
-            forward = self.rng.rand() > self.p_rc
-            is_forward.append(forward)
-            
-            # Get strand
-            x = X[idx]
-            
-            if forward:
-                # Transmit through forward channel
-                y, _ = self.channel_forward.transmit(x)
-            else:
-                # Reverse-complement then transmit through backward channel
-                x_rc = self.reverse_complement(x)
-                y, _ = self.channel_backward.transmit(x_rc)
-            
-            Z.append(y)
+        # Step 2 & 3: Reverse-complement and transmit, all reads of a direction in one batch
+        is_forward = list(self.rng.rand(self.N) > self.p_rc)
+        Z = [None] * self.N
+
+        forward_reads = [i for i in range(self.N) if is_forward[i]]
+        backward_reads = [i for i in range(self.N) if not is_forward[i]]
+        forward_out, _ = self.channel_forward.transmit_batch(
+            [X[drawn_indices[i]] for i in forward_reads], return_events=False)
+        backward_out, _ = self.channel_backward.transmit_batch(
+            [self.reverse_complement(X[drawn_indices[i]]) for i in backward_reads], return_events=False)
+        for i, y in zip(forward_reads + backward_reads, forward_out + backward_out):
+            Z[i] = list(y)
         
         # Step 4: Random permutation
         perm = self.rng.permutation(self.N)
@@ -516,6 +791,170 @@ def compute_error_statistics(x: List[str], y: List[str]) -> Dict[str, float]:
     }
 
 
+def _symbol_matrix(sequences: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack symbol code arrays into a zero padded matrix and their lengths."""
+    lengths = np.array([len(codes) for codes in sequences], dtype=np.int64)
+    X = np.zeros((len(sequences), max(int(lengths.max(initial=0)), 1)), dtype=np.uint8)
+    for row, codes in enumerate(sequences):
+        X[row, :len(codes)] = codes
+    return X, lengths
+
+
+def align_batch(X: np.ndarray, x_lengths: np.ndarray,
+                Y: np.ndarray, y_lengths: np.ndarray,
+                band: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Banded edit distance alignment of a batch of (input, output) pairs as channel events.
+
+    For a pair with len(y) - len(x) = diff, only cells with
+    min(0, diff) - band <= j - i <= max(0, diff) + band are computed. The pairs are
+    aligned in groups of |diff| with the same bit length, so that the band of a group is at
+    most about twice as wide as needed and a single pair with a large length difference
+    does not widen the band of the others (see _align_band).
+
+    Args:
+        X, Y: Symbol codes of inputs and outputs (n x L_max, padded)
+        x_lengths, y_lengths: Lengths of the inputs and outputs
+        band: Extra diagonals on each side of the band
+
+    Returns:
+        (events, n_events): Event indices into EVENT_ORDER (n x T, in channel order) and
+            the number of events of every pair
+    """
+    n = len(x_lengths)
+    steps = int(x_lengths.max(initial=0)) + int(y_lengths.max(initial=0))
+    reversed_events = np.zeros((n, steps), dtype=np.uint8)
+    n_events = np.zeros(n, dtype=np.int64)
+
+    # frexp gives the bit length of the length differences
+    classes = np.frexp(np.abs(y_lengths - x_lengths))[1]
+    for value in np.unique(classes):
+        rows = np.flatnonzero(classes == value)
+        x_rows, y_rows = x_lengths[rows], y_lengths[rows]
+        group_events, n_events[rows] = _align_band(X[rows, :max(int(x_rows.max()), 1)], x_rows,
+                                                   Y[rows, :max(int(y_rows.max()), 1)], y_rows, band)
+        reversed_events[rows, :group_events.shape[1]] = group_events
+
+    positions = n_events[:, None] - 1 - np.arange(steps)
+    events = np.take_along_axis(reversed_events, np.maximum(positions, 0), axis=1)
+    return events, n_events
+
+
+def _align_band(X: np.ndarray, x_lengths: np.ndarray,
+                Y: np.ndarray, y_lengths: np.ndarray,
+                band: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Banded edit distance alignment of a group of pairs (see align_batch).
+
+    The band of every pair is as wide as that of the largest length difference of the group.
+    The dynamic program runs over the input positions for all pairs at once; insertions
+    within a row are resolved with a cumulative minimum. Among alignments of equal cost,
+    TRA/SUB are preferred over DEL over INS.
+
+    Returns:
+        (reversed_events, n_events): Event indices into EVENT_ORDER (n x T, from the end of
+            the pairs) and the number of events of every pair
+    """
+    n = len(x_lengths)
+    N, M = int(x_lengths.max(initial=0)), int(y_lengths.max(initial=0))
+    differences = y_lengths - x_lengths
+    lo = np.minimum(differences, 0) - band
+    width = int(np.abs(differences).max(initial=0)) + 2 * band + 1
+    diagonals = lo[:, None] + np.arange(width)
+    infinity = np.iinfo(np.int32).max // 2
+    INS, DEL, SUB, TRA = range(len(EVENT_ORDER))
+
+    X = np.pad(X, ((0, 0), (0, max(N + 1 - X.shape[1], 0))))
+    Y = np.pad(Y, ((0, 0), (0, max(N + width + band + 1 - Y.shape[1], 0))))
+    pointers = np.zeros((n, N + 1, width), dtype=np.uint8)
+    row = np.where(diagonals >= 0, diagonals, infinity).astype(np.int32)
+    pointers[:, 0] = INS
+
+    for i in range(1, N + 1):
+        j = i + diagonals
+        matches = X[:, i - 1, None] == np.take_along_axis(Y, np.maximum(j - 1, 0), axis=1)
+        diagonal = np.where(j >= 1, row + ~matches, infinity)
+        up = np.full_like(row, infinity)
+        up[:, :-1] = row[:, 1:] + 1
+        row = np.minimum(np.minimum(diagonal, up), infinity)
+        pointer = np.where(diagonal <= up, np.where(matches, TRA, SUB), DEL).astype(np.uint8)
+        left = np.full_like(row, infinity)
+        left[:, 1:] = np.minimum.accumulate(row[:, :-1] - np.arange(width - 1), axis=1) + np.arange(1, width)
+        pointer[left < row] = INS
+        row = np.minimum(row, left)
+        pointers[:, i] = pointer
+
+    # Trace back from (len(x), len(y))
+    reversed_events = np.zeros((n, N + M), dtype=np.uint8)
+    n_events = np.zeros(n, dtype=np.int64)
+    i, j = x_lengths.copy(), y_lengths.copy()
+    active = np.flatnonzero((i > 0) | (j > 0))
+    while len(active):
+        event = pointers[active, i[active], j[active] - i[active] - lo[active]]
+        reversed_events[active, n_events[active]] = event
+        n_events[active] += 1
+        i[active] -= event != INS
+        j[active] -= event != DEL
+        active = active[(i[active] > 0) | (j[active] > 0)]
+    return reversed_events, n_events
+
+
+def count_events(pairs, k: int = 1, band: int = 10) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Align (input, output) pairs and count the channel events per context.
+
+    Pairs with symbols other than A, C, G and T are skipped. Insertions after the last
+    input symbol cannot be produced by the channel and are not counted.
+
+    Args:
+        pairs: List of (input, output) sequences (strings or lists of symbols)
+        k: Memory parameter
+        band: See align_batch
+
+    Returns:
+        (keys, counts, substitutions): Sorted keys (context_hash * 5 + previous event) * 4 + event,
+            with previous events in PREV_EVENT_ORDER and events in EVENT_ORDER, their counts,
+            and the 4 x 4 substitution counts (original symbol x read symbol)
+    """
+    inputs, outputs = [], []
+    for x, y in pairs:
+        x, y = encode_nucleotides(''.join(x)), encode_nucleotides(''.join(y))
+        if not ((x == INVALID_SYMBOL).any() or (y == INVALID_SYMBOL).any()):
+            inputs.append(x)
+            outputs.append(y)
+    if not inputs:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros((4, 4), dtype=np.int64)
+
+    X, x_lengths = _symbol_matrix(inputs)
+    Y, y_lengths = _symbol_matrix(outputs)
+    events, n_events = align_batch(X, x_lengths, Y, y_lengths, band)
+    INS, DEL, SUB = 0, 1, 2
+
+    consuming, emitting = events != INS, events != DEL
+    t = np.cumsum(consuming, axis=1) - consuming
+    j = np.cumsum(emitting, axis=1) - emitting
+    keep = (np.arange(events.shape[1]) < n_events[:, None]) & (t < x_lengths[:, None])
+    prev = np.zeros_like(events, dtype=np.int64)
+    prev[:, 1:] = events[:, :-1].astype(np.int64) + 1
+
+    rows = np.nonzero(keep)[0]
+    t, j, prev, events = t[keep], j[keep], prev[keep], events[keep].astype(np.int64)
+    hashes = context_hashes(X, x_lengths, k)[rows, t]
+    keys, counts = np.unique((hashes * len(PREV_EVENT_ORDER) + prev) * len(EVENT_ORDER) + events,
+                             return_counts=True)
+
+    substituted = events == SUB
+    originals = X[rows[substituted], t[substituted]].astype(np.int64)
+    replacements = Y[rows[substituted], j[substituted]].astype(np.int64)
+    substitutions = np.bincount(originals * 4 + replacements, minlength=16).reshape(4, 4)
+    return keys, counts, substitutions
+
+
+def _count_events_task(args):
+    """Pool worker for ChannelEstimator.estimate_from_alignments."""
+    return count_events(*args)
+
+
 def sequences_to_string(seqs: List[List[str]]) -> List[str]:
     """Convert list of symbol lists to strings"""
     return [''.join(seq) for seq in seqs]
@@ -607,51 +1046,82 @@ class ChannelEstimator:
     """Estimate KMER_k channel parameters from experimental data"""
     
     @staticmethod
-    def estimate_from_alignments(alignments: List[Tuple[List[str], List[str]]],
-                                 k: int = 1) -> ChannelParameters:
+    def estimate_from_alignments(alignments: Iterable[Tuple[List[str], List[str]]],
+                                 k: int = 1,
+                                 band: int = 10,
+                                 chunk_size: int = 4096,
+                                 processes: int = None) -> ChannelParameters:
         """
-        Estimate channel parameters from aligned sequence pairs.
-        
+        Estimate channel parameters from (input, output) sequence pairs.
+
+        Every pair is aligned with a banded edit distance (see align_batch) and the events
+        are counted per (kmer, prev_event) context. The pairs are consumed in chunks of
+        chunk_size, so any iterable (e.g. a generator reading from disk) can be passed
+        without holding all pairs in memory.
+
         Args:
-            alignments: List of (input, output) sequence pairs
+            alignments: Iterable of (input, output) sequence pairs
             k: Memory parameter
-        
+            band: Extra diagonals of the alignment band
+            chunk_size: Number of pairs aligned at once
+            processes: Number of worker processes (None or 1 counts in this process)
+
         Returns:
-            Estimated ChannelParameters
+            Estimated ChannelParameters with the observed contexts
         """
-        # Count events for each (kmer, prev_event) context
-        transition_counts = defaultdict(lambda: defaultdict(int))
-        substitution_counts = defaultdict(lambda: defaultdict(int))
-        
-        # Process each alignment
-        for x, y in alignments:
-            # Here you would implement proper alignment and counting
-            # This is a placeholder for the concept
-            pass
-        
+        keys = np.zeros(0, dtype=np.int64)
+        counts = np.zeros(0, dtype=np.int64)
+        substitution_counts = np.zeros((4, 4), dtype=np.int64)
+
+        def accumulate(result):
+            nonlocal keys, counts, substitution_counts
+            chunk_keys, chunk_counts, chunk_substitutions = result
+            keys, index = np.unique(np.concatenate([keys, chunk_keys]), return_inverse=True)
+            counts = np.bincount(index, weights=np.concatenate([counts, chunk_counts]),
+                                 minlength=len(keys)).astype(np.int64)
+            substitution_counts += chunk_substitutions
+
+        iterator = iter(alignments)
+        chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+        if processes is None or processes <= 1:
+            for chunk in chunks:
+                accumulate(count_events(chunk, k, band))
+        else:
+            with Pool(processes=processes) as pool:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(pool.apply_async(_count_events_task, ((chunk, k, band),)))
+                    if len(pending) >= 2 * processes:
+                        accumulate(pending.popleft().get())
+                while pending:
+                    accumulate(pending.popleft().get())
+
         # Convert counts to probabilities
+        n_prev, n_events = len(PREV_EVENT_ORDER), len(EVENT_ORDER)
+        context_counts = defaultdict(lambda: np.zeros(n_events, dtype=np.int64))
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            context, event = divmod(key, n_events)
+            context_counts[divmod(context, n_prev)][event] = count
+
         transition_probs = {}
-        for context, event_counts in transition_counts.items():
-            total = sum(event_counts.values())
-            transition_probs[context] = {
-                event: count / total 
-                for event, count in event_counts.items()
+        for (context, prev), event_counts in sorted(context_counts.items()):
+            total = event_counts.sum()
+            transition_probs[(kmer_from_hash(context), PREV_EVENT_ORDER[prev])] = {
+                event: count / int(total)
+                for event, count in zip(EVENT_ORDER, event_counts.tolist()) if count
             }
-        
+
         substitution_probs = {}
-        for symbol, sub_counts in substitution_counts.items():
-            total = sum(sub_counts.values())
+        for i, symbol in enumerate(SIGMA_DNA):
+            sub_counts = substitution_counts[i].tolist()
+            total = sum(sub_counts)
             substitution_probs[symbol] = {
-                s: count / total 
-                for s, count in sub_counts.items()
+                s: sub_counts[j] / total if total else (1.0 / 3 if s != symbol else 0.0)
+                for j, s in enumerate(SIGMA_DNA)
             }
-        
+
         return ChannelParameters(
             k=k,
             transition_probs=transition_probs,
             substitution_probs=substitution_probs
         )
-
-
-
-
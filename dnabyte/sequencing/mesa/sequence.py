@@ -1,15 +1,21 @@
 import os
-import json
+from functools import partial
+
 import numpy as np
 
 from dnabyte.sequence import SimulateSequencing
-from .simulator import Graph
-from .sequencing_error import SequencingError
+from dnabyte.synthesis.mesa.error_engine import (
+    ErrorEngine, method_parameters, mutate_copy, master_seed_sequence, run_sharded
+)
 
 class MESA(SimulateSequencing):
     """
     Simulate sequencing errors using the MESA model.
     This model is based on the MESA (Molecular Error Simulation Algorithm) approach.
+
+    With mesa_sequencing_seed or mesa_sequencing_processes > 1, a flat list of reads is
+    sequenced in shards with seeds derived from the master seed (see run_sharded); the
+    result of a seeded run is the same for any number of processes.
     """
 
     def simulate(self, data):
@@ -50,6 +56,14 @@ class MESA(SimulateSequencing):
 
 
     def process_sequences(self, sequences, err_att_syn, err_rate_syn):
+
+        seed = getattr(self.params, 'mesa_sequencing_seed', None)
+        processes = getattr(self.params, 'mesa_sequencing_processes', None)
+        if (seed is not None or (processes or 1) > 1) and all(isinstance(element, str) for element in sequences):
+            mutate = partial(mutate_copy, process='sequencing', attributes=err_att_syn, error_rates=err_rate_syn)
+            modified_sequences = run_sharded(mutate, [(element, None) for element in sequences],
+                                             master_seed_sequence(seed), processes)
+            return modified_sequences, [{} for _ in modified_sequences]
         
         def process_element(element):
             if isinstance(element, list):
@@ -61,18 +75,13 @@ class MESA(SimulateSequencing):
                 org_seed = int(np.random.randint(0, 4294967295, dtype=np.uint32))
                 seed = np.uint32(float(org_seed) % 4294967296) if org_seed else None
 
-                # The Graph for all types of errors
-                g = Graph(None, element)
-
-                sequencing_err = SequencingError(element, g, 'sequencing', err_att_syn, err_rate_syn, seed=seed)
+                sequencing_err = ErrorEngine(element, 'sequencing', err_att_syn, err_rate_syn, seed=seed)
                 seed = sequencing_err.lit_error_rate_mutations()
-                mod_seq = g.graph.nodes[0]['seq']
-                mod_seq = mod_seq.replace(' ', '')
 
-                # Create error dict (currently empty, could be populated from graph if needed)
+                # Create error dict (currently empty, could be filled from sequencing_err.edits if needed)
                 error_dict = {}
 
-                return mod_seq, error_dict
+                return sequencing_err.sequence, error_dict
 
         modified_sequences, error_dicts = process_element(sequences)
         return modified_sequences, error_dicts
@@ -80,25 +89,10 @@ class MESA(SimulateSequencing):
 
     def sequencing_simulation(self, sequences, method_id):
 
-        # Get the directory where this module is located
-        module_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # Get the absolute path of the JSON file in the same directory as this module
-        file_path = os.path.join(module_dir, 'seq_table.json')
-
-        # get the error parameters for the designated method
-        # get dictionary of synthesis parameters from JSON file
-        
-        with open(file_path, 'r') as f:
-            seq_dict = json.load(f)
-
-        # Subset the dictionary
-        method_dict = {item['id']: item for item in seq_dict if item.get('id') == method_id}       
+        # error parameters of the designated method, read from seq_table.json once per process
+        file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'seq_table.json')
+        err_rate_syn, err_att_syn = method_parameters(file_path, method_id)
 
-        # get the error parameters for the designated method
-        err_rate_syn = method_dict[method_id]['err_data']
-        err_att_syn = method_dict[method_id]['err_attributes']
-        method_id = method_dict[method_id].get('id')
         sequences_modified, error_dict =  self.process_sequences(sequences, err_att_syn, err_rate_syn)
             
         return sequences_modified, error_dict
@@ -114,4 +108,24 @@ def attributes(params):
         else:
             mesa_sequencing_id = params.mesa_sequencing_id
         
-    return {"mesa_sequencing_id": mesa_sequencing_id}
\ No newline at end of file
+
+    if 'mesa_sequencing_seed' not in params.__dict__ or params.mesa_sequencing_seed is None:
+        # no master seed, the simulation follows the global NumPy state
+        mesa_sequencing_seed = None
+    else:
+        mesa_sequencing_seed = params.mesa_sequencing_seed
+
+    if 'mesa_sequencing_processes' not in params.__dict__ or params.mesa_sequencing_processes is None:
+        # simulate in this process
+        mesa_sequencing_processes = None
+    else:
+        if not isinstance(params.mesa_sequencing_processes, int) or params.mesa_sequencing_processes < 1:
+            raise ValueError("mesa_sequencing_processes must be a positive integer")
+        else:
+            mesa_sequencing_processes = params.mesa_sequencing_processes
+
+    return {
+        "mesa_sequencing_id": mesa_sequencing_id,
+        "mesa_sequencing_seed": mesa_sequencing_seed,
+        "mesa_sequencing_processes": mesa_sequencing_processes
+    }
\ No newline at end of file
@@ -23,6 +23,7 @@ from dnabyte.synthesis.mesa.error_probability import create_error_prob_function
 from dnabyte.synthesis.mesa.gc_content import overall_gc_content, windowed_gc_content
 from dnabyte.synthesis.mesa.homopolymers import homopolymer
 from dnabyte.synthesis.mesa.kmer import kmer_counting
+from dnabyte.synthesis.mesa.sequence_analysis import error_source_results
 from dnabyte.synthesis.mesa.undesired_subsequences import undesired_subsequences
 from dnabyte.synthesis.mesa.sequencing_error import SequencingError
 from dnabyte.synthesis.mesa.error_graph import Graph
@@ -256,10 +257,12 @@ def do_all(r_method, owner_id):
     # calculating all the different error probabilities and adding them to res
     pool = ThreadPool(processes=1)
 
+    # the k-mer, GC content and homopolymer results of all sequences at once
+    kmer_results, gc_results, homopolymer_results = error_source_results(
+        sequences, kmer_window, gc_window, kmer_error_function=kmer_error_prob_func,
+        gc_error_function=gc_error_prob_func, homopolymer_error_function=homopolymer_error_prob_func)
 
-
-
-    for sequence in sequences:
+    for index, sequence in enumerate(sequences):
         basefilename = uuid.uuid4().hex
 
         async_res = None
@@ -277,25 +280,11 @@ def do_all(r_method, owner_id):
         else:
             res = undesired_subsequences(sequence)
         usubseq_html = htmlify(res, sequence, description=True)
-        if kmer_window:
-            try:
-                kmer_res = kmer_counting(sequence, int(kmer_window), error_function=kmer_error_prob_func)
-            except:
-                kmer_res = kmer_counting(sequence, error_function=kmer_error_prob_func)
-        else:
-            kmer_res = kmer_counting(sequence, error_function=kmer_error_prob_func)
-
+        kmer_res = kmer_results[index]
         res.extend(kmer_res)
-        if gc_window:
-            try:
-                gc_window_res = windowed_gc_content(sequence, int(gc_window), error_function=gc_error_prob_func)
-            except:
-                gc_window_res = overall_gc_content(sequence, error_function=gc_error_prob_func)
-        else:
-            gc_window_res = overall_gc_content(sequence, error_function=gc_error_prob_func)
-
+        gc_window_res = gc_results[index]
         res.extend(gc_window_res)
-        homopolymer_res = homopolymer(sequence, error_function=homopolymer_error_prob_func)
+        homopolymer_res = homopolymer_results[index]
         res.extend(homopolymer_res)
 
         # The Graph for all types of errors
@@ -1,6 +1,9 @@
 import numpy as np
 
-from dnabyte.sequence import SimulateSequencing
+from dnabyte.sequence import (
+    SimulateSequencing, random_generator, reads_to_buffer, buffer_to_reads, substitution_table,
+    substitute_positional, insert_random_bases, delete_bases
+)
 
 class Nanopore(SimulateSequencing):
     """
@@ -26,24 +29,21 @@ class Nanopore(SimulateSequencing):
                 'G': {'A': 0.05, 'T': 0.05, 'C': 0.05, 'G': 0.85}
             }
 
-        sequenced_data = []
-        error_counter = 0
+        rng = random_generator(getattr(self.params, 'nanopore_seed', None))
+        reads, lengths = reads_to_buffer(data)
 
-        for sequence in data:
+        # Simulate substitutions
+        error_counter = self.simulate_substitutions(reads, lengths, substitution_table(substitution_matrix_nanopore), rng, k=0.01)
 
-            # Simulate substitutions
-            modified_sequence, counter = self.simulate_substitutions(sequence, substitution_matrix_nanopore, k=0.01)
-            error_counter += counter
+        # Simulate instertions
+        reads, lengths, counter = self.simulate_insertions(reads, lengths, rng, ins_prob=0.01)
+        error_counter += counter
 
-            # Simulate instertions
-            modified_sequence, counter = self.simulate_insertions(modified_sequence, ins_prob=0.01)
-            error_counter += counter
+        # Simulate deletions
+        reads, lengths, counter = self.simulate_deletions(reads, lengths, rng, del_prob=0.01)
+        error_counter += counter
 
-            # Simulate deletions
-            modified_sequence, counter = self.simulate_deletions(modified_sequence, del_prob=0.01)
-            error_counter += counter
-
-            sequenced_data.append(modified_sequence)
+        sequenced_data = buffer_to_reads(reads, lengths)
 
         info = {
             "average_copy_number": 1.0,
@@ -54,46 +54,32 @@ class Nanopore(SimulateSequencing):
         return sequenced_data, info
     
 
-    def simulate_substitutions(self, sequence, substitution_matrix_illumina, k=0.01):
-        new_sequence = list(sequence)
-        counter = 0
-        for p in range(len(sequence)):
-            if np.random.rand() < self.positional_error_rate(p, len(sequence), k):
-                counter += 1
-                original_base = sequence[p]
-                new_sequence[p] = self.get_new_base(original_base, substitution_matrix_illumina)
-        return ''.join(new_sequence), counter
-    
+    def simulate_substitutions(self, reads, lengths, table, rng, k=0.01):
+        """
+        Simulate substitutions in place in a batch of reads, see substitute_positional.
+
+        :param reads: Concatenated reads as np.uint8 buffer (see reads_to_buffer).
+        :param lengths: Read lengths.
+        :param table: Cumulative substitution probabilities (see substitution_table).
+        :param rng: np.random.Generator.
+        :param k: Maximum substitution rate, reached at the end of a read.
+        :return: Number of substitutions.
+        """
+        error_rate = lambda p, L: self.positional_error_rate(p, L, k)
+        return substitute_positional(reads, lengths, table, error_rate, k, rng)
 
-    def simulate_insertions(self, sequence, ins_prob=1e-6):
+    def simulate_insertions(self, reads, lengths, rng, ins_prob=1e-6):
         """
-        Simulate insertions in a sequence.
+        Simulate insertions in a batch of reads.
         """
-        new_sequence = list(sequence)
-        counter = 0
-        for p in range(len(sequence)):
-            if np.random.rand() < ins_prob:
-                counter += 1
-                new_sequence.insert(p, np.random.choice(['A', 'T', 'C', 'G']))
-        return ''.join(new_sequence), counter
-    
+        return insert_random_bases(reads, lengths, ins_prob, rng)
 
-    def simulate_deletions(self, sequence, del_prob=1e-6):
+    def simulate_deletions(self, reads, lengths, rng, del_prob=1e-6):
         """
-        Simulate deletions in a sequence.
+        Simulate deletions in a batch of reads.
         """
-        # Build a new sequence by skipping bases chosen for deletion.
-        new_sequence = []
-        counter = 0
-        # Iterate backwards to avoid index issues when popping
-        for p in range(len(sequence) - 1, -1, -1):
-            if np.random.rand() < del_prob:
-                counter += 1
-                continue
-            new_sequence.append(sequence[p])
-        new_sequence.reverse()  # Reverse to restore original order after building backwards    
-        return ''.join(new_sequence), counter
-    
+        return delete_bases(reads, lengths, del_prob, rng)
+
     # Positional error rate function
     def positional_error_rate(self, p, L, k=0.01):
         """
@@ -101,16 +87,13 @@ class Nanopore(SimulateSequencing):
         """    
         return k * (p / L)
 
-    # Function to get a new base based on substitution probabilities
-    def get_new_base(self, original_base, substitution_matrix_illumina):
-        bases = ['A', 'T', 'C', 'G']
-        probabilities = [substitution_matrix_illumina[original_base][b] for b in bases]
-        total_prob = sum(probabilities)
-        probabilities = [p / total_prob for p in probabilities]  # Normalize to ensure sum is 1
-        return np.random.choice(bases, p=probabilities)
-
 
 def attributes(params):
-    return {}
+    if 'nanopore_seed' not in params.__dict__ or params.nanopore_seed is None:
+        nanopore_seed = None
+    else:
+        nanopore_seed = params.nanopore_seed
+
+    return {"nanopore_seed": nanopore_seed}
 
 
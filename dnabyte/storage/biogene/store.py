@@ -1,6 +1,6 @@
 import random
 from dnabyte import InSilicoDNA, params
-from dnabyte.store import SimulateStorage
+from dnabyte.store import SimulateStorage, decay_copies
 
 class Biogene(SimulateStorage):
     # biogene: (anhydrous and anoxic atmosphere maintained inside hermetic capsules)
@@ -9,6 +9,8 @@ class Biogene(SimulateStorage):
     # Coudy, Delphine, et al. "Long term conservation of DNA at ambient temperature. 
     # Implications for DNA data storage." PLoS One 16.11 (2021): e0259868.
 
+    supports_counts = True
+
     def __init__(self, params, logger=None):
         self.years = params.years
 
@@ -35,6 +37,21 @@ class Biogene(SimulateStorage):
 
         return remaining_oligos, info
 
+    def simulate_counts(self, sequences, counts):
+        """
+        Simulate storage of a weighted pool, drawing the number of surviving copies per sequence.
+        :param sequences: A list of distinct DNA sequences.
+        :param counts: The copy number of every sequence.
+        :return: A tuple (remaining sequences, remaining copy numbers, info).
+        """
+        decay_probability = [1 - (1 - 1E-7)**(len(oligo) * self.years) for oligo in sequences]
+        remaining_oligos, remaining_counts, strand_breaks = decay_copies(sequences, counts, decay_probability)
+
+        info = {"number_of_strand_breaks": strand_breaks}
+        if remaining_oligos == []:
+            raise ValueError("All DNA strands have decayed during storage in biogene conditions. No sequences remain.")
+        return remaining_oligos, remaining_counts, info
+
 def check_parameter(parameter, default, min, max, inputparams):
     if not hasattr(inputparams, parameter) or inputparams.__dict__[parameter] is None:
         parameter_value = default
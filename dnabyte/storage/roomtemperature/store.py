@@ -1,10 +1,12 @@
 import random
-from dnabyte.store import SimulateStorage
+from dnabyte.store import SimulateStorage, decay_copies
 
 class Roomtemperature(SimulateStorage):
     # Reference::
     # half-life of DNA: 521 years => lambda = 0.00133
     
+    supports_counts = True
+
     def __init__(self, params, logger=None):
         self.years = params.years
 
@@ -32,6 +34,22 @@ class Roomtemperature(SimulateStorage):
             raise ValueError("All DNA strands have decayed during storage at room temperature. No sequences remain.")
         return remaining_oligos, info
 
+    def simulate_counts(self, sequences, counts):
+        """
+        Simulate storage of a weighted pool, drawing the number of surviving copies per sequence.
+        :param sequences: A list of distinct DNA sequences.
+        :param counts: The copy number of every sequence.
+        :return: A tuple (remaining sequences, remaining copy numbers, info).
+        """
+        lambda_decay = 0.00133
+        decay_probability = [1 - (1 - lambda_decay)**(len(oligo) * self.years) for oligo in sequences]
+        remaining_oligos, remaining_counts, strand_breaks = decay_copies(sequences, counts, decay_probability)
+
+        info = {"number_of_strand_breaks": strand_breaks}
+        if remaining_oligos == []:
+            raise ValueError("All DNA strands have decayed during storage at room temperature. No sequences remain.")
+        return remaining_oligos, remaining_counts, info
+
 def check_parameter(parameter, default, min, max, inputparams):
     if not hasattr(inputparams, parameter) or inputparams.__dict__[parameter] is None:
         parameter_value = default
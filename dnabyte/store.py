@@ -1,4 +1,6 @@
-from dnabyte.data_classes.insilicodna import InSilicoDNA
+import numpy as np
+
+from dnabyte.data_classes.insilicodna import InSilicoDNA, simulate_channel
 
 class SimulateStorage:
     """
@@ -37,28 +39,44 @@ class SimulateStorage:
             # Dynamically find the appropriate class based on storage_conditions
             try:
                 if self.storage_conditions == None:
-                    stored_data = InSilicoDNA(data=data.data)
+                    stored_data = InSilicoDNA(data=data.sequences, counts=data.counts)
                     info = {"degradation_info": {}, "number_of_strand_breaks": 0}
                     return stored_data, info
                 elif isinstance(self.storage_conditions, str):
-                    data_to_store = data.data
                     storage_class = self.storage_plugins[self.storage_conditions.lower()]
                     for key, value in self.storage_params.items():
                         setattr(self, key, value)
                     plugin = storage_class(self)  # Instantiate the plugin class
-                    data_sto, info = plugin.simulate(data_to_store)
-                    return InSilicoDNA(data_sto), info
+                    return simulate_channel(plugin, data)
                 
                 elif isinstance(self.storage_conditions, list):
-                    combined_data = data.data
+                    combined_data = data
                     for i, condition in enumerate(self.storage_conditions):
                         storage_class = self.storage_plugins[condition.lower()]
                         for key, value in self.storage_params_list[i].items():
                             setattr(self, key, value)
                         plugin = storage_class(self)  # Instantiate the plugin class
-                        combined_data, info = plugin.simulate(combined_data)
-                    return InSilicoDNA(combined_data), info
+                        combined_data, info = simulate_channel(plugin, combined_data)
+                    return combined_data, info
             except KeyError:
                 raise ValueError(f"Storage condition '{self.storage_conditions}' is not recognized. ")
         else:
             raise ValueError("The input data is not an instance of InSilicoDNA.")        
+
+
+def decay_copies(sequences, counts, decay_probability):
+    """
+    Remove decayed copies from a weighted pool.
+
+    The number of surviving copies of every sequence is drawn from a binomial distribution
+    instead of deciding for each copy separately.
+
+    :param sequences: List of distinct DNA sequences.
+    :param counts: Copy number of every sequence.
+    :param decay_probability: Decay probability of a single copy of every sequence.
+    :return: Tuple of (remaining sequences, remaining copy numbers, number of strand breaks).
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    remaining = np.random.binomial(counts, 1 - np.asarray(decay_probability, dtype=np.float64))
+    keep = np.flatnonzero(remaining)
+    return [sequences[i] for i in keep], remaining[keep], int(counts.sum() - remaining.sum())
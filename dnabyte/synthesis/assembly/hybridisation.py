@@ -0,0 +1,308 @@
+"""
+Rejection-free hybridisation of oligo pools.
+
+OligoPool.hybridise performs n rounds, in each of which two oligos of the pool are drawn at
+random and hybridised if they have complementary sticky ends. Most random pairs do not bind,
+so HybridisationEngine keeps the sticky ends in buckets and only draws compatible pairs:
+
+- The pool is held as species (distinct motifs) with their copy numbers, every oligo is
+  drawn with a probability proportional to the copy number of its species (mass action).
+- A sticky end is keyed by its side ('5' or '3') and its motif. Two oligos bind if they have
+  ends on the same side with complementary motifs (library.dictmotives), which are the cases
+  handled by OligoPool.pair.
+- Let W be the number of ordered pairs of such ends and N the number of oligos. A round draws
+  one of these pairs with probability W / (N (N - 1)); the failed rounds in between are
+  skipped with a single geometric draw.
+- A drawn pair of oligos with m pairs of compatible ends is accepted with probability 1 / m,
+  so every pair of oligos binds with probability 1 / (N (N - 1)) per round, as in the rounds
+  of OligoPool.hybridise. If most pairs bind anyway, the rounds are simulated one by one.
+
+Species are removed from the buckets by moving the last entry into the free place. The copy
+numbers of the species of a bucket and of all species, and the ordered pairs of every key, are
+kept in Fenwick trees, so drawing an oligo or a key and updating them takes O(log n).
+"""
+import random
+from math import floor, log1p
+
+# Above this share of compatible pairs, rounds are simulated one by one
+DENSE_SHARE = 0.5
+
+
+def sticky_ends(oligo):
+    """
+    (side, motif) of every sticky end of an oligo, as compared by OligoPool.pair.
+
+    :param oligo: Single or double stranded Oligo.
+    :return: Tuple of (side, motif) pairs.
+    """
+    if oligo.type == 'single_stranded':
+        ends = (('3', oligo.motifs[0]), ('5', oligo.motifs[1]))
+    elif oligo.type == 'double_stranded':
+        forward, reverse = oligo.motifs
+        ends = (('3', forward[0]), ('5', forward[-1]), ('5', reverse[0]), ('3', reverse[-1]))
+    else:
+        return ()
+    return tuple(end for end in ends if end[1])
+
+
+def species_key(oligo):
+    """
+    Key of the species of an oligo: the tuple of its motifs, or the oligo itself if it has none.
+
+    Mirrored double strands are different species, as they are different for OligoPool.pair.
+    """
+    if oligo.motifs:
+        return tuple(oligo.motifs)
+    return oligo
+
+
+class FenwickTree:
+    """
+    Growing list of non-negative numbers with prefix sums, updates and searches in O(log n).
+
+    :param values: Initial values.
+    """
+
+    def __init__(self, values=()):
+        self.values = []
+        self._tree = [0]
+        for value in values:
+            self.append(value)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, position):
+        return self.values[position]
+
+    def _prefix(self, i):
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def append(self, value=0):
+        # The new node covers the entries (i - lowbit(i), i], the last of which is the new one
+        i = len(self._tree)
+        self._tree.append(self._prefix(i - 1) - self._prefix(i - (i & -i)))
+        self.values.append(0)
+        self.add(i - 1, value)
+
+    def pop(self):
+        """Remove the last entry and return its value."""
+        value = self.values[-1]
+        self.add(len(self.values) - 1, -value)
+        self.values.pop()
+        self._tree.pop()
+        return value
+
+    def add(self, position, change):
+        self.values[position] += change
+        i = position + 1
+        while i < len(self._tree):
+            self._tree[i] += change
+            i += i & -i
+
+    def set(self, position, value):
+        self.add(position, value - self.values[position])
+
+    def find(self, target):
+        """Position of the first entry whose prefix sum exceeds target (0 <= target < sum)."""
+        position = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            i = position + step
+            if i < len(self._tree) and self._tree[i] <= target:
+                position = i
+                target -= self._tree[i]
+            step >>= 1
+        return position
+
+
+class HybridisationEngine:
+    """
+    Pool of oligo species indexed by their sticky ends.
+
+    :param species: Iterable of (oligo, copy number) pairs.
+    :param complements: Dictionary mapping every motif to its complement (library.dictmotives).
+    :param rng: Random number source with random() and randrange() (defaults to the random module).
+    """
+
+    def __init__(self, species, complements, rng=random):
+        self.complements = complements
+        self.rng = rng
+        self.size = 0
+        self.oligos = []
+        self.counts = []
+        self.ends = []
+        self.alive = []
+        self._alive_counts = FenwickTree()
+        self._alive_positions = []
+        self._slot_of = {}
+        # Every sticky end key gets an index; per index the bucket of end ids (4 * slot + end)
+        # with the copy numbers of their species, the number of oligos with that end, the index
+        # of the partner key and the number of ordered pairs of ends
+        self.keys = []
+        self._key_index = {}
+        self.buckets = []
+        self._bucket_counts = []
+        self._bucket_positions = []
+        self.bucket_sizes = []
+        self._partner_index = []
+        self.weights = FenwickTree()
+        self.total_weight = 0
+        for oligo, count in species:
+            self.add(oligo, count)
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def pool(self):
+        """(oligo, copy number) of every species of the pool."""
+        return [(self.oligos[slot], self.counts[slot]) for slot in self.alive]
+
+    def partner(self, key):
+        side, motif = key
+        return side, self.complements.get(motif)
+
+    def _index(self, key):
+        index = self._key_index.get(key)
+        if index is None:
+            index = self._key_index[key] = len(self.keys)
+            self.keys.append(key)
+            self.buckets.append([])
+            self._bucket_counts.append(FenwickTree())
+            self.bucket_sizes.append(0)
+            self.weights.append(0)
+            partner_index = self._key_index.get(self.partner(key))
+            self._partner_index.append(partner_index)
+            if partner_index is not None:
+                self._partner_index[partner_index] = index
+        return index
+
+    def _update_weights(self, index, change):
+        """Change the number of oligos with an end and recount its ordered pairs of ends."""
+        self.bucket_sizes[index] += change
+        partner_index = self._partner_index[index]
+        if partner_index is None:
+            return
+        weight = self.bucket_sizes[index] * self.bucket_sizes[partner_index]
+        change = weight - self.weights[index]
+        self.total_weight += change if partner_index == index else 2 * change
+        self.weights.set(index, weight)
+        self.weights.set(partner_index, weight)
+
+    def add(self, oligo, count=1):
+        """
+        Add copies of an oligo to its species.
+
+        :return: Slot of the species.
+        """
+        key = species_key(oligo)
+        slot = self._slot_of.get(key)
+        if slot is None:
+            slot = self._slot_of[key] = len(self.oligos)
+            self.oligos.append(oligo)
+            self.counts.append(0)
+            self.ends.append(tuple(self._index(end) for end in sticky_ends(oligo)))
+            self._alive_positions.append(None)
+            self._bucket_positions.extend((0, 0, 0, 0))
+        if not self.counts[slot]:
+            self._alive_positions[slot] = len(self.alive)
+            self.alive.append(slot)
+            self._alive_counts.append()
+            for j, index in enumerate(self.ends[slot]):
+                self._bucket_positions[4 * slot + j] = len(self.buckets[index])
+                self.buckets[index].append(4 * slot + j)
+                self._bucket_counts[index].append()
+        self.counts[slot] += count
+        self.size += count
+        self._alive_counts.add(self._alive_positions[slot], count)
+        for j, index in enumerate(self.ends[slot]):
+            self._bucket_counts[index].add(self._bucket_positions[4 * slot + j], count)
+            self._update_weights(index, count)
+        return slot
+
+    def remove(self, slot):
+        """Remove one copy of a species, a species without copies is swapped out of its buckets."""
+        self.counts[slot] -= 1
+        self.size -= 1
+        self._alive_counts.add(self._alive_positions[slot], -1)
+        for j, index in enumerate(self.ends[slot]):
+            position = self._bucket_positions[4 * slot + j]
+            self._bucket_counts[index].add(position, -1)
+            if not self.counts[slot]:
+                self._pop(self.buckets[index], self._bucket_counts[index], self._bucket_positions, position)
+            self._update_weights(index, -1)
+        if not self.counts[slot]:
+            self._pop(self.alive, self._alive_counts, self._alive_positions, self._alive_positions[slot])
+
+    @staticmethod
+    def _pop(entries, counts, positions, index):
+        """Remove the entry at index (without copies left) by moving the last entry into its place."""
+        last = entries.pop()
+        count = counts.pop()
+        if index < len(entries):
+            entries[index] = last
+            counts.set(index, count)
+            positions[last] = index
+
+    def multiplicity(self, slot_a, slot_b):
+        """Number of pairs of compatible sticky ends of two oligos."""
+        partners = [self._partner_index[index] for index in self.ends[slot_a]]
+        return sum(partners.count(index) for index in self.ends[slot_b])
+
+    def _draw(self, index):
+        """Draw the species of an oligo with the end of a bucket, proportional to its copy number."""
+        return self.buckets[index][self._bucket_counts[index].find(self.rng.randrange(self.bucket_sizes[index]))] // 4
+
+    def run(self, n, pair):
+        """
+        Simulate n rounds of hybridisation.
+
+        :param n: Number of rounds.
+        :param pair: Callable(oligo_A, oligo_B) returning the hybridised oligo, or an oligo
+            without motifs if they do not bind.
+        :return: Number of hybridisation events.
+        """
+        rounds = events = 0
+        while self.size > 1 and self.total_weight:
+            share = self.total_weight / (self.size * (self.size - 1))
+
+            if share >= DENSE_SHARE:
+                # Plain round: two distinct random oligos
+                rounds += 1
+                if rounds > n:
+                    break
+                i = self.rng.randrange(self.size)
+                j = self.rng.randrange(self.size - 1)
+                slot_a = self.alive[self._alive_counts.find(i)]
+                slot_b = self.alive[self._alive_counts.find(j + (j >= i))]
+                if not self.multiplicity(slot_a, slot_b):
+                    continue
+            else:
+                # Skip the rounds without a pair of compatible ends (log1p keeps tiny shares from
+                # rounding 1 - share to 1, the skip may be too large to be floored)
+                skip = log1p(-self.rng.random()) / log1p(-share)
+                if skip >= n - rounds:
+                    break
+                rounds += 1 + floor(skip)
+                index = self.weights.find(self.rng.random() * self.total_weight)
+                slot_a = self._draw(index)
+                slot_b = self._draw(self._partner_index[index])
+                # Both ends belong to the same oligo with probability 1 / copy number
+                if slot_a == slot_b and self.rng.random() * self.counts[slot_a] < 1:
+                    continue
+                if self.rng.random() * self.multiplicity(slot_a, slot_b) >= 1:
+                    continue
+
+            hybridised = pair(self.oligos[slot_a], self.oligos[slot_b])
+            if not hybridised.motifs:
+                continue
+            self.remove(slot_a)
+            self.remove(slot_b)
+            self.add(hybridised)
+            events += 1
+        return events
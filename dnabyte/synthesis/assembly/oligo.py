@@ -1,5 +1,7 @@
 import random
 
+from dnabyte.nucleotides import reverse_complement
+
 class Oligo:
     """
         This class models a single or double stranded oligonucleotide. It is always instanciated as single stranded,
@@ -19,6 +21,9 @@ class Oligo:
             Defaults to None.
         """
 
+    # Oligos are shared by all copies of their species in an OligoPool, slots keep them small
+    __slots__ = ('motifs', 'sequence', 'type')
+
     def __init__(self, motifs=None, sequence=None, type=None):
         self.motifs = motifs
         self.sequence = sequence
@@ -199,18 +204,14 @@ def nucleotide_complement(nucleotide):
     
 
 def complementmap(string):
-    compliment = ''
-    for i in string:
-        if i == 'A':
-            compliment += 'T'
-        if i == 'T':
-            compliment += 'A'
-        if i == 'C':
-            compliment += 'G'
-        if i == 'G':
-            compliment += 'C'
-    compliment = compliment[::-1]
-    return compliment
+    """Reverse complement of a DNA string (see dnabyte.nucleotides.reverse_complement)."""
+    return reverse_complement(string)
+
+
+def inverse_translation(translation_dict):
+    """Map symbols back to motifs; the tables of a Library carry this mapping precomputed."""
+    inverse = getattr(translation_dict, 'inverse', None)
+    return inverse if inverse is not None else {v: k for k, v in translation_dict.items()}
 
 
 def translate_element(element, translation_dictleft,translation_dictright):
@@ -269,8 +270,8 @@ def process_tuple_list_poly(tuple_list):
 def back_translate_nested_list(element, translation_dictleft,translation_dictright):
     # TODO. fix header
     retranslated = []
-    translation_dictleft = {v: k for k, v in translation_dictleft.items()}
-    translation_dictright = {v: k for k, v in translation_dictright.items()}
+    translation_dictleft = inverse_translation(translation_dictleft)
+    translation_dictright = inverse_translation(translation_dictright)
     
 
 
@@ -280,7 +281,7 @@ def back_translate_nested_list(element, translation_dictleft,translation_dictrig
             
             fiveprime = []
             threeprime = []
-            correcterdlist = process_tuple_list(element[i][j].pool[0].motifs)
+            correcterdlist = process_tuple_list(element[i][j].copies()[0][0].motifs)
             if type(correcterdlist[0]) == str or type(correcterdlist[1]) == str:
                 pass
             else:
@@ -303,19 +304,19 @@ def back_translate_nested_list(element, translation_dictleft,translation_dictrig
 def back_translate_nested_list_real(element, translation_dictleft,translation_dictright):
     # TODO. fix header
     retranslated = []
-    translation_dictleft = {v: k for k, v in translation_dictleft.items()}
-    translation_dictright = {v: k for k, v in translation_dictright.items()}
+    translation_dictleft = inverse_translation(translation_dictleft)
+    translation_dictright = inverse_translation(translation_dictright)
 
     
     # if len(element[0][0].pool) != 1: 
     #         ValueError("This did not perfectly hybridised")
     perpool = []
-    for i in range(len(element.pool)):
-        if 'A' == element.pool[i].motifs[1][0] or 'A' == element.pool[i].motifs[1][-1] or 'A' == element.pool[i].motifs[0][0] or 'A' == element.pool[i].motifs[0][-1]:
+    for oligo, count in element.copies():
+        if 'A' == oligo.motifs[1][0] or 'A' == oligo.motifs[1][-1] or 'A' == oligo.motifs[0][0] or 'A' == oligo.motifs[0][-1]:
             
             fiveprime = []
             threeprime = []
-            correcterdlist = process_tuple_list(element.pool[i].motifs)
+            correcterdlist = process_tuple_list(oligo.motifs)
             if type(correcterdlist[0]) == str or type(correcterdlist[1]) == str:
                 pass
             else:
@@ -331,7 +332,8 @@ def back_translate_nested_list_real(element, translation_dictleft,translation_di
                         if correcterdlist[1][k] != None:
                             threeprime.append(translation_dictright[correcterdlist[1][k]])
                 
-                perpool.append([''.join(fiveprime),''.join(threeprime)])
+                # one entry per copy of the species
+                perpool.extend([''.join(fiveprime), ''.join(threeprime)] for _ in range(count))
         else:
             pass
     return perpool
@@ -339,15 +341,15 @@ def back_translate_nested_list_real(element, translation_dictleft,translation_di
 def back_translate_nested_list_chain_real(element, translation_dictleft,translation_dictright):
     # TODO. fix header
     retranslated = []
-    translation_dictleft = {v: k for k, v in translation_dictleft.items()}
-    translation_dictright = {v: k for k, v in translation_dictright.items()}
+    translation_dictleft = inverse_translation(translation_dictleft)
+    translation_dictright = inverse_translation(translation_dictright)
     perpool = []
-    for i in range(len(element.pool)):
+    for oligo, count in element.copies():
         
         fiveprime = []
         threeprime = []
-        if 'empty' == element.pool[i].motifs[1][0] or 'empty' == element.pool[i].motifs[1][-1] or 'empty' == element.pool[i].motifs[0][0] or 'empty' == element.pool[i].motifs[0][-1]:
-            correcterdlist = process_tuple_list_empy(element.pool[i].motifs)
+        if 'empty' == oligo.motifs[1][0] or 'empty' == oligo.motifs[1][-1] or 'empty' == oligo.motifs[0][0] or 'empty' == oligo.motifs[0][-1]:
+            correcterdlist = process_tuple_list_empy(oligo.motifs)
 
             if type(correcterdlist[0]) == str or type(correcterdlist[1]) == str:
                 pass   
@@ -368,7 +370,8 @@ def back_translate_nested_list_chain_real(element, translation_dictleft,translat
                             if correcterdlist[1][k] != 'empty':
                                 threeprime.append(translation_dictright[correcterdlist[1][k]])
                     
-                perpool.append([''.join(fiveprime),''.join(threeprime)])
+                # one entry per copy of the species
+                perpool.extend([''.join(fiveprime), ''.join(threeprime)] for _ in range(count))
         else:
             pass
     return perpool
@@ -376,15 +379,15 @@ def back_translate_nested_list_chain_real(element, translation_dictleft,translat
 def back_translate_nested_list_chain(element, translation_dictleft,translation_dictright):
     # TODO. fix header
     retranslated = []
-    translation_dictleft = {v: k for k, v in translation_dictleft.items()}
-    translation_dictright = {v: k for k, v in translation_dictright.items()}
+    translation_dictleft = inverse_translation(translation_dictleft)
+    translation_dictright = inverse_translation(translation_dictright)
     
 
     perpool = []
     for i in range(len(element)):
         fiveprime = []
         threeprime = []
-        correcterdlist = process_tuple_list_empy(element[i].pool[0].motifs)
+        correcterdlist = process_tuple_list_empy(element[i].copies()[0][0].motifs)
 
         if type(correcterdlist[0]) == str or type(correcterdlist[1]) == str:
             pass
@@ -422,23 +425,23 @@ def translate_element_poly(element, library):
                 return Oligo([library.messageright[element[:len(element)//2]],library.messageleft[element[len(element)//2:]]])
         elif len(element) == len(library.generic[0])+len(library.messages[0])//2:
             
-            if element[:len(library.generic[0])] in library.generic or complementmap(element[:len(library.generic[0])]) in library.generic:
+            if element[:len(library.generic[0])] in library.genericlib:
                 if element[len(library.generic[0]):] in library.messageleft:
                     return Oligo([library.genericlib[element[:len(library.generic[0])]],library.messageleft[element[len(library.generic[0]):]]])
                 else:
                     return Oligo([library.genericlib[element[:len(library.generic[0])]],library.messageright[element[len(library.generic[0]):]]])
                 
-            elif element[len(library.messages[0])//2:] in library.generic or complementmap(element[len(library.messages[0])//2:]) in library.generic:
+            elif element[len(library.messages[0])//2:] in library.genericlib:
                 if element[:len(library.messages[0])//2] in library.messageleft:
                     return Oligo([library.messageleft[element[:len(library.messages[0])//2]],library.genericlib[element[len(library.messages[0])//2:]]])
                 else:
                     return Oligo([library.messageright[element[:len(library.messages[0])//2]],library.genericlib[element[len(library.messages[0])//2:]]])
                
         elif len(element) == len(library.generic[0])+len(library.position[0]):
-            if element[:len(library.generic[0])] in library.generic or complementmap(element[:len(library.generic[0])]) in library.generic:
+            if element[:len(library.generic[0])] in library.genericlib:
                 return Oligo([library.genericlib[element[:len(library.generic[0])]],library.connectorlib[element[len(library.generic[0]):]]])
                 
-            elif element[len(library.position[0]):] in library.generic or complementmap(element[len(library.position[0]):]) in library.generic:
+            elif element[len(library.position[0]):] in library.genericlib:
                 return Oligo([library.connectorlib[element[:len(library.position[0])]],library.genericlib[element[len(library.position[0]):]]])
            
         else:
@@ -452,13 +455,13 @@ def translate_nested_list_poly(nested_list, libraray):
 
 def back_translate_nested_list_poly(element, library):
     genericlib = library.genericlib
-    genericlib = {v: k for k, v in genericlib.items()}
+    genericlib = inverse_translation(genericlib)
     connectorlib = library.connectorlib
-    connectorlib = {v: k for k, v in connectorlib.items()}
+    connectorlib = inverse_translation(connectorlib)
     messageleft = library.messageleft
-    messageleft = {v: k for k, v in messageleft.items()}
+    messageleft = inverse_translation(messageleft)
     messageright = library.messageright
-    messageright = {v: k for k, v in messageright.items()}
+    messageright = inverse_translation(messageright)
 
     perpool = []
     for i in range(len(element)):
@@ -467,7 +470,7 @@ def back_translate_nested_list_poly(element, library):
 
         
         
-        correcterdlist = process_tuple_list_poly(element[i].pool[0].motifs)
+        correcterdlist = process_tuple_list_poly(element[i].copies()[0][0].motifs)
         if type(correcterdlist[0]) == str or type(correcterdlist[1]) == str:
             pass
         else:
@@ -513,22 +516,22 @@ def back_translate_nested_list_poly_binom(element, library):
     
 def back_translate_nested_list_poly_binom_real(element, library):
     genericlib = library.genericlib
-    genericlib = {v: k for k, v in genericlib.items()}
+    genericlib = inverse_translation(genericlib)
     connectorlib = library.connectorlib
-    connectorlib = {v: k for k, v in connectorlib.items()}
+    connectorlib = inverse_translation(connectorlib)
     messageleft = library.messageleft
-    messageleft = {v: k for k, v in messageleft.items()}
+    messageleft = inverse_translation(messageleft)
     messageright = library.messageright
-    messageright = {v: k for k, v in messageright.items()}
+    messageright = inverse_translation(messageright)
 
     perpool = []
     
-    for i in range(len(element.pool)):
+    for oligo, count in element.copies():
         fiveprime = []
         threeprime = []
         
-        if 'c0' == element.pool[i].motifs[1][0] or 'c0' == element.pool[i].motifs[1][-1] or 'c0' == element.pool[i].motifs[0][0] or 'c0' == element.pool[i].motifs[0][-1]:
-            correcterdlist = process_tuple_list_poly(element.pool[i].motifs)
+        if 'c0' == oligo.motifs[1][0] or 'c0' == oligo.motifs[1][-1] or 'c0' == oligo.motifs[0][0] or 'c0' == oligo.motifs[0][-1]:
+            correcterdlist = process_tuple_list_poly(oligo.motifs)
             if type(correcterdlist[0]) == str or type(correcterdlist[1]) == str:
                 pass
             else:
@@ -562,7 +565,8 @@ def back_translate_nested_list_poly_binom_real(element, library):
                             if correcterdlist[1][k] != 'empty':
                                 threeprime.append(messageright[correcterdlist[1][k]])
                     
-                perpool.append([''.join(fiveprime),''.join(threeprime)])
+                # one entry per copy of the species
+                perpool.extend([''.join(fiveprime), ''.join(threeprime)] for _ in range(count))
         else:
             pass
         
@@ -0,0 +1,398 @@
+"""
+Graph-free MESA error simulation.
+
+ErrorEngine applies the error model of SequencingError (random, pattern and homopolymer
+insertions, deletions and mismatches) directly on a bytearray. SequencingError records
+every edit as a node of a networkx graph, but the only thing the model reads back from the
+graph is which positions were already modified; the engine keeps just these positions.
+Random numbers are drawn from the global NumPy state in the same order as SequencingError,
+so both produce identical sequences for the same seed.
+
+run_sharded simulates many copies with one engine each, optionally in worker processes.
+Every copy gets its own seed, derived from a master seed via SeedSequence, so the result
+does not depend on the number of processes.
+"""
+import json
+import re
+from functools import lru_cache
+from multiprocessing import Pool
+from time import time
+
+import numpy as np
+
+# Edit modes, as stored in ErrorEngine.edits
+MODES = ('insertion', 'deletion', 'mismatch', 'pattern_mismatch')
+
+# Base order of SequencingError.bases
+BASES = ['A', 'T', 'C', 'G']
+
+# Deleted bases are kept as spaces until the sequence is read out
+_GAP = ord(' ')
+
+# Number of draws of SequencingError._randomly_indel_base before it scans the sequence
+_MAX_DRAWS = 5001
+
+# Runs of at least 3 equal characters, as found by homopolymers.homopolymer
+_HOMOPOLYMER = re.compile(rb'(.)\1{2,}', re.DOTALL)
+
+_EDIT_DTYPE = np.dtype([('position', np.int64), ('mode', np.uint8)])
+
+# Number of copies that share one SeedSequence child in run_sharded. It is fixed, so that the
+# seeds of the copies do not depend on the number of processes.
+SHARD_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def load_method_table(file_path):
+    """
+    Read a MESA method table (e.g. syn_table.json) once per process.
+
+    :param file_path: Path of the JSON table.
+    :return: Dictionary mapping method ids to their table entries.
+    """
+    with open(file_path, 'r') as f:
+        return {item['id']: item for item in json.load(f)}
+
+
+def method_parameters(file_path, method_id):
+    """
+    Look up the error rates and attributes of a method in a MESA table.
+
+    :param file_path: Path of the JSON table.
+    :param method_id: Id of the synthesis or sequencing method.
+    :return: Tuple of (err_data, err_attributes); both are shared and must not be modified.
+    """
+    method = load_method_table(file_path)[method_id]
+    return method['err_data'], method['err_attributes']
+
+
+@lru_cache(maxsize=None)
+def _cdf(probabilities):
+    cdf = np.array(probabilities, dtype=np.double).cumsum()
+    cdf /= cdf[-1]
+    return cdf
+
+
+def weighted_choice(weights):
+    """
+    Draw a key of a {key: probability} dictionary.
+
+    Equivalent to np.random.choice(list(weights.keys()), p=list(weights.values())), which
+    draws a single uniform number and looks it up in the normalized cumulative
+    probabilities, but caches the cumulative probabilities of every distinct table.
+    """
+    if not weights:
+        raise ValueError("Cannot choose from an empty set of weights")
+    keys = list(weights)
+    return keys[_cdf(tuple(weights.values())).searchsorted(np.random.random_sample(), side='right')]
+
+
+@lru_cache(maxsize=None)
+def _pattern_regex(patterns):
+    """Alternation of the mismatch patterns, longest first, as built by SequencingError."""
+    patterns = sorted(patterns, key=len)
+    patterns.reverse()
+    return re.compile("|".join(patterns).encode('ascii'))
+
+
+class ErrorEngine:
+    """
+    Lightweight replacement of SequencingError for a single sequence.
+
+    The engine supports the table driven model used by the MESA plugins, i.e. attributes
+    given as a dictionary; manual error probabilities (SequencingError.manual_mutation)
+    are not supported.
+
+    :param seq: DNA sequence.
+    :param process: Name of the simulated process, e.g. 'synthesis' or 'sequencing'.
+    :param attributes: Mutation attributes ('err_attributes' of a method table).
+    :param error_rates: Error rates ('err_data' of a method table).
+    :param seed: Seed of the global NumPy state (defaults to the current time, like SequencingError).
+    :param record: Keep the position and mode of every edit (see edits).
+    """
+
+    def __init__(self, seq, process, attributes, error_rates=None, seed=None, record=False):
+        self.buffer = bytearray(seq.encode('ascii'))
+        self.process = process
+        self.attributes = attributes
+        self.error_rates = error_rates if error_rates else {'insertion': 0.33, 'deletion': 0.34, 'mismatch': 0.33}
+        self.starts = []
+        self.visited = set()
+        self.number_of_edits = 0
+        self._edits = [] if record else None
+        self.seed = seed if seed else int(time())
+        np.random.seed(self.seed)
+
+    @property
+    def sequence(self):
+        """The mutated sequence without the deleted bases."""
+        return self.buffer.replace(b' ', b'').decode('ascii')
+
+    @property
+    def edits(self):
+        """
+        Position (at the time of the edit) and index into MODES of every edit.
+
+        :return: Structured np.ndarray with the fields 'position' and 'mode', or None if not recorded.
+        """
+        if self._edits is None:
+            return None
+        return np.array(self._edits, dtype=_EDIT_DTYPE)
+
+    def insertion(self):
+        self._indel_mutation('insertion')
+
+    def deletion(self):
+        self._indel_mutation('deletion')
+
+    def mismatch(self):
+        position, pattern, position_range = self._get_atts(self.attributes['mismatch'])
+        if not position or position == 'random':
+            if not pattern:
+                self._no_pattern_mismatch(position_range)
+            else:
+                self._pattern_mismatch(pattern, position_range)
+
+    def lit_error_rate_mutations(self, mutation_list=('insertion', 'mismatch', 'deletion')):
+        """
+        Mutate every position with the per-base rate of every mutation type.
+
+        Like SequencingError, the global state is reseeded before every mutation type and
+        one uniform number is drawn per position of the sequence. As the state right after
+        reseeding is known, the numbers up to the first hit are drawn as one block (and
+        drawn again after reseeding if there is a hit); after the first mutation, the
+        remaining positions are drawn one by one.
+
+        :param mutation_list: Mutation types, applied in this order.
+        :return: The seed.
+        """
+        for mutation_type in mutation_list:
+            err_rate = self.error_rates["raw_rate"] * self.error_rates[str(mutation_type)]
+            mutate = getattr(self, mutation_type)
+            length = len(self.buffer)
+            np.random.seed(self.seed)
+            hits = np.flatnonzero(np.random.random_sample(length) <= err_rate)
+            if not len(hits):
+                continue
+            np.random.seed(self.seed)
+            np.random.random_sample(hits[0] + 1)
+            mutate()
+            for _ in range(hits[0] + 1, length):
+                if np.random.random() <= err_rate:
+                    mutate()
+        return self.seed
+
+    def apply_mutations(self, mutation_counts):
+        """
+        Apply a given number of mutations of every type, e.g. sampled for a copy of a weighted pool.
+
+        :param mutation_counts: Dictionary mapping 'insertion', 'mismatch' and 'deletion' to the number of mutations.
+        :return: The seed.
+        """
+        for mutation_type, count in mutation_counts.items():
+            mutate = getattr(self, mutation_type)
+            for _ in range(count):
+                mutate()
+        return self.seed
+
+    def _indel_mutation(self, mode):
+        position, pattern, position_range = self._get_atts(self.attributes[mode])
+        if not position or position == 'random':
+            self._indel(pattern, position_range, mode)
+        elif position == 'homopolymer':
+            poly = self._homopolymers()
+            if poly:
+                self._homopolymer_indel(poly, pattern, mode)
+            else:
+                self._indel(pattern, position_range, mode)
+
+    def _homopolymers(self):
+        """(base, start, end) of every run of at least 3 equal characters, including gaps."""
+        return [(chr(match.group()[0]), match.start(), match.end() - 1)
+                for match in _HOMOPOLYMER.finditer(self.buffer)]
+
+    def _homopolymer_indel(self, poly, pattern, mode):
+        poly_b = {base for base, _, _ in poly if base != ' '}
+        # If the only homopolymers are gaps (deletions), indel a random base
+        if not poly_b:
+            return self._indel(None, None, mode)
+        if pattern:
+            poly_weights = {k: v for k, v in pattern.items() if k in poly_b}
+        else:
+            poly_weights = dict.fromkeys(base for base, _, _ in poly)
+            poly_weights.update((k, 1 / len(poly_weights)) for k in poly_weights)
+
+        s = sum(poly_weights.values())
+        norm_poly_weights = {k: float(v) / s for k, v in poly_weights.items()}
+        choose_ele = weighted_choice(norm_poly_weights)
+
+        candidates = [ele for ele in poly if ele[0] == choose_ele]
+        _, start, end = candidates[np.random.randint(0, len(candidates))]
+        pos = start + np.random.randint(0, end - start + 1)
+        return self._edit_base(pos, mode)
+
+    def _indel(self, pattern, position_range, mode):
+        if not pattern:
+            start, size = self._range(position_range)
+            return self._edit_base(start + np.random.randint(0, size), mode)
+        chosen_ele = weighted_choice(pattern)
+        return self._randomly_indel_base(chosen_ele, position_range, mode)
+
+    def _randomly_indel_base(self, chosen_ele, position_range, mode):
+        code = ord(chosen_ele) if len(chosen_ele) == 1 else -1
+        start, size = self._range(position_range)
+        window = self.buffer[start:start + size]
+        if code >= 0 and code in window:
+            for _ in range(_MAX_DRAWS):
+                pos = start + np.random.randint(0, size)
+                if self.buffer[pos] == code:
+                    return self._edit_base(pos, mode)
+        else:
+            np.random.randint(0, size, size=_MAX_DRAWS)
+
+        # The base does not occur in the range, fall back to the whole sequence
+        candidates = np.flatnonzero(np.frombuffer(bytes(self.buffer), dtype=np.uint8) == code)
+        if not len(candidates):
+            return
+        return self._edit_base(int(candidates[np.random.randint(0, len(candidates))]), mode)
+
+    def _no_pattern_mismatch(self, position_range):
+        if position_range and self.buffer[position_range[0]:position_range[1] + 1] == b' ':
+            return
+        start, size = self._range(position_range)
+        return self._edit_base(start + np.random.randint(0, size), 'mismatch')
+
+    def _pattern_mismatch(self, pattern, position_range):
+        if position_range:
+            window = self.buffer[position_range[0]:position_range[1] + 1]
+        else:
+            window = self.buffer
+        matches = [(match.span(), match.group()) for match in _pattern_regex(tuple(pattern)).finditer(window)]
+        if not matches:
+            return
+        (mod_start, orig_end), orig = matches[np.random.randint(0, len(matches))]
+        orig = orig.decode('ascii')
+
+        replacement = pattern[orig]
+        if type(replacement) == dict:
+            final_ele = weighted_choice(replacement)
+        elif type(replacement) == list:
+            final_ele = np.random.choice(replacement)
+        else:
+            final_ele = replacement
+        self._add_edit(mod_start, orig_end, len(final_ele) - len(orig), 'pattern_mismatch')
+        self.buffer[mod_start:orig_end] = str(final_ele).encode('ascii')
+
+    def _edit_base(self, pos, mode):
+        # The same position was already modified during this process
+        if pos in self.visited:
+            return
+        if mode == 'deletion':
+            self._add_edit(pos, pos + 1, 0, mode)
+            self.buffer[pos] = _GAP
+        elif mode == 'insertion':
+            ele = BASES[np.random.randint(0, len(BASES))]
+            self._add_edit(pos, pos + 1, 1, mode)
+            self.buffer.insert(pos, ord(ele))
+        else:
+            ele = BASES[np.random.randint(0, len(BASES))]
+            self._add_edit(pos, pos + 1, 0, mode)
+            self.buffer[pos] = ord(ele)
+
+    def _add_edit(self, mod_start, orig_end, offset, mode):
+        """Bookkeeping of Graph.add_node: shift the later edits and mark the position as visited."""
+        if mod_start in self.visited:
+            return
+        if offset:
+            for i, start in enumerate(self.starts):
+                if start >= orig_end:
+                    self.visited.discard(start)
+                    self.visited.add(start + offset)
+                    self.starts[i] = start + offset
+        self.starts.append(mod_start)
+        self.visited.add(mod_start)
+        self.number_of_edits += 1
+        if self._edits is not None:
+            self._edits.append((mod_start, MODES.index(mode)))
+
+    def _range(self, position_range):
+        if position_range:
+            return position_range[0], position_range[1] - position_range[0] + 1
+        return 0, len(self.buffer)
+
+    @staticmethod
+    def _get_atts(res):
+        if "position" in res:
+            position = weighted_choice(res["position"])
+        else:
+            position = None
+        return position, res.get('pattern'), res.get('position_range')
+
+
+def mutate_copy(sequence, mutation_counts, seed, process, attributes, error_rates,
+                mutation_types=('insertion', 'mismatch', 'deletion')):
+    """
+    Simulate the errors of a single copy with its own seed.
+
+    :param sequence: DNA sequence.
+    :param mutation_counts: Number of mutations of every type in mutation_types (see apply_mutations),
+        or None to mutate every position with the rates of the method (see lit_error_rate_mutations).
+    :param seed: Seed of the copy.
+    :param process: Name of the simulated process.
+    :param attributes: Mutation attributes ('err_attributes' of a method table).
+    :param error_rates: Error rates ('err_data' of a method table).
+    :param mutation_types: Mutation types, applied in this order.
+    :return: The mutated sequence.
+    """
+    engine = ErrorEngine(sequence, process, attributes, error_rates, seed=seed)
+    if mutation_counts is None:
+        engine.lit_error_rate_mutations(mutation_types)
+    else:
+        engine.apply_mutations(dict(zip(mutation_types, np.asarray(mutation_counts).tolist())))
+    return engine.sequence
+
+
+def master_seed_sequence(seed=None):
+    """
+    SeedSequence of a simulation run.
+
+    :param seed: Master seed. Without a seed, the entropy is drawn from the global NumPy
+        state, so that np.random.seed keeps controlling the simulation.
+    :return: np.random.SeedSequence.
+    """
+    if seed is None:
+        seed = int(np.random.randint(0, 2 ** 32, dtype=np.uint64))
+    return np.random.SeedSequence(seed)
+
+
+def _run_shard(task):
+    function, jobs, seed_sequence = task
+    # Seeds of 0 would make ErrorEngine fall back to the current time
+    seeds = np.random.default_rng(seed_sequence).integers(1, 2 ** 32, size=len(jobs)).tolist()
+    return [function(*job, seed) for job, seed in zip(jobs, seeds)]
+
+
+def run_sharded(function, jobs, seed_sequence, processes=None, shard_size=SHARD_SIZE):
+    """
+    Call function(*job, seed) for every job, shard by shard.
+
+    The jobs are split into shards of shard_size consecutive jobs and every shard gets a
+    child of seed_sequence (SeedSequence.spawn), from which the seeds of its jobs are drawn.
+    The shards are processed by a pool of worker processes and the results are returned in
+    the order of the jobs, so they are identical for any number of processes.
+
+    :param function: Picklable callable, e.g. a functools.partial of mutate_copy.
+    :param jobs: List of argument tuples.
+    :param seed_sequence: np.random.SeedSequence of the run (see master_seed_sequence).
+    :param processes: Number of worker processes (None or 1 runs in this process).
+    :param shard_size: Number of jobs per shard.
+    :return: List of the results of function.
+    """
+    shards = [jobs[i:i + shard_size] for i in range(0, len(jobs), shard_size)]
+    tasks = [(function, shard, child) for shard, child in zip(shards, seed_sequence.spawn(len(shards)))]
+    if processes is None or processes <= 1 or len(tasks) <= 1:
+        results = map(_run_shard, tasks)
+    else:
+        with Pool(processes=min(processes, len(tasks))) as pool:
+            results = pool.map(_run_shard, tasks)
+    return [result for shard in results for result in shard]
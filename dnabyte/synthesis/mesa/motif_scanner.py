@@ -0,0 +1,141 @@
+"""
+Batch search of many motifs with an Aho-Corasick automaton.
+
+The automaton is compiled into a dense transition table (states x symbol classes) with the
+failure links already resolved, so a batch of sequences is scanned column by column: a
+single table lookup advances every sequence of the batch by one character. Occurrences are
+returned as arrays of (sequence index, start position, motif index).
+"""
+from collections import deque
+from functools import lru_cache
+
+import numpy as np
+
+from dnabyte.encoding.consensus import sequences_to_matrix
+
+# Number of sequences scanned at once; bounds the size of the character matrix
+BATCH_SIZE = 2 ** 16
+
+
+class MotifScanner:
+    """
+    Aho-Corasick automaton over a set of motifs.
+
+    Motifs are matched literally and case-sensitively; characters that do not occur in any
+    motif (including the padding of shorter sequences) lead back to the root state.
+
+    :param motifs: Iterable of motif strings; repeated motifs are only kept once.
+    """
+
+    def __init__(self, motifs):
+        self.motifs = list(dict.fromkeys(motifs))
+        if not all(self.motifs):
+            raise ValueError("Motifs must not be empty")
+        encoded = [motif.encode('ascii') for motif in self.motifs]
+        self.lengths = np.array([len(motif) for motif in encoded], dtype=np.int64)
+
+        # Class 0 stands for every character that does not occur in a motif
+        codes = sorted(set(b''.join(encoded)) - {0})
+        self.symbol_classes = np.zeros(256, dtype=np.intp)
+        self.symbol_classes[codes] = np.arange(1, len(codes) + 1)
+
+        # Trie of the motifs
+        children, outputs = [{}], [[]]
+        for index, motif in enumerate(encoded):
+            state = 0
+            for symbol in self.symbol_classes[list(motif)].tolist():
+                if symbol not in children[state]:
+                    children[state][symbol] = len(children)
+                    children.append({})
+                    outputs.append([])
+                state = children[state][symbol]
+            outputs[state].append(index)
+
+        # Resolve the failure links breadth first, every row of the table is final once its
+        # state is dequeued, as the failure state is always closer to the root
+        table = np.zeros((len(children), len(codes) + 1), dtype=np.int32)
+        fail = [0] * len(children)
+        queue = deque(children[0].values())
+        table[0, list(children[0])] = list(children[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            table[state] = table[fail[state]]
+            for symbol, child in children[state].items():
+                fail[child] = int(table[fail[state], symbol])
+                table[state, symbol] = child
+                queue.append(child)
+        self.table = table
+
+        # Motifs ending in every state, in CSR layout
+        self.output_offsets = np.zeros(len(outputs) + 1, dtype=np.int64)
+        np.cumsum([len(output) for output in outputs], out=self.output_offsets[1:])
+        self.output_motifs = np.array([index for output in outputs for index in output], dtype=np.int64)
+        self.accepting = np.diff(self.output_offsets) > 0
+
+    def scan(self, sequences, first_per_start=False):
+        """
+        Find all (possibly overlapping) occurrences of the motifs.
+
+        :param sequences: List of DNA sequences.
+        :param first_per_start: Only report the motif with the lowest index among the motifs
+            that start at the same position, like an overlapped search for the alternation of
+            all motifs.
+        :return: Tuple of np.int64 arrays (sequence index, start position, motif index),
+            sorted by sequence index, start position and motif index.
+        """
+        sequences = list(sequences)
+        rows, ends, states = [], [], []
+        for offset in range(0, len(sequences), BATCH_SIZE):
+            symbols = self.symbol_classes[sequences_to_matrix(sequences[offset:offset + BATCH_SIZE])]
+            state = np.zeros(len(symbols), dtype=np.int32)
+            for column in range(symbols.shape[1]):
+                state = self.table[state, symbols[:, column]]
+                hits = np.flatnonzero(self.accepting[state])
+                if len(hits):
+                    rows.append(hits + offset)
+                    ends.append(np.full(len(hits), column, dtype=np.int64))
+                    states.append(state[hits])
+        if not rows:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty.copy(), empty.copy()
+
+        # Expand every accepting state into the motifs that end in it
+        states = np.concatenate(states)
+        counts = self.output_offsets[states + 1] - self.output_offsets[states]
+        firsts = np.repeat(self.output_offsets[states], counts)
+        ranks = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        motifs = self.output_motifs[firsts + ranks]
+        sequence_index = np.repeat(np.concatenate(rows), counts)
+        starts = np.repeat(np.concatenate(ends), counts) - self.lengths[motifs] + 1
+
+        order = np.lexsort((motifs, starts, sequence_index))
+        sequence_index, starts, motifs = sequence_index[order], starts[order], motifs[order]
+        if first_per_start:
+            keep = np.ones(len(starts), dtype=bool)
+            keep[1:] = (sequence_index[1:] != sequence_index[:-1]) | (starts[1:] != starts[:-1])
+            sequence_index, starts, motifs = sequence_index[keep], starts[keep], motifs[keep]
+        return sequence_index, starts, motifs
+
+    def screen(self, sequences):
+        """
+        Flag the sequences that contain at least one motif, e.g. to filter encoder outputs.
+
+        :param sequences: List of DNA sequences.
+        :return: Boolean np.ndarray with one entry per sequence.
+        """
+        sequences = list(sequences)
+        flagged = np.zeros(len(sequences), dtype=bool)
+        flagged[self.scan(sequences)[0]] = True
+        return flagged
+
+
+@lru_cache(maxsize=32)
+def motif_scanner(motifs):
+    """
+    Build the scanner of a set of motifs once and reuse it across calls.
+
+    :param motifs: Tuple of motif strings.
+    :return: MotifScanner.
+    """
+    return MotifScanner(motifs)
@@ -0,0 +1,302 @@
+"""
+Vectorized error source analysis of batches of sequences.
+
+The batch is held as one concatenated ASCII buffer with the offset of every sequence:
+- GC content of windows from the cumulative GC count (prefix sums) at the window bounds,
+- homopolymers from a run-length encoding of the buffer,
+- repeated k-mers from rolling 2-bit hashes, grouped by sorting.
+
+The error functions are only evaluated once per distinct argument, and the records are the
+same as those of windowed_gc_content, homopolymer and kmer_counting for every single sequence.
+"""
+import numpy as np
+
+from dnabyte.data_classes.dnapool import encode_nucleotides, INVALID_SYMBOL
+from . import gc_content, homopolymers, kmer
+
+# Longest k-mer whose 2-bit hash fits into an int64
+MAX_HASHED_K = 31
+
+
+def concatenate(sequences):
+    """
+    Concatenate a batch of sequences.
+
+    :param sequences: List of sequences.
+    :return: Tuple of (np.uint8 buffer of ASCII codes, np.int64 array of the len(sequences) + 1 offsets).
+    """
+    offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+    np.cumsum([len(sequence) for sequence in sequences], out=offsets[1:])
+    buffer = np.frombuffer(''.join(sequences).encode('ascii', errors='replace'), dtype=np.uint8)
+    return buffer, offsets
+
+
+def gc_prefix_sums(buffer):
+    """
+    Cumulative number of 'G' and 'C' in a buffer.
+
+    :param buffer: np.uint8 buffer of ASCII codes.
+    :return: np.int64 array of length len(buffer) + 1; entry i counts the GC bases before position i.
+    """
+    counts = np.zeros(len(buffer) + 1, dtype=np.int64)
+    np.cumsum((buffer == ord('G')) | (buffer == ord('C')), out=counts[1:])
+    return counts
+
+
+def homopolymer_runs(buffer, offsets):
+    """
+    Run-length encoding of a concatenated batch; runs do not extend across sequences.
+
+    :param buffer: np.uint8 buffer of ASCII codes (see concatenate).
+    :param offsets: Offsets of the sequences in the buffer.
+    :return: Tuple of np.int64 arrays (sequence index, start position in the sequence, length)
+        and the np.uint8 character of every run.
+    """
+    boundaries = np.zeros(len(buffer), dtype=bool)
+    if len(buffer):
+        boundaries[0] = True
+        boundaries[1:] = buffer[1:] != buffer[:-1]
+        boundaries[offsets[:-1][offsets[:-1] < len(buffer)]] = True
+    starts = np.flatnonzero(boundaries)
+    lengths = np.diff(np.append(starts, len(buffer)))
+    rows = np.searchsorted(offsets, starts, side='right') - 1
+    return rows, starts - offsets[rows], lengths, buffer[starts]
+
+
+def kmer_hashes(buffer, offsets, k):
+    """
+    Rolling 2-bit hashes of all k-mers of a concatenated batch of 'A', 'C', 'G', 'T' sequences.
+
+    :param buffer: np.uint8 buffer of ASCII codes (see concatenate).
+    :param offsets: Offsets of the sequences in the buffer.
+    :param k: Length of the k-mers (at most MAX_HASHED_K).
+    :return: Tuple of np.int64 arrays (sequence index, start position in the sequence, hash)
+        with one entry per k-mer that lies within a sequence.
+    """
+    if not 0 < k <= MAX_HASHED_K:
+        raise ValueError(f"k must be between 1 and {MAX_HASHED_K}")
+    symbols = encode_nucleotides(buffer.tobytes()).astype(np.int64)
+    if np.any(symbols == INVALID_SYMBOL):
+        raise ValueError("Sequences must only contain 'A', 'C', 'G' and 'T'")
+
+    n = max(len(buffer) - k + 1, 0)
+    hashes = np.zeros(n, dtype=np.int64)
+    for j in range(k):
+        hashes <<= 2
+        hashes |= symbols[j:j + n]
+
+    lengths = np.diff(offsets)
+    counts = np.maximum(lengths - k + 1, 0)
+    rows = np.repeat(np.arange(len(lengths)), counts)
+    positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return rows, positions, hashes[offsets[:-1][rows] + positions]
+
+
+def _positive_results(function, values):
+    """
+    Call function once per distinct value and keep the positive results.
+
+    :return: Tuple of (indices of the values with a positive result, their results).
+    """
+    distinct, inverse = np.unique(values, return_inverse=True)
+    results = [function(value) for value in distinct.tolist()]
+    positive = np.array([result > 0.0 for result in results], dtype=bool)
+    kept = np.flatnonzero(positive[inverse])
+    return kept, [results[index] for index in inverse[kept].tolist()]
+
+
+def windowed_gc_content_batch(sequences, window_size=15, error_function=None):
+    """
+    Error probabilities of the GC content of consecutive windows (see gc_content.windowed_gc_content).
+
+    :param sequences: List of sequences.
+    :param window_size: Window size.
+    :param error_function: Function of the GC percentage (defaults to gc_content.default_error_function).
+    :return: List with the list of results of every sequence.
+    """
+    if error_function is None:
+        error_function = gc_content.default_error_function
+    buffer, offsets = concatenate(sequences)
+    gc = gc_prefix_sums(buffer)
+
+    lengths = np.diff(offsets)
+    n_windows = -(-lengths // window_size)
+    rows = np.repeat(np.arange(len(sequences)), n_windows)
+    windows = np.arange(n_windows.sum()) - np.repeat(np.cumsum(n_windows) - n_windows, n_windows)
+    starts = windows * window_size
+    ends = np.minimum(starts + window_size, lengths[rows])
+    gc_sums = gc[offsets[rows] + ends] - gc[offsets[rows] + starts]
+
+    # every window is identified by its GC count and length
+    kept, error_probs = _positive_results(
+        lambda key: error_function(1.0 * (key // (window_size + 1)) / (key % (window_size + 1)) * 100.0),
+        gc_sums * (window_size + 1) + ends - starts)
+    result = [[] for _ in sequences]
+    for row, start, end, error_prob in zip(rows[kept].tolist(), starts[kept].tolist(), ends[kept].tolist(),
+                                           error_probs):
+        result[row].append(gc_content.create_result(start, end - 1, error_prob,
+                                                    "window_gc_content_" + str(len(result[row]))))
+    return result
+
+
+def homopolymer_batch(sequences, error_function=None):
+    """
+    Error probabilities of all homopolymers (see homopolymers.homopolymer).
+
+    :param sequences: List of sequences.
+    :param error_function: Function of the homopolymer length (defaults to homopolymers.default_error_function).
+    :return: List with the list of results of every sequence.
+    """
+    if error_function is None:
+        error_function = homopolymers.default_error_function
+    rows, starts, lengths, chars = homopolymer_runs(*concatenate(sequences))
+
+    kept, error_probs = _positive_results(error_function, lengths)
+    result = [[] for _ in sequences]
+    for row, start, length, char, error_prob in zip(rows[kept].tolist(), starts[kept].tolist(),
+                                                    lengths[kept].tolist(), chars[kept].tolist(), error_probs):
+        tmp = homopolymers.create_result(start, start + length - 1, error_prob, len(result[row]))
+        tmp['base'] = chr(char)
+        result[row].append(tmp)
+    return result
+
+
+def kmer_counting_batch(sequences, k=20, upper_bound=1, error_function=None):
+    """
+    Error probabilities of the k-mers that occur more than upper_bound times in a sequence
+    (see kmer.kmer_counting).
+
+    The k-mers are compared by their 2-bit hashes. Batches with other characters than 'A',
+    'C', 'G', 'T' or k > MAX_HASHED_K are compared by their bytes instead.
+
+    :param sequences: List of sequences.
+    :param k: Length of the k-mers.
+    :param upper_bound: Largest number of occurrences without error.
+    :param error_function: Function of the number of occurrences (defaults to kmer.default_error_function).
+    :return: List with the results of every sequence; like kmer_counting, {} if there are none.
+    """
+    if error_function is None:
+        error_function = kmer.default_error_function
+    buffer, offsets = concatenate(sequences)
+    try:
+        rows, positions, keys = kmer_hashes(buffer, offsets, k)
+    except ValueError:
+        rows, positions, keys = _kmer_bytes(buffer, offsets, k)
+
+    if upper_bound >= 1 and len(keys):
+        # Only k-mers that occur at least twice in the batch can repeat within a sequence
+        sorted_keys = np.sort(keys)
+        shared = np.unique(sorted_keys[1:][sorted_keys[1:] == sorted_keys[:-1]])
+        candidates = np.flatnonzero(np.isin(keys, shared))
+        rows, positions, keys = rows[candidates], positions[candidates], keys[candidates]
+
+    # Group equal k-mers of a sequence, the positions of every group in increasing order
+    order = np.lexsort((positions, keys, rows))
+    rows, positions, keys = rows[order], positions[order], keys[order]
+    new_group = np.ones(len(rows), dtype=bool)
+    new_group[1:] = (rows[1:] != rows[:-1]) | (keys[1:] != keys[:-1])
+    group_starts = np.flatnonzero(new_group)
+    group_sizes = np.diff(np.append(group_starts, len(rows)))
+
+    # Like kmer_counting, the k-mers are reported in the order of their first occurrence
+    repeated = np.flatnonzero(group_sizes > upper_bound)
+    repeated = repeated[np.lexsort((positions[group_starts[repeated]], rows[group_starts[repeated]]))]
+    kept, error_probs = _positive_results(error_function, group_sizes[repeated])
+
+    result = [[] for _ in sequences]
+    for group, error_prob in zip(repeated[kept].tolist(), error_probs):
+        start = group_starts[group]
+        row = int(rows[start])
+        first = int(positions[start])
+        repeated_kmer = sequences[row][first:first + k]
+        for position in positions[start:start + group_sizes[group]].tolist():
+            result[row].append({'kmer': repeated_kmer, 'startpos': position, 'endpos': position + k - 1,
+                                'errorprob': error_prob, 'identifier': repeated_kmer})
+    return [res if res else {} for res in result]
+
+
+def _kmer_bytes(buffer, offsets, k):
+    """K-mers of any characters, with the layout of kmer_hashes but the index of the distinct k-mer as key."""
+    lengths = np.diff(offsets)
+    counts = np.maximum(lengths - k + 1, 0)
+    rows = np.repeat(np.arange(len(lengths)), counts)
+    positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    if not len(rows):
+        return rows, positions, np.zeros(0, dtype=np.int64)
+    windows = np.lib.stride_tricks.sliding_window_view(buffer, k)[offsets[:-1][rows] + positions]
+    return rows, positions, np.unique(windows, return_inverse=True, axis=0)[1].reshape(-1)
+
+
+def _window_size(window):
+    """Window size of a request as do_all reads it, or None if it is empty or not a positive number."""
+    if not window:
+        return None
+    try:
+        size = int(window)
+    except (TypeError, ValueError):
+        return None
+    return size if size > 0 else None
+
+
+def error_source_results(sequences, kmer_window=None, gc_window=None, kmer_error_function=None,
+                         gc_error_function=None, homopolymer_error_function=None):
+    """
+    K-mer, GC content and homopolymer results of the sequences of a simulation request (see
+    simulator.do_all).
+
+    The window sizes are read as do_all reads them: without a valid k-mer window, k is 20, and without a
+    valid GC window, the overall GC content is used. The batch analyzers are used where they give the
+    results of the single sequence analyzers; otherwise (window sizes that are not positive, no k-mer error
+    function, empty sequences, a failing error function) the sequences are analyzed one by one, as before.
+
+    :param sequences: List of sequences.
+    :param kmer_window: k of the request (any value, may be empty).
+    :param gc_window: GC window size of the request (any value, may be empty).
+    :return: Tuple of lists (k-mer results, GC content results, homopolymer results) with the results
+        of every sequence.
+    """
+    k = _window_size(kmer_window)
+    kmer_results = gc_results = homopolymer_results = None
+    if kmer_error_function is not None and (k is not None or not kmer_window):
+        try:
+            kmer_results = kmer_counting_batch(sequences, 20 if k is None else k, error_function=kmer_error_function)
+        except Exception:
+            pass
+    if kmer_results is None:
+        kmer_results = []
+        for sequence in sequences:
+            if kmer_window:
+                try:
+                    kmer_results.append(kmer.kmer_counting(sequence, int(kmer_window), error_function=kmer_error_function))
+                except:
+                    kmer_results.append(kmer.kmer_counting(sequence, error_function=kmer_error_function))
+            else:
+                kmer_results.append(kmer.kmer_counting(sequence, error_function=kmer_error_function))
+
+    window_size = _window_size(gc_window)
+    if window_size is not None:
+        try:
+            gc_results = windowed_gc_content_batch(sequences, window_size, error_function=gc_error_function)
+        except Exception:
+            pass
+    if gc_results is None:
+        gc_results = []
+        for sequence in sequences:
+            if gc_window:
+                try:
+                    gc_results.append(gc_content.windowed_gc_content(sequence, int(gc_window),
+                                                                     error_function=gc_error_function))
+                except:
+                    gc_results.append(gc_content.overall_gc_content(sequence, error_function=gc_error_function))
+            else:
+                gc_results.append(gc_content.overall_gc_content(sequence, error_function=gc_error_function))
+
+    if all(sequences):
+        try:
+            homopolymer_results = homopolymer_batch(sequences, error_function=homopolymer_error_function)
+        except Exception:
+            pass
+    if homopolymer_results is None:
+        homopolymer_results = [homopolymers.homopolymer(sequence, error_function=homopolymer_error_function)
+                               for sequence in sequences]
+    return kmer_results, gc_results, homopolymer_results
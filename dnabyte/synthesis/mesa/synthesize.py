@@ -1,16 +1,21 @@
 import os
-import json
+from functools import partial
+
 import numpy as np
 
 from dnabyte.synthesize import SimulateSynthesis
-from .error_graph import Graph
-from .sequencing_error import SequencingError
+from dnabyte.data_classes.insilicodna import InSilicoDNA, mutate_copies
+from .error_engine import ErrorEngine, method_parameters, mutate_copy, master_seed_sequence, run_sharded
 
 
 class MESA(SimulateSynthesis):
     """
     MESA (Molecular Error Simulation Algorithm) is a class that simulates sequencing errors in DNA sequences.
-    It uses a graph-based approach to model the sequencing process and introduces errors based on specified parameters.
+    It introduces errors based on the parameters of the designated synthesis method (see ErrorEngine).
+
+    With mesa_synthesis_seed or mesa_synthesis_processes > 1, the copies are mutated in shards
+    with seeds derived from the master seed (see run_sharded); the result of a seeded run is
+    the same for any number of processes.
     """
     
     def simulate(self, data):
@@ -18,56 +23,54 @@ class MESA(SimulateSynthesis):
         Simulate sequencing errors using the MESA model.
         
         :param data: A list of DNA sequences.
-        :return: A list of sequenced DNA sequences.
+        :return: An InSilicoDNA object holding the synthesized sequences with their copy numbers.
         """
-        method_id = self.params.mesa_synthesis_id
-
-        # Get the absolute path of syn_table.json relative to this source file
+        # error parameters of the designated method, read from syn_table.json once per process
         file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'syn_table.json')
+        err_rate_syn, err_att_syn = method_parameters(file_path, self.params.mesa_synthesis_id)
+
+        seed = getattr(self.params, 'mesa_synthesis_seed', None)
+        processes = getattr(self.params, 'mesa_synthesis_processes', None)
+        if seed is not None or (processes or 1) > 1:
+            pool_seed, copy_seed = master_seed_sequence(seed).spawn(2)
+            rng = np.random.RandomState(np.random.MT19937(pool_seed))
+            executor = partial(run_sharded, seed_sequence=copy_seed, processes=processes)
+        else:
+            rng, executor = np.random, None
 
-        # get the error parameters for the designated method
-        # get dictionary of synthesis parameters from JSON file
-        with open(file_path, 'r') as f:
-            synth_dict = json.load(f)
-
-        # Subset the dictionary
-        method_dict = {item['id']: item for item in synth_dict if item.get('id') == method_id}       
-
-        # get the error parameters for the designated method
-        err_rate_syn = method_dict[method_id]['err_data']
-        err_att_syn = method_dict[method_id]['err_attributes']
-        method_id = method_dict[method_id].get('id')
-
-        # create copies of sequences based on normal distribution
-        sequences_multiples = [seq for seq in data for _ in range(max(1, int(np.random.normal(self.params.mean, self.params.std_dev))))]
+        # draw the copy number of every sequence from a normal distribution
+        copy_numbers = np.maximum(1, rng.normal(self.params.mean, self.params.std_dev, size=len(data)).astype(np.int64))
 
-        sequences_modified = []
+        # per-base rate of every mutation type, as applied by ErrorEngine.lit_error_rate_mutations
+        mutation_types = ['insertion', 'mismatch', 'deletion']
+        rates = [err_rate_syn["raw_rate"] * err_rate_syn[mutation_type] for mutation_type in mutation_types]
 
-        for original_sequence in sequences_multiples:
+        def mutate(original_sequence, mutation_counts):
 
             # generate seed
             org_seed = int(np.random.randint(0, 4294967295, dtype=np.uint32))
             seed = np.uint32(float(org_seed) % 4294967296) if org_seed else None
 
-            # The Graph for all types of errors
-            g = Graph(None, original_sequence)
+            synth_err = ErrorEngine(original_sequence, 'synthesis', err_att_syn, err_rate_syn, seed=seed)
+            synth_err.apply_mutations(dict(zip(mutation_types, mutation_counts.tolist())))
+            return synth_err.sequence
 
-            synth_err = SequencingError(original_sequence, g, 'synthesis', err_att_syn, err_rate_syn, seed=seed)
-            seed = synth_err.lit_error_rate_mutations()
+        if executor is not None:
+            # copies get their seeds from run_sharded, the function is sent to the worker processes
+            mutate = partial(mutate_copy, process='synthesis', attributes=err_att_syn, error_rates=err_rate_syn,
+                             mutation_types=mutation_types)
 
-            mod_seq = g.graph.nodes[0]['seq']
-            mod_seq = mod_seq.replace(' ', '')
+        # only the copies hit by at least one error are simulated, identical copies are kept together
+        sequences, counts, number_of_errors = mutate_copies(list(data), copy_numbers, rates, mutate, rng, executor)
 
-            sequences_modified.append(mod_seq)
-
-        average_copy_number = len(sequences_modified) / len(data)
+        average_copy_number = copy_numbers.sum() / len(data)
         info = {
             "average_copy_number": average_copy_number,
-            "number_of_synthesis_errors": "unknown",
+            "number_of_synthesis_errors": number_of_errors,
             "error_dict": {}
         }
 
-        return sequences_modified, info
+        return InSilicoDNA(sequences, counts=counts), info
         
 def attributes(params):
 
@@ -93,8 +96,25 @@ def attributes(params):
         else:
             mesa_synthesis_id = params.mesa_synthesis_id
 
+    if 'mesa_synthesis_seed' not in params.__dict__ or params.mesa_synthesis_seed is None:
+        # no master seed, the simulation follows the global NumPy state
+        mesa_synthesis_seed = None
+    else:
+        mesa_synthesis_seed = params.mesa_synthesis_seed
+
+    if 'mesa_synthesis_processes' not in params.__dict__ or params.mesa_synthesis_processes is None:
+        # simulate in this process
+        mesa_synthesis_processes = None
+    else:
+        if not isinstance(params.mesa_synthesis_processes, int) or params.mesa_synthesis_processes < 1:
+            raise ValueError("mesa_synthesis_processes must be a positive integer")
+        else:
+            mesa_synthesis_processes = params.mesa_synthesis_processes
+
     return {
         "mean": mean, 
         "std_dev": std_dev, 
-        "mesa_synthesis_id": mesa_synthesis_id
+        "mesa_synthesis_id": mesa_synthesis_id,
+        "mesa_synthesis_seed": mesa_synthesis_seed,
+        "mesa_synthesis_processes": mesa_synthesis_processes
     }
\ No newline at end of file
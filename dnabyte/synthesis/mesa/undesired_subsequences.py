@@ -1,4 +1,4 @@
-import regex as re
+from .motif_scanner import motif_scanner
 
 undesired_ssequences = [
     {
@@ -352,6 +352,18 @@ undesired_ssequences = [
 ]
 
 
+def default_subsequences():
+    """
+    The enabled default undesired subsequences.
+
+    :return: Dictionary mapping every subsequence to [error probability, description].
+    """
+    dict_of_subsequences = {}
+    for useq in undesired_ssequences:
+        dict_of_subsequences[useq['sequence']] = [float(useq['error_prob']) / 100.0, useq['description']]
+    return dict_of_subsequences
+
+
 def undesired_subsequences(sequence, dict_of_subsequences=None):
     """
     Checks the sequence for undesired subsequences. If no subsequences are passed, default sequences are used.
@@ -359,20 +371,30 @@ def undesired_subsequences(sequence, dict_of_subsequences=None):
     :param dict_of_subsequences:
     :return:
     """
+    return undesired_subsequences_batch([sequence], dict_of_subsequences)[0]
+
+
+def undesired_subsequences_batch(sequences, dict_of_subsequences=None):
+    """
+    Checks a batch of sequences for undesired subsequences in one pass (see MotifScanner).
+
+    Like an overlapped search for the alternation of all subsequences, at most one match is
+    reported per start position: the subsequence that comes first in dict_of_subsequences.
+
+    :param sequences: List of DNA sequences.
+    :param dict_of_subsequences: Dictionary mapping subsequences to [error probability, description].
+    :return: List with the list of matches of every sequence.
+    """
     if dict_of_subsequences is None:
-        dict_of_subsequences = {}
-        for useq in undesired_ssequences:
-            dict_of_subsequences[useq['sequence']] = [float(useq['error_prob']) / 100.0, useq['description']]
-    res = []
-    # for undesired_sequence, error_prob in list_of_subsequences:
-    regextext = "|".join(dict_of_subsequences.keys())
-    i = 0
-    for m in re.finditer(regextext, sequence, overlapped=True):
-        res.append({'startpos': m.start(), 'endpos': m.start() + len(m.group(0)) - 1,
-                    'errorprob': dict_of_subsequences[m.group(0)][0],
-                    'identifier': "subsequences_" + str(i),
-                    'undesired_sequence': m.group(0),
-                    'description': dict_of_subsequences[m.group(0)][1]})
-        i += 1
+        dict_of_subsequences = default_subsequences()
+    scanner = motif_scanner(tuple(dict_of_subsequences))
+    res = [[] for _ in sequences]
+    rows, starts, motifs = scanner.scan(sequences, first_per_start=True)
+    for row, start, motif in zip(rows.tolist(), starts.tolist(), motifs.tolist()):
+        undesired_sequence = scanner.motifs[motif]
+        res[row].append({'startpos': start, 'endpos': start + len(undesired_sequence) - 1,
+                         'errorprob': dict_of_subsequences[undesired_sequence][0],
+                         'identifier': "subsequences_" + str(len(res[row])),
+                         'undesired_sequence': undesired_sequence,
+                         'description': dict_of_subsequences[undesired_sequence][1]})
     return res
-
@@ -1,5 +1,6 @@
 import numpy as np
 from dnabyte.synthesize import SimulateSynthesis
+from dnabyte.data_classes.insilicodna import InSilicoDNA
 
 class NoSynthPoly(SimulateSynthesis):
     def __init__(self, params, logger=None):
@@ -12,18 +13,18 @@ class NoSynthPoly(SimulateSynthesis):
         Simulate synthesis of DNA sequences without any polymerase errors. This method is used for testing purposes.
         
         :param data: A list of DNA sequences.
-        :return: A list of sequenced DNA sequences.
+        :return: An InSilicoDNA object holding every sequence with its copy number.
         """
         
-        sequences_multiples = [seq for seq in data for _ in range(max(1, int(np.random.normal(self.mean, self.std_dev))))]
-        average_copy_number = len(sequences_multiples) / len(data)
+        copy_numbers = np.maximum(1, np.random.normal(self.mean, self.std_dev, size=len(data)).astype(np.int64))
+        average_copy_number = copy_numbers.sum() / len(data)
         info = {
             "average_copy_number": average_copy_number,
             "number_of_synthesis_errors": 0,
             "error_dict": {}
         }
 
-        return sequences_multiples, info
+        return InSilicoDNA(list(data), counts=copy_numbers), info
 
 def attributes(params):
     if 'mean' not in params.__dict__ or params.mean is None:
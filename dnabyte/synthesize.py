@@ -42,7 +42,7 @@ class SimulateSynthesis:
                 synthesis_class = self.synthesis_plugins[self.synthesis_method]
                 plugin = synthesis_class(self.params, logger=self.logger)
                 data, info = plugin.simulate(data.data)
-                obj = InSilicoDNA(data)
+                obj = data if isinstance(data, InSilicoDNA) else InSilicoDNA(data)
                 if hasattr(data, 'file_paths'):
                     obj.file_paths = data.file_paths
                 return obj, info
@@ -99,8 +99,8 @@ class SimulateSynthesis:
             if isinstance(lst, Oligo):
                 print("  " * level + f"Level {level}: {type(lst).__name__} ({lst})")
             elif isinstance(lst, OligoPool):
-                for oligo in lst.pool:
-                    print("  " * level + f"Level {level}: {type(oligo).__name__} ({oligo})")
+                for oligo, count in lst.copies():
+                    print("  " * level + f"Level {level}: {type(oligo).__name__} ({oligo}) x {count}")
                 
     def process_tuple_list(tuple_list):
         def flip_tuple(t):
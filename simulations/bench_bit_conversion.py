@@ -0,0 +1,59 @@
+"""
+Benchmark of the byte/bit conversions in dnabyte.binarization.auxiliary against
+the per-byte format()/int() loops they replace.
+
+Usage:
+    python -m simulations.bench_bit_conversion [size_in_MB]
+
+The loop versions take on the order of a minute per direction for 100 MB. They are
+run on CHUNK_SIZE slices so that the list of per-byte strings does not exhaust memory.
+"""
+import os
+import sys
+import time
+
+from dnabyte.binarization.auxiliary import bytes_to_bitstring, bitstring_to_bytes
+
+CHUNK_SIZE = 2 ** 20
+
+
+def bytes_to_bitstring_loop(data):
+    return ''.join(format(byte, '08b') for byte in data)
+
+
+def bitstring_to_bytes_loop(bitstring):
+    return bytes(int(bitstring[i:i+8], 2) for i in range(0, len(bitstring), 8))
+
+
+def timed(function, argument):
+    start = time.perf_counter()
+    result = function(argument)
+    return result, time.perf_counter() - start
+
+
+def timed_chunks(function, argument, expected, chunk_size):
+    """Run function on consecutive slices of argument and check the results against expected."""
+    elapsed = 0.0
+    ratio = len(expected) / len(argument)
+    for i in range(0, len(argument), chunk_size):
+        result, t = timed(function, argument[i:i + chunk_size])
+        elapsed += t
+        assert result == expected[int(i * ratio):int((i + chunk_size) * ratio)]
+    return elapsed
+
+
+if __name__ == '__main__':
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    data = os.urandom(size_mb * 2 ** 20)
+    print(f"Input: {size_mb} MB")
+
+    bitstring, t_vectorized = timed(bytes_to_bitstring, data)
+    t_loop = timed_chunks(bytes_to_bitstring_loop, data, bitstring, CHUNK_SIZE)
+    print(f"bytes -> bitstring: loop {t_loop:8.2f} s, vectorized {t_vectorized:6.2f} s, "
+          f"speedup {t_loop / t_vectorized:6.1f}x")
+
+    restored, t_vectorized = timed(bitstring_to_bytes, bitstring)
+    assert restored == data
+    t_loop = timed_chunks(bitstring_to_bytes_loop, bitstring, data, 8 * CHUNK_SIZE)
+    print(f"bitstring -> bytes: loop {t_loop:8.2f} s, vectorized {t_vectorized:6.2f} s, "
+          f"speedup {t_loop / t_vectorized:6.1f}x")
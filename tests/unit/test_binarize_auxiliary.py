@@ -0,0 +1,63 @@
+import unittest
+import os
+import numpy as np
+
+from dnabyte.binarization.auxiliary import (
+    bytes_to_bits, bits_to_bytes, bits_to_bitstring, bitstring_to_bits,
+    bytes_to_bitstring, bitstring_to_bytes, bitstrings_to_rows, rows_to_bitstrings
+)
+
+
+class TestBitConversion(unittest.TestCase):
+    """Unit tests for the shared byte/bit conversion helpers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.data = os.urandom(1000) + b'\x00\xff\xb2'
+        self.bitstring = ''.join(format(byte, '08b') for byte in self.data)
+
+    def test_bytes_to_bitstring(self):
+        """Test conversion of bytes to a bitstring against the per-byte reference."""
+        self.assertEqual(bytes_to_bitstring(self.data), self.bitstring)
+        self.assertEqual(bytes_to_bitstring(bytearray(self.data)), self.bitstring)
+        self.assertEqual(bytes_to_bitstring(b''), '')
+
+    def test_bitstring_to_bytes(self):
+        """Test conversion of a bitstring to bytes, including zero padding."""
+        self.assertEqual(bitstring_to_bytes(self.bitstring), self.data)
+        self.assertEqual(bitstring_to_bytes('1011'), b'\xb0')
+        self.assertEqual(bitstring_to_bytes(''), b'')
+
+    def test_bit_arrays(self):
+        """Test conversion between bytes, bit arrays and bitstrings."""
+        bits = bytes_to_bits(self.data)
+
+        self.assertEqual(bits.dtype, np.uint8)
+        self.assertEqual(len(bits), 8 * len(self.data))
+        self.assertEqual(bits_to_bytes(bits), self.data)
+        self.assertEqual(bits_to_bitstring(bits), self.bitstring)
+        self.assertTrue(np.array_equal(bitstring_to_bits(self.bitstring), bits))
+        self.assertEqual(bytes_to_bits(b'\xb2', count=3).tolist(), [1, 0, 1])
+
+    def test_bit_matrix(self):
+        """Test packing of bitstrings of different length into matrix rows."""
+        bitstrings = ['1011', '', '111111111', self.bitstring[:20]]
+        rows, lengths = bitstrings_to_rows(bitstrings)
+
+        self.assertEqual(rows.shape, (4, 3))
+        self.assertEqual(rows[0].tolist(), [0xb0, 0, 0])
+        self.assertEqual(lengths.tolist(), [4, 0, 9, 20])
+        self.assertEqual(rows_to_bitstrings(rows, lengths), bitstrings)
+        self.assertEqual(bitstrings_to_rows([])[0].shape, (0, 0))
+
+    def test_invalid_characters(self):
+        """Test that bitstrings with other characters are rejected."""
+        for bitstring in ('10201', '10a1', '10ä1'):
+            with self.subTest(bitstring=bitstring):
+                with self.assertRaises(ValueError) as context:
+                    bitstring_to_bytes(bitstring)
+                self.assertIn("contains invalid characters", str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -184,5 +184,25 @@ class TestDefaultBinarize(unittest.TestCase):
                 
                 self.assertEqual(original_bytes, restored_bytes)
 
+    def test_binarize_blocks_matches_binarize(self):
+        """Test that the concatenated blocks equal the result of binarize."""
+        data = Data([self.image_file])
+        expected = self.binarizer.binarize(data)
+
+        blocks = list(self.binarizer.binarize_blocks(data, block_size=16))
+
+        self.assertEqual(len(blocks), (expected.size + 15) // 16)
+        self.assertTrue(all(len(block) == 128 for block in blocks[:-1]))
+        self.assertEqual(''.join(block.data for block in blocks), expected.data)
+        self.assertEqual(blocks[0].file_paths, [self.image_file])
+
+    def test_binarize_blocks_unsupported_method(self):
+        """Test that binarize_blocks requires a plugin with iter_blocks."""
+        data = Data([self.text_file])
+        self.binarizer.binarize_plugins = {'default': MagicMock(return_value=object())}
+        with self.assertRaises(ValueError) as context:
+            self.binarizer.binarize_blocks(data)
+        self.assertIn("does not support block-wise binarization", str(context.exception))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -77,6 +77,11 @@ class TestData(unittest.TestCase):
         
         self.assertIn("exceeds maximum size limit", str(context.exception))
         
+        # Streaming data objects are not limited in size
+        data = Data([large_file], streaming=True)
+        self.assertTrue(data.streaming)
+        self.assertEqual(data.file_paths, [large_file])
+
         # Clean up
         os.remove(large_file)
     
@@ -170,5 +170,63 @@ class TestBinaryCode(unittest.TestCase):
         self.assertEqual(len(binary.data), binary.length)
         self.assertEqual(len(binary), binary.length)
 
+    def test_packed_buffer(self):
+        """Test that the bitstream is stored packed, eight bits per byte."""
+        binary = BinaryCode(self.long_bitstream)
+
+        self.assertEqual(len(binary.buffer), len(self.long_bitstream) // 8)
+        self.assertEqual(binary.to_bytes(), int(self.long_bitstream, 2).to_bytes(5, 'big'))
+        self.assertEqual(binary.bitstring, self.long_bitstream)
+
+    def test_initialization_from_bytes(self):
+        """Test initialization from a packed byte buffer with and without bit length."""
+        binary = BinaryCode(b'\xb2\xff')
+        self.assertEqual(binary.data, "1011001011111111")
+        self.assertEqual(len(binary), 16)
+
+        binary_partial = BinaryCode.from_bytes(b'\xb2\xff', length=11)
+        self.assertEqual(binary_partial.data, "10110010111")
+        # Padding bits of the trailing byte are cleared
+        self.assertEqual(binary_partial.to_bytes(), b'\xb2\xe0')
+
+        with self.assertRaises(ValueError):
+            BinaryCode(b'\xb2', length=9)
+        with self.assertRaises(ValueError):
+            BinaryCode(b'')
+
+    def test_getitem_unaligned_slices(self):
+        """Test slices that do not start or end on a byte boundary."""
+        binary = BinaryCode(self.long_bitstream)
+
+        for start, stop in [(0, 40), (3, 11), (7, 9), (13, 37), (30, 100), (-5, None)]:
+            with self.subTest(start=start, stop=stop):
+                self.assertEqual(binary[start:stop], self.long_bitstream[start:stop])
+        self.assertEqual(binary[::3], self.long_bitstream[::3])
+        self.assertEqual(binary[-9], self.long_bitstream[-9])
+
+        with self.assertRaises(IndexError):
+            binary[40]
+
+    def test_compare(self):
+        """Test comparison of BinaryCode objects and bitstrings."""
+        binary = BinaryCode(self.long_bitstream)
+        flipped = list(self.long_bitstream)
+        for i in (0, 9, 39):
+            flipped[i] = '1' if flipped[i] == '0' else '0'
+        flipped = ''.join(flipped)
+
+        self.assertEqual(binary.compare_binary_strings(self.long_bitstream, flipped), [0, 9, 39])
+        self.assertEqual(binary.compare(binary, BinaryCode(self.long_bitstream)), ('SUCCESS', []))
+        self.assertEqual(binary.compare(BinaryCode(flipped), binary), ('ERROR_short', [0, 9, 39]))
+        self.assertEqual(binary.compare(binary, BinaryCode(self.long_bitstream[:13])), ('ERROR_long', []))
+
+    def test_random(self):
+        """Test generation of random BinaryCode objects."""
+        binary = BinaryCode.random(13)
+
+        self.assertEqual(len(binary), 13)
+        self.assertEqual(len(binary.buffer), 2)
+        self.assertTrue(all(bit in '01' for bit in binary.data))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
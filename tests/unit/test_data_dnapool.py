@@ -0,0 +1,101 @@
+import unittest
+import random
+import numpy as np
+from dnabyte.data_classes.dnapool import DNAPool
+
+class TestDNAPool(unittest.TestCase):
+    """Test cases for the DNAPool class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(0)
+        self.sequences = [''.join(random.choice('ACGT') for _ in range(random.randint(1, 25)))
+                          for _ in range(200)]
+
+    def test_roundtrip(self):
+        """Test that sequences are restored unchanged, also across packing chunks."""
+        for chunk_size in (1, 7, 65536):
+            with self.subTest(chunk_size=chunk_size):
+                pool = DNAPool(self.sequences, chunk_size=chunk_size)
+                self.assertEqual(len(pool), len(self.sequences))
+                self.assertEqual(pool.as_strings(), self.sequences)
+                self.assertEqual(list(pool), self.sequences)
+
+    def test_packed_size(self):
+        """Test that four nucleotides are stored per byte."""
+        pool = DNAPool(self.sequences)
+        total_length = sum(len(seq) for seq in self.sequences)
+
+        self.assertEqual(pool.total_length, total_length)
+        self.assertEqual(len(pool.codes), (total_length + 3) // 4)
+        self.assertEqual(pool.lengths.tolist(), [len(seq) for seq in self.sequences])
+
+    def test_random_access(self):
+        """Test indexing of single sequences."""
+        pool = DNAPool(self.sequences)
+
+        self.assertEqual(pool[0], self.sequences[0])
+        self.assertEqual(pool[137], self.sequences[137])
+        self.assertEqual(pool[-1], self.sequences[-1])
+        with self.assertRaises(IndexError):
+            pool[len(self.sequences)]
+
+    def test_zero_copy_slicing(self):
+        """Test that contiguous slices share the packed buffer."""
+        pool = DNAPool(self.sequences)
+        view = pool[50:120]
+
+        self.assertIs(view.codes, pool.codes)
+        self.assertTrue(np.shares_memory(view.offsets, pool.offsets))
+        self.assertEqual(view.as_strings(), self.sequences[50:120])
+        self.assertEqual(view[10:20].as_strings(), self.sequences[60:70])
+        self.assertEqual(view[3], self.sequences[53])
+        self.assertEqual(pool[10:10].as_strings(), [])
+
+    def test_reverse_complement(self):
+        """Test reverse complementing of all sequences, also of a view."""
+        pool = DNAPool(self.sequences)
+        expected = [seq[::-1].translate(str.maketrans('ACGT', 'TGCA')) for seq in self.sequences]
+
+        self.assertEqual(pool.reverse_complement().as_strings(), expected)
+        self.assertEqual(pool[17:90].reverse_complement().as_strings(), expected[17:90])
+        self.assertEqual(pool[5:5].reverse_complement().as_strings(), [])
+
+    def test_take(self):
+        """Test gathering of arbitrary sequences and stepped slices."""
+        pool = DNAPool(self.sequences)
+        indices = [199, 3, 3, 42]
+
+        self.assertEqual(pool.take(indices).as_strings(), [self.sequences[i] for i in indices])
+        self.assertEqual(pool[::7].as_strings(), self.sequences[::7])
+
+    def test_nucleotide_counts(self):
+        """Test nucleotide counting on the packed buffer."""
+        pool = DNAPool(["AACG", "TTTA", "G"])
+
+        self.assertEqual(pool.get_nucleotide_counts(), {'A': 3, 'C': 1, 'G': 2, 'T': 3})
+        self.assertEqual(pool[1:].get_nucleotide_counts(), {'A': 1, 'C': 0, 'G': 1, 'T': 3})
+
+    def test_invalid_input(self):
+        """Test that invalid sequences are rejected with their index."""
+        with self.assertRaises(ValueError) as context:
+            DNAPool(["ACGT", "ACGT", "ACNT"])
+        self.assertIn("DNA sequence at index 2 contains invalid nucleotides", str(context.exception))
+        self.assertIn("{'N'}", str(context.exception))
+
+        with self.assertRaises(TypeError):
+            DNAPool(["ACGT", 5])
+
+    def test_from_arrays(self):
+        """Test construction from a packed buffer and offsets."""
+        pool = DNAPool(self.sequences)
+        copy = DNAPool.from_arrays(pool.codes, pool.offsets)
+        self.assertEqual(copy.as_strings(), self.sequences)
+
+        with self.assertRaises(ValueError):
+            DNAPool.from_arrays(pool.codes, [0, 5, 3])
+        with self.assertRaises(ValueError):
+            DNAPool.from_arrays(pool.codes[:1], [0, 5])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
 import unittest
-from dnabyte.data_classes.insilicodna import InSilicoDNA
+import numpy as np
+
+from dnabyte.data_classes.insilicodna import InSilicoDNA, error_positions, substitute_bases, random_state
+from dnabyte.data_classes.dnapool import DNAPool
 
 class TestInSilicoDNA(unittest.TestCase):
     """Test cases for the InSilicoDNA class."""
@@ -276,5 +279,93 @@ class TestInSilicoDNA(unittest.TestCase):
         dna_long = InSilicoDNA(long_sequence)
         self.assertEqual(dna_long.total_length, 1000)
 
+    def test_initialization_from_pool(self):
+        """Test that a pool-backed object stays packed until data is accessed."""
+        dna = InSilicoDNA(DNAPool(self.mixed_length_sequences))
+
+        self.assertEqual(dna.num_sequences, 3)
+        self.assertEqual(dna.total_length, 20)
+        self.assertEqual(len(dna), 3)
+        self.assertEqual(dna[1], "GCTAGC")
+        self.assertEqual(dna.get_sequence_lengths(), [2, 6, 12])
+        self.assertEqual(dna.get_nucleotide_counts(), {'A': 6, 'C': 4, 'G': 4, 'T': 6})
+        self.assertIsNotNone(dna.to_pool())
+
+        # Accessing data materializes the list, which can then be modified
+        self.assertEqual(dna.data, self.mixed_length_sequences)
+        dna.add_sequence("ACGT")
+        self.assertEqual(dna.to_pool().as_strings(), self.mixed_length_sequences + ["ACGT"])
+
+    def test_initialization_from_empty_pool(self):
+        """Test that empty pools and empty pooled sequences are rejected."""
+        with self.assertRaises(ValueError):
+            InSilicoDNA(DNAPool([]))
+        with self.assertRaises(ValueError) as context:
+            InSilicoDNA(DNAPool(["ACGT", ""]))
+        self.assertIn("DNA sequence at index 1 cannot be empty", str(context.exception))
+
+    def test_invalid_nucleotide_reports_index(self):
+        """Test that the vectorized validation reports the offending sequence."""
+        with self.assertRaises(ValueError) as context:
+            InSilicoDNA(["ACGT", "ACGT", "ACGU", "ACGX"])
+        self.assertIn("DNA sequence at index 2 contains invalid nucleotides: {'U'}", str(context.exception))
+
+    def test_weighted_pool(self):
+        """Test that a weighted pool behaves like the expanded list of copies."""
+        dna = InSilicoDNA(self.mixed_length_sequences, counts=[3, 1, 2])
+        expanded = ["AT"] * 3 + ["GCTAGC"] + ["TTAATTAACCGG"] * 2
+
+        self.assertTrue(dna.is_weighted)
+        self.assertEqual(dna.num_sequences, 6)
+        self.assertEqual(dna.total_length, 36)
+        self.assertEqual(len(dna), 6)
+        self.assertEqual(dna[3], "GCTAGC")
+        self.assertEqual(list(dna), expanded)
+        self.assertEqual(dna.get_sequence_lengths(), [len(seq) for seq in expanded])
+        self.assertEqual(dna.get_nucleotide_counts(), InSilicoDNA(expanded).get_nucleotide_counts())
+        self.assertEqual(dna.to_pool().as_strings(), expanded)
+        self.assertEqual(dna.sequences, self.mixed_length_sequences)
+
+        # Accessing data expands the copies into an ordinary list
+        self.assertEqual(dna.data, expanded)
+        self.assertFalse(dna.is_weighted)
+        self.assertIsNone(dna.counts)
+
+    def test_collapse(self):
+        """Test merging of identical sequences into copy numbers."""
+        dna = InSilicoDNA(["ACGT", "GG", "ACGT", "ACGT", "GG", "T"]).collapse()
+
+        self.assertEqual(dna.sequences, ["ACGT", "GG", "T"])
+        self.assertEqual(dna.counts.tolist(), [3, 2, 1])
+        self.assertEqual(dna.collapse().counts.tolist(), [3, 2, 1])
+
+    def test_invalid_counts(self):
+        """Test that copy numbers must match the sequences and be positive integers."""
+        for counts in ([1, 2], [1, 0, 2], [1.5, 1, 1]):
+            with self.subTest(counts=counts):
+                with self.assertRaises(ValueError):
+                    InSilicoDNA(self.mixed_length_sequences, counts=counts)
+
+    def test_error_positions(self):
+        """Test the geometric sampler of per-position events."""
+        positions = error_positions(10**6, 0.01, random_state(0))
+
+        self.assertTrue(np.all(np.diff(positions) > 0))
+        self.assertLess(positions[-1], 10**6)
+        self.assertAlmostEqual(len(positions) / 10**6, 0.01, delta=0.001)
+        self.assertEqual(len(error_positions(100, 0.0)), 0)
+        self.assertEqual(error_positions(5, 1.0).tolist(), [0, 1, 2, 3, 4])
+
+    def test_substitute_bases(self):
+        """Test that substitutions keep the read lengths and, optionally, always change the base."""
+        sequences, n_errors = substitute_bases(self.mixed_length_sequences * 100, 1.0, random_state(1),
+                                               allow_same=False)
+
+        self.assertEqual(n_errors, 2000)
+        for original, sequence in zip(self.mixed_length_sequences * 100, sequences):
+            self.assertEqual(len(original), len(sequence))
+            self.assertTrue(all(a != b for a, b in zip(original, sequence)))
+        self.assertEqual(substitute_bases(self.valid_sequences, 0.0), (self.valid_sequences, 0))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,113 @@
+import unittest
+import random
+
+import numpy as np
+
+from dnabyte.encoding.auxiliary import (
+    create_counter_list, create_counter_matrix, DNATranscoder,
+    barcode_indices, demultiplex, repair_copies, sort_lists_by_first_n_entries_synth
+)
+
+
+class TestDNATranscoder(unittest.TestCase):
+    """Test cases for the batch DNA transcoder."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(0)
+        self.transcoder = DNATranscoder('AGCT')
+        self.mapping = {'00': 'A', '01': 'G', '10': 'C', '11': 'T'}
+        self.bitstrings = [''.join(random.choice('01') for _ in range(2 * random.randint(0, 30)))
+                           for _ in range(100)]
+
+    def reference(self, bitstring):
+        return ''.join(self.mapping[bitstring[i:i+2]] for i in range(0, len(bitstring), 2))
+
+    def test_roundtrip(self):
+        """Test translation of bitstrings of varying length to DNA and back."""
+        dna = self.transcoder.bits_to_dna(self.bitstrings)
+
+        self.assertEqual(dna, [self.reference(bitstring) for bitstring in self.bitstrings])
+        self.assertEqual(self.transcoder.dna_to_bits(dna), self.bitstrings)
+
+    def test_symbols(self):
+        """Test translation between DNA and 2-bit symbols."""
+        symbols, lengths = self.transcoder.dna_to_symbols(['AGCT', 'TTA'])
+
+        self.assertEqual(symbols.tolist(), [0, 1, 2, 3, 3, 3, 0])
+        self.assertEqual(lengths, [4, 3])
+        self.assertEqual(self.transcoder.symbols_to_dna(symbols, lengths), ['AGCT', 'TTA'])
+        self.assertEqual(self.transcoder.symbols_to_dna([[3, 2], [1, 0]]), ['TC', 'GA'])
+
+    def test_barcodes(self):
+        """Test that the barcodes equal the translated base 4 counters."""
+        barcodes = self.transcoder.barcodes(300, 5)
+
+        for i in (0, 1, 17, 299):
+            bits = ''.join(format(digit, '02b') for digit in create_counter_list(5, 4, i))
+            self.assertEqual(barcodes[i], self.reference(bits))
+
+    def test_counter_matrix(self):
+        """Test the vectorized counter against create_counter_list, including overflow."""
+        indices = [0, 1, 7, 63, 64, 1000]
+        for n, m in [(3, 4), (12, 2), (1, 10)]:
+            with self.subTest(n=n, m=m):
+                self.assertEqual(create_counter_matrix(n, m, indices).tolist(),
+                                 [create_counter_list(n, m, i) for i in indices])
+
+    def test_invalid_input(self):
+        """Test that invalid bases and odd bitstrings are rejected."""
+        with self.assertRaises(ValueError):
+            self.transcoder.dna_to_bits(['AGCT', 'AGNT'])
+        with self.assertRaises(ValueError):
+            self.transcoder.bits_to_dna(['101'])
+        with self.assertRaises(ValueError):
+            DNATranscoder('AGCA')
+
+
+class TestDemultiplex(unittest.TestCase):
+    """Test cases for barcode decoding and demultiplexing."""
+
+    def test_barcode_indices(self):
+        """Test decoding of digit rows, also for barcodes that do not fit into an int64."""
+        digits = np.array([create_counter_list(6, 4, i) for i in (0, 5, 4095, 77)])
+        self.assertEqual(barcode_indices(digits, 4).tolist(), [0, 5, 4095, 77])
+
+        long_digits = np.zeros((3, 40), dtype=np.int64)
+        long_digits[0, 0] = 3
+        long_digits[2, -1] = 1
+        self.assertEqual(barcode_indices(long_digits, 4).tolist(), [2, 0, 1])
+
+    def test_matches_sort_based_grouping(self):
+        """Test that the groups equal those of sort_lists_by_first_n_entries_synth."""
+        random.seed(1)
+        indices = [random.randrange(50) for _ in range(2000)] + [7] * 500
+        digits = [create_counter_list(4, 4, i) for i in indices]
+        reads = [digit + [f"read{j}"] for j, digit in enumerate(digits)]
+
+        expected = sort_lists_by_first_n_entries_synth([read[:] for read in reads], 4)
+        barcodes, groups = demultiplex(barcode_indices(np.array(digits), 4))
+
+        self.assertEqual([[reads[i] for i in group] for group in groups], expected)
+        self.assertNotIn(7, barcodes.tolist())
+        self.assertEqual(demultiplex([])[1], [])
+
+    def test_repair_copies(self):
+        """Test that every copy of a read that needs a repair is repaired on its own."""
+        random.seed(2)
+        def repair(sequence):
+            return sequence + random.choice('ACGT')
+
+        sequences, counts = repair_copies(['ACGTA', 'ACG', 'ACGTC'], np.array([3, 4000, 2]), repair,
+                                          lambda sequence: len(sequence) < 4)
+        self.assertEqual(dict(zip(sequences, counts.tolist()))['ACGTA'], 3)
+        self.assertEqual(sorted(sequences[1:]), ['ACGA', 'ACGC', 'ACGG', 'ACGT', 'ACGTC'])
+        self.assertEqual(counts.sum(), 4005)
+        self.assertTrue(all(count > 800 for sequence, count in zip(sequences, counts.tolist()) if len(sequence) == 4))
+
+        self.assertEqual(repair_copies(['ACG'], None, lambda sequence: sequence + 'T', lambda sequence: True),
+                         (['ACGT'], None))
+
+
+if __name__ == '__main__':
+    unittest.main()
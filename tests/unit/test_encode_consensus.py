@@ -0,0 +1,72 @@
+import unittest
+import random
+from collections import Counter
+
+import numpy as np
+
+from dnabyte.encoding.consensus import sequences_to_matrix, consensus, majority_vote, PADDING
+
+
+class TestConsensus(unittest.TestCase):
+    """Test cases for the position-wise consensus engine."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(0)
+        self.reference = ''.join(random.choice('ACGT') for _ in range(120))
+        self.reads = [''.join(base if random.random() > 0.1 else random.choice('ACGT') for base in self.reference)
+                      for _ in range(50)]
+
+    def reference_vote(self, sequences, countable):
+        """Counter based majority vote, as previously implemented in the process modules."""
+        target_length = Counter(len(s) for s in sequences).most_common(1)[0][0]
+        result = []
+        for i in range(target_length):
+            bases = [s[i] for s in sequences if i < len(s) and countable(s[i])]
+            result.append(Counter(bases).most_common(1)[0][0] if bases else 'A')
+        return ''.join(result)
+
+    def test_recovers_reference(self):
+        """Test that the consensus of noisy reads equals the reference."""
+        self.assertEqual(majority_vote(self.reads), self.reference)
+
+    def test_matches_counter_vote(self):
+        """Test agreement with the Counter based vote, including ties, 'N' and ragged reads."""
+        for _ in range(300):
+            reads = []
+            for _ in range(random.randint(2, 6)):
+                read = ''.join(random.choice('ACGTN') for _ in range(random.randint(0, 10)))
+                reads.append(read + random.choice(['', 'X', 'NN']))
+            with self.subTest(reads=reads):
+                self.assertEqual(majority_vote(reads), self.reference_vote(reads, lambda c: c != 'N'))
+                self.assertEqual(majority_vote(reads, ignore=None, alphabet='ACGT'),
+                                 self.reference_vote(reads, lambda c: c in 'ACGT'))
+
+    def test_sequences_to_matrix(self):
+        """Test truncation and padding of reads."""
+        matrix = sequences_to_matrix(['ACGT', 'AC', 'ACGTTT'], 4)
+
+        self.assertEqual(matrix.shape, (3, 4))
+        self.assertEqual(matrix[1, 2:].tolist(), [PADDING, PADDING])
+        self.assertEqual(matrix[2].tobytes(), b'ACGT')
+
+    def test_weights_and_confidence(self):
+        """Test weighted votes and the per-position confidence."""
+        matrix = sequences_to_matrix(['AC', 'GC', 'GT'])
+
+        result, confidence = consensus(matrix, return_confidence=True)
+        self.assertEqual(result, 'GC')
+        np.testing.assert_allclose(confidence, [2 / 3, 2 / 3])
+
+        self.assertEqual(consensus(matrix, weights=[5, 1, 1]), 'AC')
+        self.assertEqual(consensus(matrix, weights=[1, 1, 3]), 'GT')
+
+    def test_ignored_positions(self):
+        """Test that positions without countable bases fall back to the default."""
+        self.assertEqual(majority_vote(['ANC', 'GNC']), 'AAC')
+        self.assertEqual(majority_vote(['ACGT']), 'ACGT')
+        self.assertEqual(majority_vote([]), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -134,6 +134,16 @@ class TestMaxDensityEncodingDecoding(unittest.TestCase):
                     # If decode fails, that's acceptable for these configurations
                     # Note: {config['note']}
 
+    def test_encode_from_blocks(self):
+        """Test that encoding an iterator of blocks equals encoding the full bitstream."""
+        params = self.test_configs[0]['params']
+        binary_code = BinaryCode.random(1237)
+        blocks = (BinaryCode(binary_code[i:i + 96]) for i in range(0, len(binary_code), 96))
+
+        encoded_data, _ = MaxDensity(params, logger=self.logger).encode(binary_code)
+        encoded_blocks, _ = MaxDensity(params, logger=self.logger).encode(blocks)
+
+        self.assertEqual(encoded_blocks, encoded_data)
 
 
 if __name__ == '__main__':
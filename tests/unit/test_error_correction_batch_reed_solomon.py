@@ -0,0 +1,77 @@
+import unittest
+import random
+
+import numpy as np
+from reedsolo import RSCodec, ReedSolomonError
+
+from dnabyte.error_correction.auxiliary import (
+    MakeReedSolomonCodeSynthesis, decode_reedsolomon_synthesis, undoreedsolomonsynthesis
+)
+from dnabyte.error_correction.batch_reed_solomon import BatchReedSolomon, CLEAN, CORRECTED, FAILED
+
+
+class TestBatchReedSolomon(unittest.TestCase):
+    """Test cases for the batch Reed-Solomon codec against reedsolo."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.rng = np.random.default_rng(0)
+
+    def test_encode_matches_reedsolo(self):
+        """Test that the codewords are those of RSCodec, including chunked messages."""
+        for nsym, width in [(4, 20), (10, 300)]:
+            messages = self.rng.integers(0, 256, (50, width), dtype=np.uint8)
+            codewords = BatchReedSolomon(nsym).encode(messages)
+            reference = RSCodec(nsym)
+
+            for message, codeword in zip(messages, codewords):
+                self.assertEqual(codeword.tobytes(), bytes(reference.encode(bytearray(message.tobytes()))))
+
+    def test_decode_status(self):
+        """Test that clean, correctable and uncorrectable codewords are told apart like by RSCodec."""
+        rs = BatchReedSolomon(6)
+        messages = self.rng.integers(0, 256, (300, 30), dtype=np.uint8)
+        received = rs.encode(messages)
+        for row in range(len(received)):
+            for column in self.rng.integers(0, received.shape[1], row % 6):
+                received[row, column] ^= self.rng.integers(1, 256)
+
+        decoded, status, corrected = rs.decode(received)
+
+        reference = RSCodec(6)
+        for row in range(len(received)):
+            try:
+                expected, _, errata = reference.decode(bytearray(received[row].tobytes()))
+            except ReedSolomonError:
+                self.assertEqual(status[row], FAILED)
+                continue
+            self.assertEqual(decoded[row].tobytes(), bytes(expected))
+            self.assertEqual(corrected[row], len(errata))
+            self.assertEqual(status[row], CORRECTED if len(errata) else CLEAN)
+        self.assertTrue(np.all(status[::6] == CLEAN))
+        self.assertTrue(np.all(status[1::6] == CORRECTED))
+        self.assertTrue(np.any(status == FAILED))
+
+    def test_synthesis_bitstrings(self):
+        """Test the round trip of codeword bitstrings with a failed codeword."""
+        random.seed(0)
+        data = [''.join(random.choice('01') for _ in range(64)) for _ in range(20)]
+        encoded = MakeReedSolomonCodeSynthesis(data, 32)
+        self.assertTrue(all(len(codeword) == 96 for codeword in encoded))
+
+        received = list(encoded)
+        received[3] = ''.join('1' if bit == '0' else '0' for bit in received[3][:40]) + received[3][40:]
+        received[5] = received[5][:-1]
+        received[7] = received[7][:10] + ('1' if received[7][10] == '0' else '0') + received[7][11:]
+
+        decoded, status = decode_reedsolomon_synthesis(received, 32)
+
+        self.assertEqual(status[[0, 3, 5, 7]].tolist(), [CLEAN, FAILED, FAILED, CORRECTED])
+        self.assertEqual(decoded[7], data[7])
+        self.assertEqual(decoded[5], received[5][:-32])
+        self.assertEqual(undoreedsolomonsynthesis(received, 32), (decoded, False))
+        self.assertEqual(undoreedsolomonsynthesis(encoded, 32), (data, True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from dnabyte.error_correction import codec_registry
+from dnabyte.error_correction.reed_solomon.rsKaya import RScoderKaya
+
+
+class TestCodecRegistry(unittest.TestCase):
+    """Test cases for the process-wide cache of Reed-Solomon fields and generator polynomials."""
+
+    def setUp(self):
+        """Use an empty on-disk cache."""
+        self.test_dir = tempfile.mkdtemp()
+        codec_registry.set_cache_dir(self.test_dir)
+        codec_registry.clear_cache()
+
+    def tearDown(self):
+        codec_registry.set_cache_dir(None)
+        codec_registry.clear_cache()
+        shutil.rmtree(self.test_dir)
+
+    def test_generator_polynomials(self):
+        """Test the polynomials built by a new process and read from the on-disk cache."""
+        # The field is built in a subprocess, galois fields keep this process from exiting after
+        # the fork pools of the sequencing and synthesis tests
+        environment = dict(os.environ, **{codec_registry.CACHE_DIR_VARIABLE: self.test_dir})
+        subprocess.run([sys.executable, '-c', 'from dnabyte.error_correction.codec_registry import '
+                        'generator_polynomials; generator_polynomials(2, 4, 15, 11)'],
+                       env=environment, check=True)
+        self.assertEqual(os.listdir(self.test_dir), ['reed_solomon_2_4_15_11.json'])
+
+        # g(x) = (x - α)(x - α^2)(x - α^3)(x - α^4) of RS(15, 11) over GF(16), α = 2
+        polynomials = codec_registry.generator_polynomials(2, 4, 15, 11)
+        self.assertEqual(polynomials[0], (1, 13, 12, 8, 7))
+        self.assertEqual(len(polynomials[1]), 12)
+        self.assertIs(codec_registry.generator_polynomials(2, 4, 15, 11), polynomials)
+        with self.assertRaises(ValueError):
+            codec_registry.reed_solomon_codec(2, 4, 14, 11)
+
+    def test_table_generator_polynomials(self):
+        """Test that RScoderKaya instances share their generator polynomials."""
+        coder = RScoderKaya(40, 20)
+        self.assertIs(RScoderKaya(40, 20).g, coder.g)
+        self.assertEqual(len(coder.g), 21)
+        self.assertFalse(coder.g.flags.writeable)
+
+
+if __name__ == '__main__':
+    unittest.main()
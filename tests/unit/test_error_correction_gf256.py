@@ -0,0 +1,62 @@
+import unittest
+import random
+
+import numpy as np
+
+from dnabyte.error_correction.reed_solomon.ff import GF256int, MUL, INV, gf_pow
+from dnabyte.error_correction.reed_solomon.polynomial import (
+    Polynomial, poly_add, poly_divmod, poly_eval, poly_mul, poly_strip
+)
+from dnabyte.error_correction.reed_solomon.rs import RSCoder
+from dnabyte.error_correction.reed_solomon.rsKaya import RScoderKaya
+
+
+class TestGF256(unittest.TestCase):
+    """Test cases for the table-driven GF(2^8) arithmetic and the Reed-Solomon coders built on it."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(0)
+
+    def test_tables(self):
+        """Test the product and inverse tables against GF256int."""
+        for a in range(256):
+            self.assertEqual(MUL[a].tolist(), [int(GF256int(a).multiply(b)) for b in range(256)])
+        self.assertTrue(np.all(MUL[np.arange(1, 256), INV[1:]] == 1))
+        self.assertEqual(gf_pow(3, [2, -1]).tolist(), [int(GF256int(3) ** 2), int(GF256int(3).inverse())])
+
+    def test_polynomials(self):
+        """Test multiply, divmod and evaluate against Polynomial."""
+        for _ in range(100):
+            p = [random.randrange(256) for _ in range(random.randrange(1, 10))]
+            q = [random.randrange(1, 256)] + [random.randrange(256) for _ in range(random.randrange(5))]
+            x = random.randrange(256)
+
+            quotient, remainder = poly_divmod(p, q)
+            self.assertEqual(len(remainder), len(q) - 1)
+            self.assertEqual(poly_strip(poly_add(poly_mul(quotient, q), remainder)).tolist(), poly_strip(p).tolist())
+            self.assertEqual(poly_eval(p, [x, 0]).tolist(),
+                             [int(Polynomial([GF256int(c) for c in p]).evaluate(GF256int(y))) for y in (x, 0)])
+
+    def test_coders(self):
+        """Test that both coders produce the same codewords and correct (n - k) // 2 errors."""
+        n, k = 40, 20
+        kaya, coder = RScoderKaya(n, k), RSCoder(n, k)
+        for _ in range(10):
+            message = [random.randrange(1, 256)] + [random.randrange(256) for _ in range(k - 1)]
+            digits = [(byte >> shift) & 3 for byte in message for shift in (6, 4, 2, 0)]
+
+            code = kaya.encode(message)
+            self.assertEqual([ord(x) for x in coder.encode(''.join(map(str, digits)))], code)
+            self.assertTrue(kaya.verify(code))
+
+            received = list(code)
+            for position in random.sample(range(n), (n - k) // 2):
+                received[position] ^= random.randrange(1, 256)
+            self.assertFalse(kaya.verify(received))
+            self.assertEqual(kaya.decode(received), digits)
+            self.assertEqual(coder.decode(''.join(map(chr, received)), nostrip=True), ''.join(map(chr, message)))
+
+
+if __name__ == '__main__':
+    unittest.main()
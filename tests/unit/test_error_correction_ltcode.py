@@ -0,0 +1,82 @@
+import unittest
+import random
+
+import numpy as np
+
+from dnabyte.binarization.auxiliary import bitstrings_to_rows, rows_to_bitstrings
+from dnabyte.error_correction.ltcodefixedsize import (
+    encode_lt, decode_lt, peel_lt, split_encoded_symbol, split_binary_string_from_back,
+    remove_zeros_after_last_non_zero, robust_soliton_distribution, alias_table, sample_alias,
+    sample_neighbours, pack_indices, translate_and_join
+)
+
+
+class TestLTCode(unittest.TestCase):
+    """Test cases for the LT encoder and the peeling decoder."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(0)
+        np.random.seed(0)
+        self.inputs = [''.join(random.choice('01') for _ in range(40)) for _ in range(200)]
+
+    def test_symbols_xor_inputs(self):
+        """Test that every encoded symbol is the XOR of the inputs listed in its index part."""
+        encoded = encode_lt(self.inputs, 300, 64, 16)
+
+        for symbol in encoded[:50]:
+            header, payload, indices = split_encoded_symbol(symbol, 16, 64)
+            chosen = remove_zeros_after_last_non_zero([int(idx, 2) for idx in split_binary_string_from_back(indices, 8)])
+            expected = 0
+            for idx in chosen:
+                expected ^= int(self.inputs[idx], 2)
+            self.assertEqual(int(header, 2), 200)
+            self.assertEqual(payload, format(expected, '040b'))
+
+    def test_roundtrip(self):
+        """Test decoding of a shuffled subset of the encoded symbols."""
+        encoded = encode_lt(self.inputs, 1000, 64, 16)
+        random.shuffle(encoded)
+
+        decoded, valid = decode_lt(encoded[:800], 64, 16)
+        self.assertTrue(valid)
+        self.assertEqual(decoded, self.inputs)
+        with self.assertRaises(ValueError):
+            decode_lt(encoded[:50], 64, 16)
+
+    def test_sampling(self):
+        """Test the seeded degrees and neighbours and their packed index parts."""
+        self.assertEqual(encode_lt(self.inputs, 100, 64, 16, seed=1), encode_lt(self.inputs, 100, 64, 16, seed=1))
+
+        rng = np.random.default_rng(0)
+        p = robust_soliton_distribution(200, max_degree=8)[:8]
+        degrees = sample_alias(rng, *alias_table(p), 100000) + 1
+        np.testing.assert_allclose(np.bincount(degrees, minlength=9)[1:] / 100000, p, atol=0.01)
+
+        # degrees up to the number of inputs need the fallback to permutations
+        for ninput, bits, length in [(200, 8, 64), (3, 2, 6)]:
+            degrees = rng.integers(1, min(length // bits, ninput) + 1, size=200)
+            indices = sample_neighbours(rng, degrees, ninput)
+            for row, degree, header in zip(indices.tolist(), degrees.tolist(), pack_indices(indices, ninput, bits, length)):
+                chosen = sorted(row[:degree], reverse=True)
+                self.assertEqual(len(set(chosen)), degree)
+                self.assertEqual(header, translate_and_join(chosen, bits).zfill(length))
+
+    def test_inactivation(self):
+        """Test that sources without a degree-1 symbol are solved by Gaussian elimination."""
+        sources = ['0110', '1100', '1010']
+        neighbours = [[0, 1], [1, 2], [0, 1, 2], [2, 0]]
+        payloads = [format(int(sources[a], 2) ^ int(sources[b], 2) ^ (int(sources[c], 2) if c is not None else 0), '04b')
+                    for a, b, c in [(0, 1, None), (1, 2, None), (0, 1, 2), (2, 0, None)]]
+        symbols, lengths = bitstrings_to_rows(payloads)
+
+        values, value_lengths, resolved = peel_lt(neighbours, symbols, lengths, 3)
+        self.assertTrue(resolved.all())
+        self.assertEqual(rows_to_bitstrings(values, value_lengths), sources)
+
+        _, _, resolved = peel_lt(neighbours[:2], symbols[:2], lengths[:2], 3)
+        self.assertFalse(resolved.any())
+
+
+if __name__ == '__main__':
+    unittest.main()
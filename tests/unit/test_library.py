@@ -0,0 +1,74 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from dnabyte.library import Library, motif_symbol
+from dnabyte.nucleotides import reverse_complement
+from dnabyte.oligo import back_translate_nested_list_real, inverse_translation
+from dnabyte.oligopool import OligoPool
+from dnabyte.oligo import Oligo
+
+
+class TestLibrary(unittest.TestCase):
+    """Test cases for the motif tables of a linear assembly library."""
+
+    def setUp(self):
+        """Write a library with 40 left and 40 right motifs."""
+        random.seed(0)
+        self.test_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.test_dir, 'library.csv')
+        motifs = set()
+        while len(motifs) < 80:
+            motif = ''.join(random.choice('ACGT') for _ in range(10))
+            if reverse_complement(motif) not in motifs | {motif}:
+                motifs.add(motif)
+        motifs = sorted(motifs)
+        self.left, self.right = motifs[:40], motifs[40:]
+        with open(self.filename, 'w') as f:
+            for left, right in zip(self.left * 2, self.right + self.right[::-1]):
+                f.write(left + right + '\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_motif_symbols(self):
+        """Test that the symbols stay unique past 26 motifs."""
+        library = Library(structure='linear_assembly', filename=self.filename)
+
+        self.assertEqual(library.leftmotives, self.left)
+        self.assertEqual(library.rightmotives, self.right)
+        self.assertEqual(library.translationlibleft[self.left[0]], 'a')
+        self.assertEqual(library.translationlibleft[reverse_complement(self.left[27])], 'b1*')
+        self.assertEqual(library.translationlibright[self.right[39]], 'N1')
+        self.assertEqual(len(set(library.translationlibleft.values()) | set(library.translationlibright.values())), 160)
+        self.assertEqual(library.dictmotives['b1*'], 'b1')
+        self.assertEqual([motif_symbol(i, 'a') for i in (0, 25, 26, 52)], ['a', 'z', 'a1', 'a2'])
+
+    def test_motif_index(self):
+        """Test the integer ids of motifs and complements."""
+        library = Library(structure='linear_assembly', filename=self.filename)
+        index = library.index
+
+        self.assertEqual(len(index), 160)
+        self.assertEqual(index.complement_ids[index.complement_ids].tolist(), list(range(160)))
+        self.assertEqual(index.sequences[index.ids['A1']], self.right[26])
+        self.assertEqual(index.complement('A1'), 'A1*')
+        self.assertEqual(inverse_translation(library.translationlibleft)['c1*'], reverse_complement(self.left[28]))
+        self.assertEqual(inverse_translation({'ACG': 'a'}), {'a': 'ACG'})
+        with self.assertRaises(ValueError):
+            index.add_pair('a', 'ACGT')
+
+    def test_back_translation(self):
+        """Test that a hybridised oligo is translated back to its motifs."""
+        library = Library(structure='linear_assembly', filename=self.filename)
+        pool = OligoPool([Oligo(('a1', 'A')), Oligo(('a1*', 'B1'))], mean=1)
+        pool.hybridise(10 ** 6, library)
+
+        self.assertEqual(back_translate_nested_list_real(pool, library.translationlibleft, library.translationlibright),
+                         [[self.right[0] + self.left[26], reverse_complement(self.left[26]) + self.right[27]]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from dnabyte.oligo import Oligo, complement, nucleotide_complement
+from dnabyte.oligo import Oligo, complement, nucleotide_complement, complementmap
+from dnabyte.nucleotides import reverse_complement, reverse_complement_symbols
 
 
 class TestOligo(unittest.TestCase):
@@ -44,6 +45,13 @@ class TestOligo(unittest.TestCase):
         self.assertEqual(complement('a', motif_pair), 'a*')
         self.assertEqual(complement(('b', 'C*'), motif_pair), ('b*', 'C'))
 
+        # TEST D: test the reverse complement of DNA strings and 2-bit symbols
+        self.assertEqual(complementmap('AACGTG'), 'CACGTT')
+        self.assertEqual(reverse_complement('A' * 100 + 'G'), 'C' + 'T' * 100)
+        self.assertEqual(reverse_complement('ANC-G'), 'CGT')
+        self.assertEqual(reverse_complement_symbols([[0, 1, 2], [3, 3, 0]]).tolist(), [[1, 2, 3], [3, 0, 0]])
+        self.assertEqual(reverse_complement_symbols([0, 1, 2, 3, 3], offsets=[0, 2, 5]).tolist(), [2, 3, 0, 0, 1])
+
 
 
 
@@ -2,6 +2,7 @@ import unittest
 from dnabyte.library import Library
 from dnabyte.oligo import Oligo
 from dnabyte.oligopool import OligoPool
+from dnabyte.synthesis.assembly.hybridisation import FenwickTree, HybridisationEngine, sticky_ends
 
 
 class TestOligoPool(unittest.TestCase):
@@ -45,7 +46,8 @@ class TestOligoPool(unittest.TestCase):
         """
         Test the creation and printing of the first tripple of oligos.
         """
-        pool3 = OligoPool([Oligo(('b','B')), Oligo(('b*','A*')), Oligo(('a','B*'))], mean=100, std_dev=2)
+        # equal copy numbers, so that every oligo ends up in a complete triple
+        pool3 = OligoPool([Oligo(('b','B')), Oligo(('b*','A*')), Oligo(('a','B*'))], mean=100, std_dev=0)
         self.assertIsInstance(pool3, OligoPool)
 
         # TODO: How can one compare two OligoPools?
@@ -58,9 +60,16 @@ class TestOligoPool(unittest.TestCase):
         n_after = len(pool3.pool)
         unique_pool = set(pool3.pool)
 
-        self.assertGreaterEqual(len(unique_pool), 11)
+        # all copies of a species share one oligo
+        self.assertEqual(len(unique_pool), len(pool3.species))
+        self.assertEqual(n_after, 100)
         self.assertLessEqual(n_after, n_before)
 
+        # the triple forms in both orientations of its double strand
+        triples = {(('a', 'B*', 'b*', 'A*'), (None, 'B', 'b', None)), ((None, 'b', 'B', None), ('A*', 'b*', 'B*', 'a'))}
+        self.assertLessEqual(set(pool3.counts), triples)
+        self.assertEqual(sum(pool3.counts.values()), 100)
+
     def test_hybridisation_of_nested_OligoPools(self):
         data_motifs = [
         [('b*','A*'), ('b','B'), ('a','B*'), # pool 1
@@ -85,6 +94,73 @@ class TestOligoPool(unittest.TestCase):
 
         data_pools = OligoPool.from_oligo_pools(data_pools_hybridised)
         self.assertIsInstance(data_pools, OligoPool)
+    def test_sticky_ends(self):
+        """
+        Test the sticky ends that the hybridisation engine compares.
+        """
+        self.assertEqual(sticky_ends(Oligo(('a', 'A*'))), (('3', 'a'), ('5', 'A*')))
+        ds = Oligo(((None, 'a', 'A*'), ('D', 'a*', None)))
+        self.assertEqual(sticky_ends(ds), (('5', 'A*'), ('5', 'D')))
+
+    def test_hybridisation_engine(self):
+        """
+        Test that only complementary oligos bind and that rounds without a compatible pair are skipped.
+        """
+        engine = HybridisationEngine([(Oligo(('a', 'B')), 1000), (Oligo(('c', 'D')), 1000)], self.library.dictmotives)
+        self.assertEqual(engine.total_weight, 0)
+        self.assertEqual(engine.run(10 ** 12, lambda a, b: Oligo(None)), 0)
+        self.assertEqual(len(engine), 2000)
+
+        pool = OligoPool([Oligo(('a', 'A*')), Oligo(('a*', 'D')), Oligo(('c', 'C'))], mean=500, std_dev=0)
+        pool.hybridise(10 ** 12, self.library)
+        self.assertEqual(len(pool.pool), 1000)
+        self.assertEqual(sum(oligo.type == 'double_stranded' for oligo in pool.pool), 500)
+
+    def test_fenwick_tree(self):
+        """
+        Test the prefix sum searches of the copy numbers through appends, updates and pops.
+        """
+        tree = FenwickTree([3, 0, 2])
+        tree.append(5)
+        tree.set(1, 1)
+        self.assertEqual([tree.find(target) for target in range(11)], [0, 0, 0, 1, 2, 2, 3, 3, 3, 3, 3])
+        self.assertEqual(tree.pop(), 5)
+        tree.add(0, -3)
+        self.assertEqual(tree.values, [0, 1, 2])
+        self.assertEqual([tree.find(target) for target in (0, 1, 2.5)], [1, 2, 2])
+
+    def test_hybridisation_in_large_pool(self):
+        """
+        Test that a pair of binding oligos among a huge inert species neither fails nor binds too early.
+        """
+        pool = OligoPool([Oligo(('a', 'A*')), Oligo(('a*', 'D'))])
+        pool.add(Oligo(('c', 'C')), 200_000_000)
+        pool.hybridise(1000, self.library)
+        self.assertEqual(pool.size, 200_000_002)
+
+        # the pair binds after about 2 * 10^16 rounds
+        pool.hybridise(10 ** 20, self.library)
+        self.assertEqual(pool.size, 200_000_001)
+        self.assertEqual(pool.counts[('c', 'C')], 200_000_000)
+
+    def test_species_counts(self):
+        """
+        Test that the copies of an oligo are stored once with their copy number.
+        """
+        pool = OligoPool([Oligo(('a', 'A*')), Oligo(('a*', 'D'))], mean=1000, std_dev=0)
+        self.assertEqual(len(pool.species), 2)
+        self.assertEqual(pool.counts, {('a', 'A*'): 1000, ('a*', 'D'): 1000})
+        self.assertEqual(pool.size, 2000)
+        self.assertIs(pool.add(Oligo(('a', 'A*')), 5), pool.species[('a', 'A*')])
+
+        joined = OligoPool.from_oligo_pools([pool, OligoPool([Oligo(('a', 'A*'))], mean=10, std_dev=0)])
+        self.assertEqual(joined.counts[('a', 'A*')], 1015)
+
+        pool.hybridise(10 ** 12, self.library)
+        self.assertEqual(pool.size, 1005)
+        self.assertEqual(pool.counts[('a', 'A*')], 5)
+        self.assertEqual(sum(count for key, count in pool.counts.items() if len(key[0]) == 3), 1000)
+
 
 if __name__ == '__main__':
     unittest.main()
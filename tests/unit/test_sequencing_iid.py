@@ -92,5 +92,39 @@ class TestIIDSequencing(unittest.TestCase):
             self.assertEqual(orig, seq, "Sequences should be identical with 0% error rate")
 
 
+
+    def test_seed_reproducibility(self):
+        """Test that iid_seed makes the simulation reproducible"""
+        params = Params(sequencing_method='iid', iid_error_rate=0.05, iid_seed=7)
+
+        first, first_info = SimulateSequencing(params=params).simulate(self.test_sequences)
+        second, second_info = SimulateSequencing(params=params).simulate(self.test_sequences)
+
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(first_info, second_info)
+
+        # About 1000 * 200 * 0.05 = 10000 errors, a quarter of which keep the base
+        self.assertGreater(first_info['error_counter'], 9000)
+        self.assertLess(first_info['error_counter'], 11000)
+        changed = sum(a != b for orig, seq in zip(self.test_sequences.data, first.data) for a, b in zip(orig, seq))
+        self.assertAlmostEqual(changed / first_info['error_counter'], 0.75, delta=0.03)
+
+    def test_weighted_pool(self):
+        """Test that copy numbers are kept and only hit copies are split off"""
+        params = Params(sequencing_method='iid', iid_error_rate=0.001)
+        simulator = SimulateSequencing(params=params)
+        pool = InSilicoDNA(self.test_sequences.data[:100], counts=[200] * 100)
+
+        sequenced_sequences, info = simulator.simulate(pool)
+
+        self.assertTrue(sequenced_sequences.is_weighted)
+        self.assertEqual(len(sequenced_sequences), 20000)
+        self.assertEqual(sequenced_sequences.counts.sum(), 20000)
+        self.assertLess(len(sequenced_sequences.sequences), 20000)
+
+        # About 200 * 0.001 = 0.2 errors per copy, 4000 in total
+        self.assertGreater(info['error_counter'], 3000)
+        self.assertLess(info['error_counter'], 5000)
+
 if __name__ == '__main__':
     unittest.main()
@@ -84,5 +84,19 @@ class TestIlluminaSequencing(unittest.TestCase):
         self.assertEqual(len(result1.data), len(result2.data))
 
 
+    def test_seed_reproducibility(self):
+        """Test that illumina_seed makes the simulation reproducible"""
+        params = Params(sequencing_method='illumina', illumina_seed=11)
+
+        first, first_info = SimulateSequencing(params=params).simulate(self.test_sequences)
+        second, second_info = SimulateSequencing(params=params).simulate(self.test_sequences)
+
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(first_info, second_info)
+
+        # Expected number of errors: 500 * 200 * (0.005 + 2e-6) ~ 500
+        self.assertGreater(first_info['number_of_sequencing_errors'], 380)
+        self.assertLess(first_info['number_of_sequencing_errors'], 620)
+
 if __name__ == '__main__':
     unittest.main()
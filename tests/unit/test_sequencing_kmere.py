@@ -1,8 +1,18 @@
 import unittest
+import itertools
+import random
+from collections import Counter
+
+import numpy as np
 
 from dnabyte.sequence import SimulateSequencing
 from dnabyte.params import Params
 from dnabyte import InSilicoDNA
+from dnabyte.data_classes.dnapool import encode_nucleotides
+from dnabyte.sequencing.kmere.sequence import (
+    ChannelParameters, CompiledChannelParameters, KMERChannel, ChannelEstimator, Event, SIGMA_DNA,
+    EVENT_ORDER, align_batch
+)
 
 
 class TestKMERSequencing(unittest.TestCase):
@@ -68,5 +78,136 @@ class TestKMERSequencing(unittest.TestCase):
             )
 
 
+class TestKMERChannel(unittest.TestCase):
+    """Test cases for the compiled channel parameters and batch transmission."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(0)
+        self.sequences = [''.join(random.choice('ACGT') for _ in range(random.randint(0, 60)))
+                          for _ in range(500)]
+
+    def test_context_rows_match_get_kmer(self):
+        """Test that the hashed context of every position equals the k-mer of get_kmer."""
+        substitution_probs = {s: {t: 1.0 for t in SIGMA_DNA} for s in SIGMA_DNA}
+        for k in (1, 2, 5):
+            window = 2 * (k // 2) + 1
+            transition_probs = {(kmer, Event.BEG): {Event.TRA: 1.0}
+                                for size in range(1, window + 1)
+                                for kmer in itertools.product(SIGMA_DNA, repeat=size)}
+            params = ChannelParameters(k=k, transition_probs=transition_probs,
+                                       substitution_probs=substitution_probs)
+            compiled, channel = CompiledChannelParameters(params), KMERChannel(params)
+
+            sequences = [s[:12] for s in self.sequences[:100]]
+            lengths = np.array([len(s) for s in sequences])
+            X = np.zeros((len(sequences), 12), dtype=np.uint8)
+            for row, sequence in enumerate(sequences):
+                X[row, :len(sequence)] = encode_nucleotides(sequence)
+            rows = compiled.context_rows(X, lengths)
+
+            for row, sequence in enumerate(sequences):
+                for t in range(len(sequence)):
+                    kmer = channel.get_kmer(list(sequence), t)
+                    self.assertEqual(compiled.contexts[rows[row, t]], compiled.context_hash(kmer))
+
+    def test_batch_matches_transmit_statistics(self):
+        """Test that batch and per-read transmission produce the same event frequencies."""
+        params = ChannelParameters.create_default(k=3, p_ins=0.05, p_del=0.03, p_sub=0.02)
+        channel = KMERChannel(params, seed=1)
+        reference = Counter(event for sequence in self.sequences
+                            for event in channel.transmit(list(sequence))[1])
+        Y, events = KMERChannel(params, seed=1).transmit_batch(self.sequences)
+        counts = Counter(event for read_events in events for event in read_events)
+
+        for event in (Event.INS, Event.DEL, Event.SUB):
+            expected = reference[event]
+            self.assertLess(abs(counts[event] - expected), 5 * np.sqrt(expected))
+        for x, y, read_events in zip(self.sequences, Y, events):
+            self.assertEqual(len(x), len(read_events) - read_events.count(Event.INS))
+            self.assertEqual(len(y), len(read_events) - read_events.count(Event.DEL))
+
+    def test_batch_fallback(self):
+        """Test reads with unknown symbols and windows too large for compiling."""
+        for k, sequences in [(1, ['ACNGT', 'ACGT']), (40, self.sequences[:5])]:
+            params = ChannelParameters.create_default(k=k, p_ins=0.0, p_del=0.0, p_sub=0.0)
+            Y, events = KMERChannel(params, seed=1).transmit_batch(sequences)
+            self.assertEqual(Y, sequences)
+            self.assertEqual(events, [[Event.TRA] * len(s) for s in sequences])
+
+
+class TestChannelEstimator(unittest.TestCase):
+    """Test cases for the alignment based channel estimation."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Transmit random strands through a channel with known rates."""
+        random.seed(0)
+        cls.sequences = [''.join(random.choice('ACGT') for _ in range(100)) for _ in range(3000)]
+        params = ChannelParameters.create_default(k=1, p_ins=0.02, p_del=0.03, p_sub=0.04)
+        cls.reads, _ = KMERChannel(params, seed=1).transmit_batch(cls.sequences)
+
+    @staticmethod
+    def edit_distance(a, b):
+        previous = list(range(len(b) + 1))
+        for i, ca in enumerate(a, 1):
+            current = [i]
+            for j, cb in enumerate(b, 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+            previous = current
+        return previous[-1]
+
+    def test_align_batch(self):
+        """Test that the event traces reproduce the reads at minimal edit distance."""
+        pairs = list(zip(self.sequences[:200], self.reads[:200])) + [('', 'GG'), ('A', ''), ('', '')]
+        lengths = [np.array([len(p[side]) for p in pairs]) for side in (0, 1)]
+        matrices = [np.zeros((len(pairs), 120), dtype=np.uint8) for _ in range(2)]
+        for row, pair in enumerate(pairs):
+            for side in (0, 1):
+                matrices[side][row, :len(pair[side])] = encode_nucleotides(pair[side])
+        events, n_events = align_batch(matrices[0], lengths[0], matrices[1], lengths[1])
+
+        for (x, y), trace in zip(pairs, (events[r, :n_events[r]] for r in range(len(pairs)))):
+            output, t = [], 0
+            for event in (EVENT_ORDER[e] for e in trace):
+                if event == Event.TRA:
+                    output.append(x[t])
+                elif event in (Event.SUB, Event.INS):
+                    self.assertTrue(event == Event.INS or y[len(output)] != x[t])
+                    output.append(y[len(output)])
+                t += event != Event.INS
+            self.assertEqual((t, ''.join(output)), (len(x), y))
+            self.assertEqual(np.count_nonzero(trace != EVENT_ORDER.index(Event.TRA)),
+                             self.edit_distance(x, y))
+
+        # a pair with a large length difference is aligned in its own band
+        X = np.pad(matrices[0], ((0, 1), (0, 0)))
+        Y = np.vstack([np.pad(matrices[1], ((0, 0), (0, 880))), encode_nucleotides('ACGT' * 250)[None]])
+        X[-1, :100] = Y[-1, :100]
+        outlier_events, outlier_n_events = align_batch(X, np.append(lengths[0], 100), Y, np.append(lengths[1], 1000))
+        self.assertEqual(outlier_n_events.tolist(), n_events.tolist() + [1000])
+        for r in range(len(pairs)):
+            self.assertEqual(outlier_events[r, :n_events[r]].tolist(), events[r, :n_events[r]].tolist())
+
+    def test_estimate_from_alignments(self):
+        """Test recovery of the error rates from a stream of pairs, in chunks and in parallel."""
+        estimated = ChannelEstimator.estimate_from_alignments(
+            (pair for pair in zip(self.sequences, self.reads)), k=1, chunk_size=1000)
+
+        for symbol in SIGMA_DNA:
+            probs = estimated.transition_probs[((symbol,), Event.TRA)]
+            self.assertAlmostEqual(probs[Event.DEL], 0.03, delta=0.01)
+            self.assertAlmostEqual(probs[Event.SUB], 0.04, delta=0.01)
+            self.assertAlmostEqual(sum(probs.values()), 1.0)
+            self.assertAlmostEqual(estimated.substitution_probs[symbol][symbol], 0.0)
+
+        parallel = ChannelEstimator.estimate_from_alignments(
+            zip(self.sequences, self.reads), k=1, chunk_size=700, processes=2)
+        self.assertEqual(parallel.transition_probs.keys(), estimated.transition_probs.keys())
+        for context, probs in estimated.transition_probs.items():
+            for event, p in probs.items():
+                self.assertAlmostEqual(parallel.transition_probs[context][event], p)
+
+
 if __name__ == '__main__':
     unittest.main()
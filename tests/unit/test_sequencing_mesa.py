@@ -72,5 +72,18 @@ class TestMESASequencing(unittest.TestCase):
                 mesa_sequencing_id=999  # Invalid ID
             )
 
+    def test_seeded_parallel_matches_serial(self):
+        """Test that a seeded run gives the same reads for any number of processes"""
+        def sequence(seed, processes):
+            params = Params(sequencing_method='mesa', mesa_sequencing_id=38,
+                            mesa_sequencing_seed=seed, mesa_sequencing_processes=processes)
+            sequenced_sequences, info = SimulateSequencing(params=params).simulate(self.test_sequences)
+            return sequenced_sequences.data
+
+        serial = sequence(11, None)
+        self.assertEqual(len(serial), len(self.test_sequences.data))
+        self.assertEqual(sequence(11, 2), serial)
+        self.assertNotEqual(sequence(12, None), serial)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
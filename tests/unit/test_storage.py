@@ -100,6 +100,21 @@ class TestStorage(unittest.TestCase):
         # Verify strand breaks is non-negative
         self.assertGreaterEqual(info['number_of_strand_breaks'], 0)
 
+
+    def test_simulate_storage_weighted_pool(self):
+        """Test that storage of a weighted pool removes copies instead of sequences"""
+        params = Params(storage_conditions='permafrost', years=10)
+        simulator = SimulateStorage(params=params)
+        pool = InSilicoDNA(self.data.data[:10], counts=[1000] * 10)
+
+        stored_sequences, info = simulator.simulate(pool)
+
+        self.assertTrue(stored_sequences.is_weighted)
+        self.assertEqual(stored_sequences.counts.sum() + info['number_of_strand_breaks'], 10000)
+        # A strand of 10000 nt decays with probability 1 - (1 - 5.5E-6)**(10000 * 10) ~ 0.42
+        self.assertGreater(info['number_of_strand_breaks'], 3500)
+        self.assertLess(info['number_of_strand_breaks'], 5000)
+
     # def test_simulate_storage_random(self):
     #     """Test random storage simulation (for testing purposes)"""
         
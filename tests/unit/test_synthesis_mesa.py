@@ -1,7 +1,26 @@
 from dnabyte.synthesize import SimulateSynthesis
 from dnabyte.params import Params
 from dnabyte import NucleobaseCode, InSilicoDNA
+import dnabyte
+from dnabyte.synthesis.mesa.error_engine import ErrorEngine, MODES, method_parameters, mutate_copy, run_sharded
+from dnabyte.synthesis.mesa.error_graph import Graph
+from dnabyte.synthesis.mesa.sequencing_error import SequencingError
+from dnabyte.synthesis.mesa.motif_scanner import MotifScanner
+from dnabyte.synthesis.mesa.sequence_analysis import (
+    concatenate, kmer_hashes, windowed_gc_content_batch, homopolymer_batch, kmer_counting_batch, error_source_results
+)
+from dnabyte.synthesis.mesa.gc_content import overall_gc_content, windowed_gc_content
+from dnabyte.synthesis.mesa.homopolymers import homopolymer
+from dnabyte.synthesis.mesa.kmer import kmer_counting
+from dnabyte.synthesis.mesa.undesired_subsequences import (
+    undesired_subsequences, undesired_subsequences_batch, default_subsequences
+)
 import unittest
+import os
+import random
+from functools import partial
+import numpy as np
+import regex
 
 class TestMESA(unittest.TestCase):
     
@@ -74,5 +93,196 @@ class TestMESA(unittest.TestCase):
                 mesa_synthesis_id=999  # Invalid ID
             )
 
+    def test_seeded_parallel_matches_serial(self):
+        """Test that a seeded run gives the same pool for any number of processes"""
+        def synthesize(seed, processes):
+            params = Params(assembly_structure='synthesis', synthesis_method='mesa', mesa_synthesis_id=5,
+                            mean=100, std_dev=5, mesa_synthesis_seed=seed, mesa_synthesis_processes=processes)
+            synthesized_sequences, info = SimulateSynthesis(params=params).simulate(self.test_sequences)
+            return sorted(zip(synthesized_sequences.sequences, synthesized_sequences.counts.tolist()))
+
+        serial = synthesize(7, 1)
+        self.assertEqual(synthesize(7, 2), serial)
+        self.assertNotEqual(synthesize(8, 1), serial)
+
+        with self.assertRaises(ValueError):
+            Params(assembly_structure='synthesis', synthesis_method='mesa', mesa_synthesis_processes=0)
+
+class TestErrorEngine(unittest.TestCase):
+    """Test the graph-free error engine against SequencingError."""
+
+    def setUp(self):
+        random.seed(0)
+        self.sequences = [''.join(random.choice('ACGT' if i % 2 else 'AAACCCTTTT') for _ in range(120))
+                          for i in range(40)]
+        package_dir = os.path.dirname(os.path.abspath(dnabyte.__file__))
+        self.tables = [(os.path.join(package_dir, 'synthesis', 'mesa', 'syn_table.json'), 5),
+                       (os.path.join(package_dir, 'sequencing', 'mesa', 'seq_table.json'), 36),
+                       (os.path.join(package_dir, 'sequencing', 'mesa', 'seq_table.json'), 38)]
+
+    def test_matches_sequencing_error(self):
+        """Test that both produce the same sequences and leave the same random state."""
+        for file_path, method_id in self.tables:
+            err_rates, err_attributes = method_parameters(file_path, method_id)
+            err_rates = dict(err_rates, raw_rate=0.1)
+            for seed, sequence in enumerate(self.sequences, start=1):
+                with self.subTest(method_id=method_id, seed=seed):
+                    graph = Graph(None, sequence)
+                    reference = SequencingError(sequence, graph, 'sequencing', err_attributes, err_rates, seed=seed)
+                    reference.lit_error_rate_mutations()
+                    expected, expected_state = reference.seq.replace(' ', ''), np.random.random()
+
+                    engine = ErrorEngine(sequence, 'sequencing', err_attributes, err_rates, seed=seed)
+                    engine.lit_error_rate_mutations()
+                    self.assertEqual(engine.sequence, expected)
+                    self.assertEqual(np.random.random(), expected_state)
+                    self.assertEqual(engine.number_of_edits, len(graph.graph.nodes) - 1)
+
+    def test_recorded_edits(self):
+        """Test that edits are only recorded on request."""
+        err_rates, err_attributes = method_parameters(*self.tables[1])
+        engine = ErrorEngine(self.sequences[0], 'sequencing', err_attributes, err_rates, seed=1)
+        engine.apply_mutations({'insertion': 2, 'mismatch': 0, 'deletion': 0})
+        self.assertIsNone(engine.edits)
+
+        engine = ErrorEngine(self.sequences[0], 'sequencing', err_attributes, err_rates, seed=1, record=True)
+        engine.apply_mutations({'insertion': 2, 'mismatch': 0, 'deletion': 3})
+        edits = engine.edits
+        self.assertEqual(len(edits), engine.number_of_edits)
+        self.assertEqual(len(engine.sequence), len(self.sequences[0]) + 2 - 3)
+        self.assertEqual([MODES[mode] for mode in edits['mode']], ['insertion'] * 2 + ['deletion'] * 3)
+
+    def test_run_sharded(self):
+        """Test that the per-copy seeds depend on the master seed and the job, not on the processes."""
+        err_rates, err_attributes = method_parameters(*self.tables[2])
+        mutate = partial(mutate_copy, process='sequencing', attributes=err_attributes, error_rates=err_rates)
+        jobs = [(sequence, None) for sequence in self.sequences]
+
+        serial = run_sharded(mutate, jobs, np.random.SeedSequence(3), shard_size=7)
+        self.assertEqual(run_sharded(mutate, jobs, np.random.SeedSequence(3), processes=3, shard_size=7), serial)
+        self.assertNotEqual(serial, self.sequences)
+        self.assertNotEqual(run_sharded(mutate, jobs, np.random.SeedSequence(4), shard_size=7), serial)
+
+
+class TestMotifScanner(unittest.TestCase):
+    """Test the Aho-Corasick motif scanner."""
+
+    def setUp(self):
+        random.seed(0)
+        self.subsequences = default_subsequences()
+        motifs = list(self.subsequences)
+        self.sequences = []
+        for _ in range(300):
+            sequence = ''.join(random.choice('ACGT') for _ in range(random.randint(0, 150)))
+            for _ in range(random.randint(0, 3)):
+                position = random.randint(0, len(sequence))
+                sequence = sequence[:position] + random.choice(motifs) + sequence[position:]
+            self.sequences.append(sequence)
+
+    def reference(self, sequence, subsequences):
+        """Overlapped search for the alternation of all subsequences."""
+        return [(match.start(), match.group(0))
+                for match in regex.finditer("|".join(subsequences), sequence, overlapped=True)]
+
+    def test_matches_overlapped_regex(self):
+        """Test the records against the overlapped regex search, including nested motifs."""
+        nested = {'A': [1.0, 'a'], 'AA': [0.5, 'b'], 'AAT': [0.2, 'c'], 'ATA': [0.3, 'd'], 'TAT': [0.1, 'e']}
+        nested_sequences = [''.join(random.choice('ATN') for _ in range(random.randint(0, 30))) for _ in range(200)]
+        for subsequences, sequences in ((self.subsequences, self.sequences), (nested, nested_sequences)):
+            results = undesired_subsequences_batch(sequences, subsequences)
+            for sequence, res in zip(sequences, results):
+                with self.subTest(sequence=sequence):
+                    self.assertEqual([(r['startpos'], r['undesired_sequence']) for r in res],
+                                     self.reference(sequence, subsequences))
+        self.assertEqual(undesired_subsequences(self.sequences[1]), undesired_subsequences_batch(self.sequences[:2])[1])
+
+    def test_all_occurrences(self):
+        """Test that scan reports every occurrence of every motif."""
+        scanner = MotifScanner(['ACA', 'CA', 'ACAC', 'CA'])
+        rows, starts, motifs = scanner.scan(['ACACA', '', 'TTT', 'CA'])
+
+        found = [(row, start, scanner.motifs[motif]) for row, start, motif in zip(rows, starts, motifs)]
+        self.assertEqual(found, [(0, 0, 'ACA'), (0, 0, 'ACAC'), (0, 1, 'CA'), (0, 2, 'ACA'), (0, 3, 'CA'), (3, 0, 'CA')])
+        self.assertEqual(scanner.screen(['ACACA', '', 'TTT', 'CA']).tolist(), [True, False, False, True])
+        with self.assertRaises(ValueError):
+            MotifScanner(['A', ''])
+
+
+class TestSequenceAnalysis(unittest.TestCase):
+    """Test the batch analyzers against the per-sequence error sources."""
+
+    def setUp(self):
+        random.seed(2)
+        self.sequences = []
+        for _ in range(300):
+            sequence = ''.join(random.choice('ACGT') for _ in range(random.randint(1, 120)))
+            if len(sequence) > 30 and random.random() < 0.5:
+                start = random.randint(0, len(sequence) - 10)
+                sequence += sequence[start:start + random.randint(5, 25)] * 2
+            if random.random() < 0.3:
+                sequence = sequence[:10] + 'AAAAAA' + sequence[10:]
+            self.sequences.append(sequence)
+        self.sequences += [sequence.replace('C', 'N', 1) for sequence in self.sequences[:50]]
+
+    def test_windowed_gc_content(self):
+        for window_size in (1, 7, 15, 200):
+            with self.subTest(window_size=window_size):
+                self.assertEqual(windowed_gc_content_batch(self.sequences, window_size),
+                                 [windowed_gc_content(sequence, window_size) for sequence in self.sequences])
+
+    def test_homopolymer(self):
+        self.assertEqual(homopolymer_batch(self.sequences), [homopolymer(sequence) for sequence in self.sequences])
+        self.assertEqual(homopolymer_batch(['', 'GGG']), [[], [homopolymer('GGG')[0]]])
+
+    def test_kmer_counting(self):
+        """Test hashed and (for 'N' and k > 31) byte-wise k-mers, including the {} of kmer_counting."""
+        for k in (1, 3, 8, 20, 40):
+            for upper_bound in (0, 1, 2):
+                with self.subTest(k=k, upper_bound=upper_bound):
+                    self.assertEqual(kmer_counting_batch(self.sequences, k, upper_bound),
+                                     [kmer_counting(sequence, k, upper_bound) for sequence in self.sequences])
+
+    def test_error_source_results(self):
+        """Test that the results of a simulation request match those of the per-sequence loop of do_all."""
+        def kmer_error(count):
+            return min(count * 0.1, 1.0)
+
+        def gc_error(gc):
+            return abs(gc - 50) / 50
+
+        def homopolymer_error(length):
+            return 0.5 if length > 3 else 0.0
+
+        def expected(sequence, kmer_window, gc_window, kmer_function, gc_function, homopolymer_function):
+            if kmer_window:
+                try:
+                    kmer_res = kmer_counting(sequence, int(kmer_window), error_function=kmer_function)
+                except:
+                    kmer_res = kmer_counting(sequence, error_function=kmer_function)
+            else:
+                kmer_res = kmer_counting(sequence, error_function=kmer_function)
+            if gc_window:
+                try:
+                    gc_res = windowed_gc_content(sequence, int(gc_window), error_function=gc_function)
+                except:
+                    gc_res = overall_gc_content(sequence, error_function=gc_function)
+            else:
+                gc_res = overall_gc_content(sequence, error_function=gc_function)
+            return kmer_res, gc_res, homopolymer(sequence, error_function=homopolymer_function)
+
+        functions = (kmer_error, gc_error, homopolymer_error)
+        for kmer_window, gc_window in [('', ''), (None, None), ('12', '10'), ('abc', '0'), (0, 'x'), ('-3', '500')]:
+            with self.subTest(kmer_window=kmer_window, gc_window=gc_window):
+                results = error_source_results(self.sequences, kmer_window, gc_window, *functions)
+                self.assertEqual(list(zip(*results)),
+                                 [expected(sequence, kmer_window, gc_window, *functions) for sequence in self.sequences])
+
+    def test_kmer_hashes(self):
+        rows, positions, hashes = kmer_hashes(*concatenate(['ACGT', 'TT', 'GTA']), 3)
+        self.assertEqual(rows.tolist(), [0, 0, 2])
+        self.assertEqual(positions.tolist(), [0, 1, 0])
+        self.assertEqual(hashes.tolist(), [0b000110, 0b011011, 0b101100])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file